@@ -25,20 +25,30 @@
 # ----------------------------------------------------------------------------
 """ Manage intercon """
 
+from periphondemand.bin.define import COMPONENTSPATH
+from periphondemand.bin.define import HDLDIR
+from periphondemand.bin.define import VHDLEXT
+
 from periphondemand.bin.utils.display import Display
+from periphondemand.bin.utils.settings import Settings
+from periphondemand.bin.utils import wrappersystem as sy
 
 from periphondemand.bin.core.component import Component
 from periphondemand.bin.core.port import Port
 from periphondemand.bin.core.interface import Interface
+from periphondemand.bin.core.hdl_file import HdlFile
 
 DISPLAY = Display()
+SETTINGS = Settings()
 
 
 class Intercon(Component):
     """ Generate Intercon component """
 
-    def __init__(self, parent, masterinterface):
-        """ Init fonction
+    def __init__(self, parent, masterinterface, generate_code=True):
+        """ Init fonction,
+            if generate_code is False, only xml description is done and
+            HDL code must be written later with write_code(code())
         """
         masterinstancename = masterinterface.parent.instancename
         masterinterfacename = masterinterface.name
@@ -50,12 +60,38 @@ class Intercon(Component):
         masterinstance = self.parent.get_instance(masterinstancename)
         masterinterface = masterinstance.get_interface(masterinterfacename)
 
+        self.masterinterface = masterinterface
         # Write xml description
         self.generate_xml(masterinterface)
         # Write Code for component
+        if generate_code:
+            masterinterface.bus.generate_intercon(self)
+            DISPLAY.msg("Intercon with name : " + self.instancename +
+                        " Done")
+
+    def has_code(self):
+        """ Return True if bus plugin gives intercon HDL code with
+            intercon_code(), else it can only write it itself
+        """
+        return hasattr(self.masterinterface.bus.plugin, "intercon_code")
 
-        masterinterface.bus.generate_intercon(self)
+    def code(self):
+        """ Return HDL code of intercon generated by bus plugin """
+        return "".join(self.masterinterface.bus.plugin.intercon_code(
+            self.masterinterface, self))
 
+    def write_code(self, code):
+        """ Write HDL code given by code() and add it in intercon files
+        """
+        hdlpath = SETTINGS.projectpath + COMPONENTSPATH + "/" + \
+            self.instancename + "/" + HDLDIR
+        if not sy.dir_exist(hdlpath):
+            sy.mkdir(hdlpath)
+        sy.write_fragments(hdlpath + "/" + self.instancename + VHDLEXT,
+                           [code])
+        hdl = HdlFile(self, filename=self.instancename + VHDLEXT,
+                      istop=1, scope="both")
+        self.add_hdl_file(hdl)
         DISPLAY.msg("Intercon with name : " + self.instancename + " Done")
 
     def generate_xml(self, masterinterface):
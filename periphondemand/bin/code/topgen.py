@@ -32,6 +32,7 @@ from periphondemand.bin.define import VHDLEXT
 from periphondemand.bin.utils.display import Display
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils.settings import Settings
+from periphondemand.bin.utils import wrappersystem as sy
 
 import datetime
 
@@ -45,6 +46,22 @@ class TopGen(object):
 
     def __init__(self, project):
         self.project = project
+        self._summaries = None
+
+    def port_summary(self, port):
+        """ return the connections summary of port, summaries of all
+            project ports are computed once on first call
+        """
+        graph = self.project.connection_graph
+        if self._summaries is None:
+            self._summaries = graph.port_summaries()
+        key = (str(port.parent.parent.instancename),
+               str(port.parent.name), str(port.name))
+        summary = self._summaries.get(key)
+        if summary is None or summary.port is not port:
+            summary = graph.summarize(port)
+            self._summaries[key] = summary
+        return summary
 
     @classmethod
     def file_extension(cls):
@@ -74,9 +91,14 @@ class TopGen(object):
         """ return code for Top entity """
         raise NotImplementedError("method must be implemented", 0)
 
+    def architecture_code(self, entityname, portlist, incompleteportslist):
+        """ yield architecture part of the file section by section """
+        raise NotImplementedError("method must be implemented", 0)
+
     def architecture(self, entityname, portlist, incompleteportslist):
         """ construct architecture part of the file """
-        raise NotImplementedError("method must be implemented", 0)
+        return "".join(self.architecture_code(entityname, portlist,
+                                              incompleteportslist))
 
     @classmethod
     def insert_comment(cls, comment):
@@ -175,17 +197,17 @@ class TopGen(object):
                     continue
                 out += ONETAB + self.insert_comment(instancename +
                                                     "-" + interfacename)
-                if port.is_fully_connected():
+                summary = self.port_summary(port)
+                if summary.fully_connected:
                     if (port.direction == "in") or (port.direction == "inout"):
-                        same_connections_ports = \
-                            port.ports_with_same_connection
+                        same_connections_ports = summary.same_connection
                         if same_connections_ports == []:
                             raise PodError(str(port.extended_name) +
                                            " is left unconnected")
                         elif len(same_connections_ports) == 1:
                             signame = ONETAB * 2 + instancename + "_" + \
                                 portname
-                            size = port.connected_msb
+                            size = summary.connected_msb
                             if size < 1:
                                 out += self.add_scalar_sig(signame,
                                                            port.direction)
@@ -201,7 +223,7 @@ class TopGen(object):
                                     same_connections_ports_names[0]:
                                 signame = ONETAB * 2 + instancename + \
                                     "_" + portname
-                                size = port.connected_msb
+                                size = summary.connected_msb
                                 if size < 1:
                                     out += self.add_scalar_sig(signame,
                                                                port.direction)
@@ -213,7 +235,7 @@ class TopGen(object):
                         # signal declaration
                         signame = ONETAB * 2 + instancename + "_" + \
                             portname
-                        size = port.connected_msb
+                        size = summary.connected_msb
                         if size < 1:
                             out += self.add_scalar_sig(signame,
                                                        port.direction)
@@ -336,8 +358,8 @@ class TopGen(object):
         platformname = self.project.platform.instancename
         out = ""
         if len(port.pins) != 0:
-            if port.dest_port is not None and\
-                    (port.dest_port.size == port.size):
+            dest_port = self.port_summary(port).dest_port
+            if dest_port is not None and (dest_port.size == port.size):
                 # If port is completely connected to one
                 # and only one other port
                 connect = port.pins[0].connections[0]
@@ -385,7 +407,7 @@ class TopGen(object):
                             (port.direction == "in"):
                         destname = sorted(
                             [aport.extended_name for aport in
-                             port.ports_with_same_connection]
+                             self.port_summary(port).same_connection]
                             )[0]
                     else:
                         destname = port.extended_name
@@ -419,6 +441,12 @@ class TopGen(object):
     def connect_instance(self, incomplete_external_ports_list):
         """ Connect instances
         """
+        return "".join(
+            self.connect_instance_code(incomplete_external_ports_list))
+
+    def connect_instance_code(self, incomplete_external_ports_list):
+        """ yield instances connections, one fragment per instance
+        """
         out = self.insert_comment_block(ONETAB, "instances connections")
 
         # connect incomplete_external_ports_list
@@ -439,18 +467,20 @@ class TopGen(object):
                             self.connect_inc_signals(basename, basename,
                                                      port.direction, pinnum)
 
+        yield out
+
         # connect all "in" ports pin
         for component in self.project.instances:
             if component.is_platform():
                 continue
-            out += "\n" + ONETAB + self.insert_comment("connect " +
-                                                       component.instancename)
+            out = "\n" + ONETAB + self.insert_comment("connect " +
+                                                      component.instancename)
             for interface in component.interfaces:
                 out += ONETAB * 2 + self.insert_comment(interface.name)
                 for port in interface.ports:
                     if port.direction == "in":
                         out += self.connect_in_port(component, interface, port)
-        return out
+            yield out
 
     def generate(self):
         """ generate code for top component
@@ -469,23 +499,26 @@ class TopGen(object):
                                    " generated before generate top.\n" +
                                    str(error))
 
+        # save file
+        sy.write_fragments(self.project.projectpath + SYNTHESISPATH +
+                           "/top_" + self.project.name + VHDLEXT,
+                           self.generate_code())
+
+    def generate_code(self):
+        """ yield code for top component fragment by fragment, then
+        the whole file is never kept in memory
+        """
+        # connections summaries are computed again for this generation
+        self._summaries = None
         # header
-        out = self.header()
+        yield self.header()
         # entity
         entityname = "top_" + self.project.name
         portlist = self.project.platform.connect_ports
-        out += self.entity(entityname, portlist)
+        yield self.entity(entityname, portlist)
 
         # architecture
         incompleteportslist = self.project.platform.incomplete_ext_ports
-        out += self.architecture(entityname, portlist, incompleteportslist)
-
-        # save file
-        try:
-            top_file = open(self.project.projectpath + SYNTHESISPATH +
-                            "/top_" + self.project.name + VHDLEXT, "w")
-        except IOError as error:
-            raise error
-        top_file.write(out)
-        top_file.close()
-        return out
+        for fragment in self.architecture_code(entityname, portlist,
+                                               incompleteportslist):
+            yield fragment
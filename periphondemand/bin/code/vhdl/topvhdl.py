@@ -210,10 +210,14 @@ class TopVHDL(TopGen):
 
     def declare_instance(self):
         """ Declaring instances """
-        out = self.insert_comment_block(ONETAB, "declare instances")
+        return "".join(self.declare_instance_code())
+
+    def declare_instance_code(self):
+        """ yield instances declaration, one fragment per instance """
+        yield self.insert_comment_block(ONETAB, "declare instances")
         for component in self.project.instances:
             if component.is_platform() is False:
-                out += "\n" + ONETAB + component.instancename + " : "
+                out = "\n" + ONETAB + component.instancename + " : "
                 if self.project.vhdl_version == "vhdl93":
                     out += "entity work."
                 out += component.name + "\n"
@@ -229,25 +233,26 @@ class TopVHDL(TopGen):
                 out += ONETAB + "port map (\n"
                 out += self.instance_port_part(ONETAB * 3, component)
                 out += ONETAB * 3 + ");\n"
-        out += "\n"
-        return out
+                yield out
+        yield "\n"
 
-    def architecture(self, entityname, portlist, incompleteportslist):
-        """ construct architecture part of the file """
-        out = "architecture " + entityname + "_1 of " + entityname + " is\n"
+    def architecture_code(self, entityname, portlist, incompleteportslist):
+        """ yield architecture part of the file section by section """
+        yield "architecture " + entityname + "_1 of " + entityname + " is\n"
         # declare components
-        out += self.declare_components()
+        yield self.declare_components()
         # declare signals
-        out += self.declare_signals(self.project.instances,
-                                    incompleteportslist)
+        yield self.declare_signals(self.project.instances,
+                                   incompleteportslist)
         # begin
-        out += "\nbegin\n"
+        yield "\nbegin\n"
         # Connect forces
-        out += self.connect_forces(portlist)
+        yield self.connect_forces(portlist)
         # declare Instance
-        out += self.declare_instance()
+        for fragment in self.declare_instance_code():
+            yield fragment
         # instance connection
-        out += self.connect_instance(incompleteportslist)
+        for fragment in self.connect_instance_code(incompleteportslist):
+            yield fragment
         # architecture foot
-        out += "\nend architecture " + entityname + "_1;\n"
-        return out
+        yield "\nend architecture " + entityname + "_1;\n"
@@ -31,6 +31,8 @@ import os
 
 from periphondemand.bin.define import XMLEXT
 from periphondemand.bin.define import PODSCRIPTEXT
+from periphondemand.bin.define import PROJECTSTORES
+from periphondemand.bin.define import INSTANCEFILESMODES
 
 from periphondemand.bin.utils import wrappersystem as sy
 from periphondemand.bin.utils.display import Display
@@ -58,6 +60,38 @@ class ProjectCli(BaseCli):
     def __init__(self, parent=None):
         BaseCli.__init__(self, parent)
         self._project = None
+        self._batch = 0
+        self._batch_project = None
+
+    def begin_batch(self):
+        """ When sourcing a script, start one transaction for the project
+            opened, the first time it's seen
+        """
+        if self._batch == 0 or self._project is None or \
+                self._project is self._batch_project:
+            return
+        if self._batch_project is not None:
+            # another project loaded by the script
+            self.commit_batch()
+        self._batch_project = self._project
+        self._project.begin()
+
+    def commit_batch(self):
+        """ Commit transactions of project opened by the script """
+        if self._batch_project is not None:
+            while self._batch_project.in_transaction:
+                self._batch_project.commit()
+
+    def commit_project(self):
+        """ Commit all transactions of the current project """
+        if self._project is not None:
+            while self._project.in_transaction:
+                self._project.commit()
+
+    def postcmd(self, stop, line):
+        """ When sourcing a script, keep project in a transaction """
+        self.begin_batch()
+        return BaseCli.postcmd(self, stop, line)
 
     def do_synthesis(self, arg):
         """\
@@ -132,14 +166,23 @@ Driver generation environment
 
     def do_create(self, line):
         """\
-Usage : create <projectname>
-create new project
+Usage : create <projectname> [xml|sqlite]
+create new project, instances are saved in XML files
+or in a sqlite database
         """
         try:
-            self.checkargs(line, "<projectname>")
+            self.checkargs(line, "<projectname> [xml|sqlite]")
         except PodError as error:
             print(error)
             return
+        args = line.split()
+        store = "xml"
+        if len(args) == 2:
+            store = args[1]
+            if store not in PROJECTSTORES:
+                print(PodError("Unknown store " + store, 0))
+                return
+        line = args[0]
         try:
             sy.check_name(line)
         except PodError as error:
@@ -151,7 +194,8 @@ create new project
             return 0
         else:
             try:
-                self._project = Project(dirname, void=0)
+                self.commit_project()
+                self._project = Project(dirname, void=0, store=store)
             except PodError as error:
                 print(error)
                 return
@@ -175,14 +219,28 @@ create new project
 
     def do_load(self, line):
         """\
-Usage : projectload <projectfilename>.xml
-Load a project
+Usage : projectload <projectfilename>.xml [lazy|snapshot]
+Load a project, with lazy, instances are loaded
+the first time they are used, with snapshot, instances
+are loaded from binary snapshot when it's up to date
         """
         try:
-            self.checkargs(line, "<projectfilename>.xml")
+            self.checkargs(line, "<projectfilename>.xml [lazy|snapshot]")
         except PodError as error:
             print(error)
             return
+        args = line.split()
+        lazy = False
+        snapshot = False
+        if len(args) == 2:
+            if args[1] == "lazy":
+                lazy = True
+            elif args[1] == "snapshot":
+                snapshot = True
+            else:
+                print(PodError("Unknown load option " + args[1], 0))
+                return
+        line = args[0]
         if sy.dir_exist(line):
             head, projectname = os.path.split(line)
             line = os.path.join(head, projectname, projectname + ".xml")
@@ -190,7 +248,8 @@ Load a project
             print(PodError("File doesn't exists"))
             return
         try:
-            self._project = Project(line)
+            self.commit_project()
+            self._project = Project(line, lazy=lazy, snapshot=snapshot)
         except PodError as error:
             print(error)
             return
@@ -289,6 +348,57 @@ Select VHDL version
             return
         print(DISPLAY)
 
+    def complete_setstore(self, text, line, begidx, endidx):
+        """ complete store names """
+        return [store for store in PROJECTSTORES if store.startswith(text)]
+
+    def do_setstore(self, line):
+        """\
+Usage : setstore <xml|sqlite>
+Move project instances in XML files or in a sqlite database
+        """
+        try:
+            self.is_project_open()
+            self.checkargs(line, "<xml|sqlite>")
+        except PodError as error:
+            print(DISPLAY)
+            print(error)
+            return
+        try:
+            self._project.store_type = line
+        except PodError as error:
+            print(DISPLAY)
+            print(error)
+            return
+        print(DISPLAY)
+
+    def complete_setinstancefiles(self, text, line, begidx, endidx):
+        """ complete instance files modes """
+        return [mode for mode in INSTANCEFILESMODES if mode.startswith(text)]
+
+    def do_setinstancefiles(self, line):
+        """\
+Usage : setinstancefiles <copy|link|store>
+Select how library files are put in project for new instances
+and synthesis project : copy (reflink when possible), link
+(hard links on library files) or store (files shared by projects
+in HDL store, synthesis project references them)
+        """
+        try:
+            self.is_project_open()
+            self.checkargs(line, "<copy|link|store>")
+        except PodError as error:
+            print(DISPLAY)
+            print(error)
+            return
+        try:
+            self._project.instance_files = line
+        except PodError as error:
+            print(DISPLAY)
+            print(error)
+            return
+        print(DISPLAY)
+
     def complete_getfpgadevice(self, text, line, begidx, endidx):
         """ TODO """
         pass
@@ -1196,6 +1306,12 @@ Close the project
             print(DISPLAY)
             print(error)
             return
+        try:
+            self.commit_project()
+        except PodError as error:
+            print(DISPLAY)
+            print(error)
+            return
         self._project = None
         print(DISPLAY)
         print("Project closed")
@@ -1237,6 +1353,32 @@ Generate intercon for master given in argument
             return
         print(DISPLAY)
 
+    def do_generateintercons(self, line=None):
+        """\
+Usage : generateintercons [jobs]
+Generate intercons for all masters, HDL code of intercons
+is generated by [jobs] parallel processes (default 1)
+        """
+        try:
+            self.is_project_open()
+            self.checkargs(line, "[jobs]")
+        except PodError as error:
+            print(error)
+            return
+        jobs = 1
+        if line.strip() != "":
+            try:
+                jobs = int(line.strip())
+            except ValueError:
+                print(PodError("jobs must be a number", 0))
+                return
+        try:
+            self._project.generate_intercons(jobs=jobs)
+        except PodError as error:
+            print(error)
+            return
+        print(DISPLAY)
+
     def do_generatetop(self, line):
         """\
 Usage : generatetop
@@ -1375,13 +1517,58 @@ Runs command(s) from a file.
         self.use_rawinput = False
         self.prompt = self.continuation_prompt = ''
         SETTINGS.set_script(1)
-        self.cmdloop()
+        self._batch = self._batch + 1
+        self.begin_batch()
+        try:
+            self.cmdloop()
+        finally:
+            self._batch = self._batch - 1
+            if self._batch == 0:
+                try:
+                    self.commit_batch()
+                except PodError as error:
+                    print(error)
+                self._batch_project = None
         SETTINGS.set_script(0)
         self.stdin.close()
         keepstate.restore()
         self.lastcmd = ''
         return
 
+    def do_begin(self, line):
+        """\
+Usage : begin
+Start a transaction, project modifications are kept in memory
+until commit
+        """
+        try:
+            self.is_project_open()
+        except PodError as error:
+            print(DISPLAY)
+            print(error)
+            return
+        self._project.begin()
+
+    def do_commit(self, line):
+        """\
+Usage : commit
+End a transaction and save project
+        """
+        try:
+            self.is_project_open()
+            if self._project is self._batch_project:
+                # in a script, commit saves project, the script
+                # transaction is not started again
+                while self._project.in_transaction:
+                    self._project.commit()
+            else:
+                self._project.commit()
+        except PodError as error:
+            print(DISPLAY)
+            print(error)
+            return
+        print(DISPLAY)
+
     @classmethod
     def do_version(cls, line):
         """\
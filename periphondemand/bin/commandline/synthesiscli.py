@@ -175,15 +175,25 @@ ise
 
     def do_generatebitstream(self, line):
         """\
-Usage : generatebitstream
-generate the bitstream for fpga configuration
+Usage : generatebitstream [nocache]
+generate the bitstream for fpga configuration, bitstream
+is restored from build cache if synthesis files are unchanged,
+unless nocache is given
         """
-        del line
+        try:
+            self.checkargs(line, "[nocache]")
+        except PodError as error:
+            print(str(error))
+            return
+        if line.strip() not in ["", "nocache"]:
+            print(PodError("Unknown option " + line.strip(), 0))
+            return
         if self._project.synthesis is None:
             print(PodError("Select toolchain before"))
             return
         try:
-            self._project.synthesis.generate_bitstream()
+            self._project.synthesis.build_bitstream(
+                usecache=line.strip() != "nocache")
         except PodError as error:
             print(str(error))
             return
@@ -25,6 +25,8 @@
 # ----------------------------------------------------------------------------
 """ Manage busses """
 
+import importlib
+
 from periphondemand.bin.define import BUSPATH
 
 from periphondemand.bin.utils.wrapperxml import WrapperXml
@@ -34,16 +36,77 @@ from periphondemand.bin.utils.poderror import PodError
 SETTINGS = Settings()
 
 
+class BusRegistry(object):
+    """ Process wide cache of bus definitions, each bus XML file is
+        parsed only once and each intercon plugin imported only once.
+        attributes:
+            _busses  -- dict {busname: (xml tree, {(class, type): name})}
+            _plugins -- dict {busname: intercon generator module}
+    """
+
+    def __init__(self):
+        self._busses = {}
+        self._plugins = {}
+
+    def register_plugin(self, name, module):
+        """ register a module providing
+            generate_intercon(masterinterface, intercon) for bus name, and
+            optionally intercon_code(masterinterface, intercon) yielding
+            the HDL code written by generate_intercon()
+        """
+        self._plugins[name] = module
+
+    def get_plugin(self, name):
+        """ return intercon generator module for bus name,
+            default plugin is periphondemand.busses.<name>.<name>
+        """
+        if name not in self._plugins:
+            try:
+                self._plugins[name] = importlib.import_module(
+                    "periphondemand.busses." + name + "." + name)
+            except ImportError as error:
+                raise PodError("No intercon generator for bus " + name +
+                               " : " + str(error), 0)
+        return self._plugins[name]
+
+    def get_bus(self, name):
+        """ return the parsed tree and the signal names table of bus """
+        if name not in self._busses:
+            busxml = WrapperXml(file=(SETTINGS.path + BUSPATH + "/" +
+                                      name + "/" + name + ".xml"))
+            signames = {}
+            for classnode in busxml.get_nodes("class"):
+                classname = classnode.get_attr_value("type")
+                for signal in classnode.get_nodes("type"):
+                    signames.setdefault(
+                        (classname, signal.get_attr_value("type")),
+                        signal.get_attr_value("name"))
+            self._busses[name] = (busxml.tree, signames)
+        return self._busses[name]
+
+
+BUSREGISTRY = BusRegistry()
+
+
 class Bus(WrapperXml):
     """ Class for bus type
         attributes:
             settings --
+            _signames -- {(class, type): signal name} table of bus
     """
 
     def __init__(self, parent, name):
         self.parent = parent
-        WrapperXml.__init__(self, file=(SETTINGS.path + BUSPATH + "/" +
-                            name + "/" + name + ".xml"))
+        tree, self._signames = BUSREGISTRY.get_bus(name)
+        WrapperXml.__init__(self, etnode=tree)
+
+    def __getstate__(self):
+        """ bus tree is shared by BUSREGISTRY, only its name is pickled """
+        return {"parent": self.parent, "name": self.name}
+
+    def __setstate__(self, state):
+        """ get back bus tree from BUSREGISTRY """
+        self.__init__(state["parent"], state["name"])
 
     @property
     def data_size(self):
@@ -57,21 +120,15 @@ class Bus(WrapperXml):
     def sig_name(self, classname, typename):
         """ return the signal name for a given type
         """
-        for classnode in self.get_nodes("class"):
-            if classnode.get_attr_value("type") == classname:
-                for signal in classnode.get_nodes("type"):
-                    if signal.get_attr_value("type") == typename:
-                        return signal.get_attr_value("name")
-        return None
+        return self._signames.get((classname, typename))
+
+    @property
+    def plugin(self):
+        """ Get intercon generator module of bus """
+        return BUSREGISTRY.get_plugin(self.name)
 
     def generate_intercon(self, intercon):
         """ generate intercon
         """
         masterinterface = self.parent
-        import sys
-        # load module path
-        sys.path.append(SETTINGS.path + BUSPATH + "/" + self.name)
-        plugin = __import__(self.name)
-        sys.path.remove(SETTINGS.path + BUSPATH + "/" + self.name)
-
-        plugin.generate_intercon(masterinterface, intercon)
+        self.plugin.generate_intercon(masterinterface, intercon)
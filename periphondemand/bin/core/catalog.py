@@ -0,0 +1,143 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     catalog.py
+# Purpose:  Persistent index of components libraries
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" Persistent index of components libraries """
+
+import json
+import os
+import time
+
+from periphondemand.bin.define import CATALOGFILE
+from periphondemand.bin.define import POD_CACHE
+from periphondemand.bin.define import XMLEXT
+
+# to be changed each time catalog format changes
+CATALOG_VERSION = 1
+
+# a directory modified less than this delay (in s) ago may still change
+# within the same mtime tick, it's listed but not kept
+RACY_DELAY = 2
+
+
+class Catalog(object):
+    """ Index of libraries directories (components and versions), kept
+        in the user cache directory. A directory is listed again only when
+        its mtime changed, then only libraries modified are rebuilt.
+        attributes:
+            filename     -- catalog file path
+            _dirs        -- {path: [mtime, [directories], [xml files]]}
+            _changed     -- True if catalog must be written
+    """
+
+    def __init__(self, filename=None):
+        if filename is None:
+            filename = POD_CACHE + CATALOGFILE
+        self.filename = os.path.expanduser(filename)
+        self._dirs = None
+        self._changed = False
+
+    def _load(self):
+        """ read catalog file the first time it's needed """
+        if self._dirs is not None:
+            return
+        self._dirs = {}
+        try:
+            with open(self.filename, "r") as afile:
+                catalog = json.load(afile)
+            if catalog.get("version") == CATALOG_VERSION:
+                self._dirs = catalog["dirs"]
+        except (IOError, ValueError, KeyError, AttributeError):
+            # no catalog or a broken one, it will be rebuilt
+            pass
+
+    def _save(self):
+        """ write catalog file if changed, an unwritable cache is
+            ignored
+        """
+        if not self._changed:
+            return
+        self._changed = False
+        # batch jobs may save catalog at the same time
+        tmpfilename = self.filename + "." + str(os.getpid()) + ".tmp"
+        try:
+            if not os.path.isdir(os.path.dirname(self.filename)):
+                os.makedirs(os.path.dirname(self.filename))
+            with open(tmpfilename, "w") as afile:
+                json.dump({"version": CATALOG_VERSION,
+                           "dirs": self._dirs}, afile)
+            os.replace(tmpfilename, self.filename)
+        except (IOError, OSError):
+            try:
+                os.remove(tmpfilename)
+            except OSError:
+                pass
+
+    def _directory(self, path):
+        """ return [mtime, [directories], [xml files]] of path """
+        self._load()
+        path = os.path.abspath(os.path.expanduser(path))
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            if self._dirs.pop(path, None) is not None:
+                self._changed = True
+            return [0, [], []]
+        entry = self._dirs.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry
+        dirs = []
+        xmlfiles = []
+        for name in sorted(os.listdir(path)):
+            # hidden files are ignored, as in wrappersystem.list_dir()
+            if name.startswith("."):
+                continue
+            if os.path.isdir(os.path.join(path, name)):
+                dirs.append(name)
+            elif name.endswith(XMLEXT):
+                xmlfiles.append(name)
+        entry = [mtime, dirs, xmlfiles]
+        if time.time() - mtime / 1e9 > RACY_DELAY:
+            self._dirs[path] = entry
+            self._changed = True
+        return entry
+
+    def _versions(self, componentpath):
+        """ return XML files of component without extension """
+        return [name.split(".")[0]
+                for name in self._directory(componentpath)[2]]
+
+    def list_dir(self, path):
+        """ return directories under path, as wrappersystem.list_dir() """
+        dirs = list(self._directory(path)[1])
+        self._save()
+        return dirs
+
+    def list_versions(self, componentpath):
+        """ return versions of component (its XML files without
+            extension)
+        """
+        versions = self._versions(componentpath)
+        self._save()
+        return versions
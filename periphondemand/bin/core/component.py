@@ -17,10 +17,12 @@
 """ Manage component class """
 
 from periphondemand.bin.define import COMPONENTSPATH
+from periphondemand.bin.define import HDLDIR
 from periphondemand.bin.define import XMLEXT
 
 from periphondemand.bin.utils import wrappersystem as sy
 from periphondemand.bin.utils.wrapperxml import WrapperXml
+from periphondemand.bin.utils.wrapperxml import XMLHEADER
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils.display import Display
@@ -29,6 +31,7 @@ from periphondemand.bin.core.interface import Interface
 from periphondemand.bin.core.hdl_file import HdlFile
 from periphondemand.bin.core.driver_templates import DriverTemplates
 from periphondemand.bin.core.generic import Generic
+from periphondemand.bin.core.hdlstore import HdlStore
 
 SETTINGS = Settings()
 DISPLAY = Display()
@@ -40,6 +43,8 @@ class Component(WrapperXml):
     attributes:
         _interfaceslist -- list of interfaces
         _genericslist   -- list of generics
+        _interfacesdict -- interfaces indexed by name
+        _genericsdict   -- generics indexed by name
 
     """
 
@@ -57,6 +62,8 @@ class Component(WrapperXml):
 
         self._interfaceslist = []
         self._genericslist = []
+        self._interfacesdict = {}
+        self._genericsdict = {}
         self._hdl_fileslist = []
         self._driver_templateslist = []
         self._interruptslist = []
@@ -102,7 +109,8 @@ class Component(WrapperXml):
         # copy and rename directory
         sy.cp_dir(project.library.library_path(libraryname) +
                   "/" + componentname,
-                  self.parent.projectpath + COMPONENTSPATH)
+                  self.parent.projectpath + COMPONENTSPATH,
+                  hardlink=project.instance_files == "link")
         try:
             sy.rename_dir(self.parent.projectpath +
                           COMPONENTSPATH + "/" + componentname,
@@ -118,6 +126,11 @@ class Component(WrapperXml):
                        self.parent.projectpath + COMPONENTSPATH +
                        "/" + instancename + "/" + instancename + XMLEXT)
 
+        # share HDL files with other projects
+        if project.instance_files == "store":
+            HdlStore().import_dir(self.parent.projectpath + COMPONENTSPATH +
+                                  "/" + instancename + "/" + HDLDIR)
+
         # load component
         self.load(instancename)
         # Connect platform connection
@@ -126,19 +139,34 @@ class Component(WrapperXml):
     def load(self, instancename):
         """ Load an instance from project directory
         """
-        # load xml file
-        WrapperXml.__init__(self, file=self.parent.projectpath +
-                            COMPONENTSPATH + "/" + instancename +
-                            "/" + instancename + XMLEXT)
+        store = self.parent.store
+        xml = None
+        if store is not None:
+            xml = store.read_instance(instancename)
+        if xml is not None:
+            WrapperXml.__init__(self, nodestring=xml.replace(XMLHEADER, ""))
+            self.set_clean()
+        else:
+            # load xml file
+            WrapperXml.__init__(self, file=self.parent.projectpath +
+                                COMPONENTSPATH + "/" + instancename +
+                                "/" + instancename + XMLEXT)
+            if store is not None:
+                # new instance, moved in store on next save
+                self.set_dirty()
 
         # Fill objects list
         if self.get_node("interfaces") is not None:
             for element in self.get_subnodes("interfaces", "interface"):
-                self._interfaceslist.append(Interface(self, node=element))
+                interface = Interface(self, node=element)
+                self._interfaceslist.append(interface)
+                self._interfacesdict[interface.name] = interface
 
         if self.get_node("generics") is not None:
             for element in self.get_subnodes("generics", "generic"):
-                self._genericslist.append(Generic(self, node=element))
+                generic = Generic(self, node=element)
+                self._genericslist.append(generic)
+                self._genericsdict[generic.name] = generic
 
         if self.get_node("hdl_files") is not None:
             for element in self.get_subnodes("hdl_files", "hdl_file"):
@@ -220,18 +248,18 @@ class Component(WrapperXml):
 
     def get_generic(self, genericname):
         """ get a generic """
-        for generic in self.generics:
-            if generic.name == genericname:
-                return generic
-        raise PodError("No generic with name " + genericname, 0)
+        generic = self._genericsdict.get(genericname)
+        if generic is None:
+            raise PodError("No generic with name " + genericname, 0)
+        return generic
 
     def get_interface(self, interfacename):
         """ Get an interface by name """
-        for interface in self._interfaceslist:
-            if interface.name == interfacename:
-                return interface
-        raise PodError("Interface " + str(interfacename) +
-                       " does not exists", 0)
+        interface = self._interfacesdict.get(interfacename)
+        if interface is None:
+            raise PodError("Interface " + str(interfacename) +
+                           " does not exists", 0)
+        return interface
 
     @property
     def master_interfaces(self):
@@ -270,6 +298,7 @@ class Component(WrapperXml):
         """ Add an interface in component """
         interface.parent = self
         self._interfaceslist.append(interface)
+        self._interfacesdict[interface.name] = interface
         self.add_subnode(nodename="interfaces", subnode=interface)
 
     @property
@@ -289,19 +318,37 @@ class Component(WrapperXml):
                 return drivert
         return None
 
+    @property
+    def dirty_parent(self):
+        """ component is saved in its own file """
+        return None
+
     def save(self):
-        """ Save component in project directory files """
+        """ Save component in project directory files or in project store,
+            component is rewritten only if it has been modified
+        """
+        store = self.parent.store
+        filename = self.parent.projectpath + COMPONENTSPATH + "/" +\
+            self.instancename + "/" + self.instancename + ".xml"
+        if not self.is_dirty and (store is not None or
+                                  sy.file_exist(filename)):
+            return
         if not sy.dir_exist(self.parent.projectpath + COMPONENTSPATH +
                             "/" + self.instancename):
             sy.mkdir(self.parent.projectpath + COMPONENTSPATH +
                      "/" + self.instancename)
-        self.save_xml(self.parent.projectpath + COMPONENTSPATH + "/" +
-                      self.instancename + "/" +
-                      self.instancename + ".xml")
+        if store is not None:
+            store.write_instance(self)
+            sy.rm_file(filename)
+            self.set_clean()
+        else:
+            self.save_xml(filename)
 
     def del_instance(self):
         """ suppress component instance """
         if not self.is_platform():
+            if self.parent.store is not None:
+                self.parent.store.del_instance(self.instancename)
             sy.rm_dir(self.parent.projectpath + COMPONENTSPATH +
                       "/" + self.instancename)
 
@@ -312,8 +359,11 @@ class Component(WrapperXml):
 
     @instancename.setter
     def instancename(self, instancename):
-        """ set the name of this instance """
-        return self.set_attr("instance_name", instancename)
+        """ set the name of this instance, project index follows """
+        oldname = self.instancename
+        self.set_attr("instance_name", instancename)
+        if oldname is not None and oldname != instancename:
+            self.parent.reindex_instance(oldname, self)
 
     @classmethod
     def inv_direction(cls, dirname):
@@ -441,7 +491,13 @@ class Component(WrapperXml):
         """Add or modify attribute value for a node """
         generic = self.get_generic(generic_name)
         if attribute_name == "name":
+            if attribute_value != generic.name and \
+                    attribute_value in self._genericsdict:
+                raise PodError("Generic " + str(attribute_value) +
+                               " already exists", 0)
+            del self._genericsdict[generic.name]
             generic.name = attribute_value
+            self._genericsdict[generic.name] = generic
         elif attribute_name == "public":
             generic.set_public(attribute_value)
         elif attribute_name == "value":
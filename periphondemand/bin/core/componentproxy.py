@@ -0,0 +1,84 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     componentproxy.py
+# Purpose:  Stand for a project instance not loaded yet
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" Lazy loaded project instance """
+
+
+class ComponentProxy(object):
+    """ Stand for a project instance whose XML file is not parsed yet.
+        The component is loaded by the project the first time one of its
+        attributes is used, then all accesses are forwarded to it.
+        attributes:
+            _project       -- project owning this instance
+            _instancename  -- instance name as found in project file
+            _component     -- Component loaded, None until first use
+    """
+
+    def __init__(self, project, instancename):
+        self._project = project
+        self._instancename = instancename
+        self._component = None
+
+    @property
+    def is_loaded(self):
+        """ Return True if component XML file has been parsed """
+        return self._component is not None
+
+    @property
+    def component(self):
+        """ Return the component, load it if necessary """
+        if self._component is None:
+            self._project.load_instance(self._instancename)
+        return self._component
+
+    def set_component(self, component):
+        """ Set the component loaded by the project """
+        self._component = component
+
+    @property
+    def instancename(self):
+        """ Return the instance name without loading the component """
+        if self._component is None:
+            return self._instancename
+        return self._component.instancename
+
+    @classmethod
+    def is_platform(cls):
+        """ platform is never lazy loaded """
+        return False
+
+    def save(self):
+        """ Save component, nothing to do if it has never been loaded """
+        if self._component is not None:
+            self._component.save()
+
+    def __getattr__(self, attr):
+        return getattr(self.component, attr)
+
+    def __setattr__(self, attr, value):
+        if attr.startswith("_"):
+            object.__setattr__(self, attr, value)
+        else:
+            setattr(self.component, attr, value)
@@ -0,0 +1,328 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     connectiongraph.py
+# Purpose:  Project wide index of pins connections
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" In memory graph of pins connections """
+
+import sys
+
+from periphondemand.bin.utils.poderror import PodError
+
+from periphondemand.bin.core.componentproxy import ComponentProxy
+
+CONNECTION_KEYS = ("instance_dest", "interface_dest", "port_dest", "pin_dest")
+
+
+class PortSummary(object):
+    """ Connections of one port computed in one walk over its pins.
+        attributes:
+            port             -- port summarized
+            fully_connected  -- same as Port.is_fully_connected()
+            connected_msb    -- same as Port.connected_msb
+            dest_ports       -- same as Port.dest_ports
+            same_connection  -- same as Port.ports_with_same_connection
+    """
+
+    def __init__(self, port, pins_connected):
+        """ pins_connected is the list of (pin, [connected pins]) """
+        self.port = port
+        self.fully_connected = len(pins_connected) == int(port.size)
+        self.connected_msb = -1
+        self.dest_ports = []
+        self.same_connection = []
+        for pin, pin_dest_list in pins_connected:
+            if len(pin_dest_list) == 0:
+                self.fully_connected = False
+                continue
+            if int(pin.num) > self.connected_msb:
+                self.connected_msb = int(pin.num)
+            for pin_dest in pin_dest_list:
+                if pin_dest.parent not in self.dest_ports:
+                    self.dest_ports.append(pin_dest.parent)
+            if pin.num == "0":
+                self.same_connection = pin_dest_list[0].connected_pins
+        self.same_connection = [pin.parent for pin in self.same_connection]
+
+    @property
+    def dest_port(self):
+        """ same as Port.dest_port """
+        if len(self.dest_ports) == 1:
+            return self.dest_ports[0]
+        return None
+
+
+class ConnectionGraph(object):
+    """ Index of all pins connections of a project.
+        XML <connect> nodes stay the persistent format, this graph is
+        built once when project is loaded and kept up to date by Pin
+        each time a connection is added or removed.
+        attributes:
+            project     -- project indexed
+            _instances  -- set of instances names indexed
+            _ids        -- dict {pin key: pin id}
+            _keys       -- list of pin keys indexed by pin id
+            _pins       -- dict {pin id: Pin}
+            _adjacency  -- dict {pin id: [connected pin id]}
+        A pin key is the tuple (instance, interface, port, pin num), each
+        key is stored once and connections are lists of integer ids.
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self._instances = set()
+        self._ids = {}
+        self._keys = []
+        self._pins = {}
+        self._adjacency = {}
+
+    @classmethod
+    def pin_key(cls, pin):
+        """ return the key of pin given """
+        port = pin.parent
+        interface = port.parent
+        return (str(interface.parent.instancename), str(interface.name),
+                str(port.name), str(pin.num))
+
+    @classmethod
+    def connection_key(cls, connection):
+        """ return the key of a connection dictionary """
+        return tuple(str(connection.get(key)) for key in CONNECTION_KEYS)
+
+    def _key_id(self, key):
+        """ return the id of key, a new id is given to an unknown key """
+        keyid = self._ids.get(key)
+        if keyid is None:
+            keyid = len(self._keys)
+            key = tuple(sys.intern(value) for value in key)
+            self._ids[key] = keyid
+            self._keys.append(key)
+        return keyid
+
+    def _pin_id(self, pin):
+        """ return the id of pin, None if pin is not indexed """
+        return self._ids.get(self.pin_key(pin))
+
+    def build(self):
+        """ (re)build the graph from all project instances """
+        self._instances = set()
+        self._ids = {}
+        self._keys = []
+        self._pins = {}
+        self._adjacency = {}
+        for instance in self.project.instances:
+            # lazy instances are indexed by the project when loaded
+            if isinstance(instance, ComponentProxy):
+                continue
+            self.add_instance(instance)
+
+    def add_instance(self, instance):
+        """ index all pins of instance """
+        self._instances.add(instance.instancename)
+        for interface in instance.interfaces:
+            for port in interface.ports:
+                self.add_port(port)
+
+    def add_port(self, port):
+        """ index pins of port and pins covered by its slices, slices pins
+            are not expanded
+        """
+        interface = port.parent
+        if interface.parent.instancename not in self._instances:
+            return
+        for pin in port.pinlist:
+            self.add_pin(pin)
+        for num in port.slice_pin_nums():
+            keyid = self._key_id((str(interface.parent.instancename),
+                                  str(interface.name), str(port.name),
+                                  str(num)))
+            if keyid not in self._pins:
+                self._adjacency[keyid] = [
+                    self._key_id(self.connection_key(connection))
+                    for connection in port.slice_connections(num)]
+
+    def del_instance(self, instancename):
+        """ forget all pins of instance """
+        self._instances.discard(instancename)
+        for keyid in [keyid for keyid in self._adjacency
+                      if self._keys[keyid][0] == instancename]:
+            del self._adjacency[keyid]
+            self._pins.pop(keyid, None)
+
+    def add_pin(self, pin):
+        """ index pin and its connections read from XML,
+            pins of an instance not indexed are ignored
+        """
+        key = self.pin_key(pin)
+        if key[0] not in self._instances:
+            return
+        keyid = self._key_id(key)
+        self._pins[keyid] = pin
+        adjacency = []
+        # elements are read directly to not keep a wrapper per connection
+        for element in pin.tree.findall("connect"):
+            adjacency.append(self._key_id(
+                tuple(str(element.get(attr)) for attr in CONNECTION_KEYS)))
+        for connection in pin.parent.slice_connections(pin.num):
+            adjacency.append(self._key_id(self.connection_key(connection)))
+        self._adjacency[keyid] = adjacency
+
+    def is_indexed(self, pin):
+        """ return True if pin connections are followed by the graph """
+        return self._pin_id(pin) in self._adjacency
+
+    def add_connection(self, pin, connection):
+        """ add connection (dictionary) to pin """
+        keyid = self._pin_id(pin)
+        if keyid in self._adjacency:
+            self._adjacency[keyid].append(
+                self._key_id(self.connection_key(connection)))
+
+    def del_connection(self, pin, connection):
+        """ delete connection (dictionary) from pin """
+        keyid = self._pin_id(pin)
+        dest_id = self._ids.get(self.connection_key(connection))
+        if dest_id in self._adjacency.get(keyid, []):
+            self._adjacency[keyid].remove(dest_id)
+
+    def del_connections(self, pin):
+        """ delete all connections of pin """
+        keyid = self._pin_id(pin)
+        if keyid in self._adjacency:
+            self._adjacency[keyid] = []
+
+    def connection_keys(self, pin):
+        """ return the list of keys of pins connected to pin """
+        return [self._keys[dest_id]
+                for dest_id in self._adjacency.get(self._pin_id(pin), [])]
+
+    def connections(self, pin):
+        """ return pin connections in the same format as Pin.connections """
+        return [dict(zip(CONNECTION_KEYS, dest_key))
+                for dest_key in self.connection_keys(pin)]
+
+    def get_pin(self, key):
+        """ return the Pin object for key, None if not indexed.
+            Instance of pin is loaded if project has been lazy loaded.
+        """
+        pin = self._pins.get(self._ids.get(key))
+        if pin is None and key[0] not in self._instances:
+            try:
+                self.project.load_instance(key[0])
+            except (AttributeError, PodError):
+                return None
+            pin = self._pins.get(self._ids.get(key))
+        if pin is None and self._ids.get(key) in self._adjacency:
+            # pin of a slice not expanded yet
+            try:
+                pin = self.project.get_instance(key[0]).get_interface(
+                    key[1]).get_port(key[2]).get_pin(key[3])
+            except PodError:
+                return None
+        return pin
+
+    def neighbours(self, pin):
+        """ return the list of pins connected to pin """
+        pinlist = []
+        for dest_key in self.connection_keys(pin):
+            pin_dest = self.get_pin(dest_key)
+            if pin_dest is not None:
+                pinlist.append(pin_dest)
+        return pinlist
+
+    def _exists(self, key):
+        """ return True if pin key is a pin of the project, instances not
+            loaded are only checked by name
+        """
+        try:
+            instance = self.project.get_instance(key[0])
+        except PodError:
+            return False
+        if key[0] not in self._instances:
+            return True
+        try:
+            port = instance.get_interface(key[1]).get_port(key[2])
+            return 0 <= int(key[3]) < int(port.size)
+        except (PodError, ValueError):
+            return False
+
+    def check(self):
+        """ raise PodError if a connection points to an instance,
+            interface, port or pin which doesn't exist
+        """
+        exists = {}
+        for keyid, adjacency in self._adjacency.items():
+            for dest_id in adjacency:
+                if dest_id not in exists:
+                    exists[dest_id] = self._exists(self._keys[dest_id])
+                if not exists[dest_id]:
+                    raise PodError("Pin " + ".".join(self._keys[keyid]) +
+                                   " is connected to " +
+                                   ".".join(self._keys[dest_id]) +
+                                   " which doesn't exist", 0)
+
+    def summarize(self, port):
+        """ return the PortSummary of port """
+        pins_connected = []
+        for pin in port.pins:
+            if self.is_indexed(pin):
+                pins_connected.append((pin, self.neighbours(pin)))
+            else:
+                pins_connected.append((pin, pin.connected_pins))
+        return PortSummary(port, pins_connected)
+
+    def port_summaries(self):
+        """ return the dict {(instance, interface, port): PortSummary}
+            of all ports of the project, computed in one pass
+        """
+        summaries = {}
+        for instance in self.project.instances:
+            for interface in instance.interfaces:
+                for port in interface.ports:
+                    summaries[(str(instance.instancename),
+                               str(interface.name),
+                               str(port.name))] = self.summarize(port)
+        return summaries
+
+    def _direction(self, pin):
+        """ return the pin direction seen from the FPGA fabric, platform
+            ports are seen from outside then direction is inverted
+        """
+        instance = pin.parent.parent.parent
+        if instance.is_platform():
+            return instance.inv_direction(pin.parent.direction)
+        return pin.parent.direction
+
+    def fan_out(self, pin):
+        """ return the list of pins driven by pin """
+        if self._direction(pin) not in ("out", "inout"):
+            return []
+        return [pin_dest for pin_dest in self.neighbours(pin)
+                if self._direction(pin_dest) in ("in", "inout")]
+
+    def fan_in(self, pin):
+        """ return the list of pins driving pin """
+        if self._direction(pin) not in ("in", "inout"):
+            return []
+        return [pin_src for pin_src in self.neighbours(pin)
+                if self._direction(pin_src) in ("out", "inout")]
@@ -0,0 +1,106 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     hdlstore.py
+# Purpose:  Content addressed store of HDL files shared by projects
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" Content addressed store of HDL files """
+
+import hashlib
+import os
+import stat
+
+from periphondemand.bin.define import HDLSTOREPATH
+from periphondemand.bin.define import POD_CACHE
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils import wrappersystem as sy
+
+
+class HdlStore(object):
+    """ HDL files stored once by content hash in the user cache directory,
+        as <root>/<2 first hash digits>/<hash>/<filename> : file name is
+        kept for toolchains. Stored files are read only and never
+        modified, then projects can reference them safely.
+        attributes:
+            root  -- store directory
+    """
+
+    def __init__(self, root=None):
+        if root is None:
+            root = POD_CACHE + HDLSTOREPATH
+        self.root = os.path.expanduser(root)
+
+    @classmethod
+    def digest(cls, filepath):
+        """ return content hash of file """
+        sha = hashlib.sha256()
+        with open(filepath, "rb") as afile:
+            for block in iter(lambda: afile.read(1 << 16), b""):
+                sha.update(block)
+        return sha.hexdigest()
+
+    def path(self, digest, filename):
+        """ return path of file stored with digest """
+        return os.path.join(self.root, digest[:2], digest,
+                            os.path.basename(filename))
+
+    def add(self, filepath):
+        """ store file, return its digest """
+        try:
+            digest = self.digest(filepath)
+            storedpath = self.path(digest, filepath)
+            if os.path.exists(storedpath):
+                return digest
+            dirname = os.path.dirname(storedpath)
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+            # concurrent projects may store the same file, content is
+            # the same then the last rename wins
+            tmppath = storedpath + "." + str(os.getpid()) + ".tmp"
+            sy.clone_file(filepath, tmppath)
+            os.chmod(tmppath, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmppath, storedpath)
+        except (IOError, OSError) as error:
+            raise PodError("Can't store " + filepath + " : " + str(error), 0)
+        return digest
+
+    def import_file(self, filepath):
+        """ store file and replace it by a reflink on stored file (a copy
+            if filesystem doesn't support it), return its digest.
+            Project file stays writable : it's never a hard link on the
+            read only stored file.
+        """
+        digest = self.add(filepath)
+        try:
+            sy.clone_file(self.path(digest, filepath), filepath)
+            os.chmod(filepath, stat.S_IMODE(os.stat(filepath).st_mode) |
+                     stat.S_IWUSR)
+        except (IOError, OSError) as error:
+            raise PodError("Can't clone " + filepath + " : " + str(error), 0)
+        return digest
+
+    def import_dir(self, dirpath):
+        """ import all files under dirpath """
+        for root, _, files in os.walk(dirpath):
+            for afile in files:
+                self.import_file(os.path.join(root, afile))
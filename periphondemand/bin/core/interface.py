@@ -60,6 +60,9 @@ class Interface(WrapperXml):
 
         self._registerslist = []
         self.portslist = []
+        self._registersdict = {}
+        self._portsdict = {}
+        self._portsbytype = {}
         self._slaveslist = []
         self._bus = None
 
@@ -74,11 +77,13 @@ class Interface(WrapperXml):
 
         if self.get_node("registers") is not None:
             for element in self.get_subnodes("registers", "register"):
-                self._registerslist.append(Register(self, node=element))
+                register = Register(self, node=element)
+                self._registerslist.append(register)
+                self._registersdict[register.name] = register
 
         if self.get_node("ports") is not None:
             for node in self.get_subnodes("ports", "port"):
-                self.portslist.append(Port(self, node=node))
+                self._index_port(Port(self, node=node))
 
         # set bus
         if self.bus_name is not None:
@@ -89,6 +94,12 @@ class Interface(WrapperXml):
         """ Get the master bus if exist """
         if self.interface_class != "slave":
             raise PodError("Only slave interface could have a master", 0)
+        if self.interfacemaster is None:
+            # master may be an instance not loaded yet by a lazy project
+            try:
+                self.parent.parent.load_instances()
+            except AttributeError:
+                pass
         if self.interfacemaster is None:
             raise PodError("Interface " + self.name +
                            " is not connected on a master", 0)
@@ -208,23 +219,34 @@ class Interface(WrapperXml):
         """ get the ports list of interface"""
         return self.portslist
 
+    def _index_port(self, port):
+        """ append port in ports list and indexes """
+        self.portslist.append(port)
+        self._portsdict[port.name] = port
+        if port.porttype is not None:
+            self._portsbytype.setdefault(port.porttype, port)
+
     def get_port(self, portname):
         """ Get port by its name """
-        for port in self.portslist:
-            if port.name == portname:
-                return port
-        raise PodError("Port " + portname + " does not exists", 1)
+        port = self._portsdict.get(portname)
+        if port is None:
+            raise PodError("Port " + portname + " does not exists", 1)
+        return port
 
     def add_port(self, port):
         """ Adding a port """
         port.parent = self
-        self.portslist.append(port)
+        self._index_port(port)
         self.add_subnode(nodename="ports", subnode=port)
 
     def get_port_by_type(self, porttypename):
         """ Get port using port type name as argument"""
+        port = self._portsbytype.get(porttypename)
+        if port is not None and port.porttype == porttypename:
+            return port
         for port in self.portslist:
             if port.porttype == porttypename:
+                self._portsbytype[porttypename] = port
                 return port
         raise PodError("No port with type " + str(porttypename), 1)
 
@@ -411,10 +433,10 @@ class Interface(WrapperXml):
 
     def get_register(self, registername):
         """ Get register by name """
-        for register in self.registers:
-            if register.name == registername:
-                return register
-        raise PodError("No register with name " + registername, 0)
+        register = self._registersdict.get(registername)
+        if register is None:
+            raise PodError("No register with name " + registername, 0)
+        return register
 
     @property
     def parent(self):
@@ -29,9 +29,11 @@ from periphondemand.bin.define import LIBRARYPATH
 
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils.settings import Settings
-from periphondemand.bin.utils import wrappersystem as sy
+
+from periphondemand.bin.core.catalog import Catalog
 
 SETTINGS = Settings()
+CATALOG = Catalog()
 
 
 class Library(object):
@@ -45,7 +47,7 @@ class Library(object):
     @property
     def libraries(self):
         """ Return a list of libraries availables """
-        componentlist = sy.list_dir(SETTINGS.path + LIBRARYPATH)
+        componentlist = self.official_libraries()
         componentlist.extend(self.personnal_libraries())
         componentlist.extend(self.get_component_lib_name())
         return componentlist
@@ -53,7 +55,7 @@ class Library(object):
     @classmethod
     def official_libraries(cls):
         """ Get list of official libraries"""
-        return sy.list_dir(SETTINGS.path + LIBRARYPATH)
+        return CATALOG.list_dir(SETTINGS.path + LIBRARYPATH)
 
     def library_path(self, libraryname=None):
         """ Get the library path """
@@ -74,20 +76,15 @@ class Library(object):
         """
         if libraryname is None:
             libraryname = self.lib_name
-        official_component_type = self.official_libraries()
-        componentlist = []
-        if libraryname in official_component_type:
-            componentlist =\
-                sy.list_dir(SETTINGS.path +
-                            LIBRARYPATH + "/" +
-                            libraryname)
-        elif libraryname in self.personnal_libraries():
-            componentlist =\
-                sy.list_dir(self.get_pers_lib_path(libraryname))
-        elif libraryname in self.get_component_lib_name():
-            componentlist =\
-                sy.list_dir(self.get_component_lib_path(libraryname))
-        return componentlist
+        try:
+            return CATALOG.list_dir(self.library_path(libraryname))
+        except PodError:
+            return []
+
+    def list_versions(self, libraryname, componentname):
+        """ Return the list of versions (XML files) of component """
+        return CATALOG.list_versions(self.library_path(libraryname) +
+                                     "/" + componentname)
 
     def add_library(self, path):
         """ Adding library path """
@@ -104,20 +101,34 @@ class Library(object):
         libpath = self.get_pers_lib_path(libraryname)
         SETTINGS.configfile.del_library(libpath)
 
+    def components_index(self, libraries=None):
+        """ Return {componentname: libraryname} for libraries given
+            (all libraries by default), first library found wins
+        """
+        if libraries is None:
+            libraries = self.libraries
+        index = {}
+        for libraryname in libraries:
+            for component in self.list_components(libraryname):
+                index.setdefault(component, libraryname)
+        return index
+
     def check_lib(self, path):
         """ check if lib and component are not duplicated """
         libname = path.split("/")[-1]
+        libraries = self.libraries
         # check if lib name exist
-        if libname in self.libraries:
+        if libname in libraries:
             raise PodError("Library " + libname + " already exist", 0)
         # check if components under library are new
-        componentlist = sy.list_dir(path)
-        for component in componentlist:
-            for libraryname in self.libraries:
-                if component in self.list_components(libraryname):
-                    raise PodError("Library " + libname +
-                                   " contain a component that exist in '" +
-                                   libraryname + "' : " + component, 0)
+        index = self.components_index(libraries)
+        conflicts = [component + " ('" + index[component] + "')"
+                     for component in CATALOG.list_dir(path)
+                     if component in index]
+        if conflicts:
+            raise PodError("Library " + libname +
+                           " contain components that exist in other " +
+                           "libraries : " + ", ".join(conflicts), 0)
 
     @classmethod
     def get_component_lib_path(cls, name=None):
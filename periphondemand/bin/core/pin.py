@@ -29,15 +29,22 @@ from periphondemand.bin.utils.wrapperxml import WrapperXml
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils.poderror import PodError
 
+from periphondemand.bin.core.connectiongraph import ConnectionGraph
+
 SETTINGS = Settings()
 
 
 class Pin(WrapperXml):
     """ Manage Pin
         attributes:
-
+            parent -- port of this pin
+        Pins are the most numerous objects of a project, they don't have
+        instance dictionary and their connections are kept by the project
+        connection graph.
     """
 
+    __slots__ = ()
+
     def __init__(self, parent, **keys):
         """ init Pin,
             __init__(self,parent,node)
@@ -54,11 +61,32 @@ class Pin(WrapperXml):
         else:
             raise PodError("Keys unknown in Pin", 0)
 
+    def set_dirty(self):
+        """ Mark pin modified, a pin only asked so far is written in XML
+        """
+        attach_pin = getattr(self.parent, "attach_pin", None)
+        if attach_pin is not None:
+            attach_pin(self)
+        WrapperXml.set_dirty(self)
+
     @property
     def project(self):
         """ Return the project object linked to this pin """
         return self.parent.parent.parent.parent
 
+    @property
+    def connection_graph(self):
+        """ Return the project connection graph following this pin,
+            None if pin is not indexed
+        """
+        try:
+            graph = self.project.connection_graph
+        except AttributeError:
+            return None
+        if graph.is_indexed(self):
+            return graph
+        return None
+
     @property
     def connections(self):
         """ return a list of pin connection
@@ -67,6 +95,9 @@ class Pin(WrapperXml):
                     "port_dest":string,
                     "pin_dest":string)
         """
+        graph = self.connection_graph
+        if graph is not None:
+            return graph.connections(self)
         connectionslist = []
         if(self.get_node("connect") is not None):
             for element in self.get_nodes("connect"):
@@ -79,10 +110,12 @@ class Pin(WrapperXml):
                         str(element.get_attr_value("port_dest")),
                      "pin_dest":
                         str(element.get_attr_value("pin_dest"))})
+        connectionslist.extend(self.parent.slice_connections(self.num))
         return connectionslist
 
     def del_connections_forces(self):
         """ Delete all connections in this pin without any check """
+        self.parent.explode_slices()
         for connection in self.connections:
             self.del_node(
                 "connect",
@@ -90,6 +123,9 @@ class Pin(WrapperXml):
                  "interface_dest": connection["interface_dest"],
                  "port_dest": connection["port_dest"],
                  "pin_dest": connection["pin_dest"]})
+        graph = self.connection_graph
+        if graph is not None:
+            graph.del_connections(self)
 
     def del_connections(self):
         """ Delete all connection from or to this pin """
@@ -113,33 +149,48 @@ class Pin(WrapperXml):
 
     def del_connection_force(self, pin_dest):
         """ Delete connection from this pin to pin_dest """
-        self.del_node(
-            "connect",
-            {"instance_dest":
-             pin_dest.parent.parent.parent.instancename,
-             "interface_dest": pin_dest.parent.parent.name,
-             "port_dest": pin_dest.parent.name,
-             "pin_dest": str(pin_dest.num)})
+        self.parent.explode_slices()
+        pin_dest.parent.explode_slices()
+        connection = {"instance_dest":
+                      pin_dest.parent.parent.parent.instancename,
+                      "interface_dest": pin_dest.parent.parent.name,
+                      "port_dest": pin_dest.parent.name,
+                      "pin_dest": str(pin_dest.num)}
+        self.del_node("connect", connection)
+        graph = self.connection_graph
+        if graph is not None:
+            graph.del_connection(self, connection)
 
-        pin_dest.del_node(
-            "connect",
-            {"instance_dest":
-                self.parent.parent.parent.instancename,
-             "interface_dest": self.parent.parent.name,
-             "port_dest": self.parent.name,
-             "pin_dest": str(self.num)})
+        connection = {"instance_dest":
+                      self.parent.parent.parent.instancename,
+                      "interface_dest": self.parent.parent.name,
+                      "port_dest": self.parent.name,
+                      "pin_dest": str(self.num)}
+        pin_dest.del_node("connect", connection)
+        graph = pin_dest.connection_graph
+        if graph is not None:
+            graph.del_connection(pin_dest, connection)
         return True
 
     @property
     def connected_pins(self):
         """ return list of pins connected to this pin """
         pinlist = []
-        for connect in self.connections:
+        graph = self.connection_graph
+        if graph is None:
+            keylist = [ConnectionGraph.connection_key(connect)
+                       for connect in self.connections]
+        else:
+            keylist = graph.connection_keys(self)
+        for key in keylist:
+            if graph is not None:
+                pin = graph.get_pin(key)
+                if pin is not None:
+                    pinlist.append(pin)
+                    continue
             pinlist.append(self.project.get_instance(
-                connect["instance_dest"]).get_interface(
-                    connect["interface_dest"]).get_port(
-                        connect["port_dest"]).get_pin(
-                            connect["pin_dest"]))
+                key[0]).get_interface(key[1]).get_port(
+                    key[2]).get_pin(key[3]))
         return pinlist
 
     def is_connection_exists(self, pin_dest):
@@ -175,6 +226,8 @@ class Pin(WrapperXml):
                            " : Port " + str(pin_dest.parent.name) +
                            " is forced, can't be connected")
 
+        self.parent.explode_slices()
+        pin_dest.parent.explode_slices()
         if self.parent.direction == "in":
             if len(self.connections) != 0:
                 try:
@@ -207,6 +260,7 @@ class Pin(WrapperXml):
                            port_destname, pin_destnum=None):
         """ add pin connection and check direction compatibility
         """
+        self.parent.explode_slices()
         if pin_destnum is not None:
             attributes = {"instance_dest": str(instance_destname),
                           "interface_dest": str(interface_destname),
@@ -217,6 +271,9 @@ class Pin(WrapperXml):
                           "interface_dest": str(interface_destname),
                           "port_dest": str(port_destname)}
         self.add_node(nodename="connect", attributedict=attributes)
+        graph = self.connection_graph
+        if graph is not None:
+            graph.add_connection(self, attributes)
 
     def autoconnect_pin(self):
         """ connect all platform connection, if connection is not
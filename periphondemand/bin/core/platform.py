@@ -53,7 +53,9 @@ class Platform(Component):
 
         if self.get_node("interfaces") is not None:
             for element in self.get_node("interfaces").get_nodes("interface"):
-                self._interfaceslist.append(Interface(self, node=element))
+                interface = Interface(self, node=element)
+                self._interfaceslist.append(interface)
+                self._interfacesdict[interface.name] = interface
         self.librarieslist = []
         if self.get_node("simulation") is not None:
             for library in self.get_node("simulation").get_nodes("simlib"):
@@ -90,6 +92,11 @@ class Platform(Component):
             pass
         return componentslist
 
+    @property
+    def dirty_parent(self):
+        """ platform component is in project file """
+        return self.parent
+
     def save(self):
         """ platform component is in project file
         then, no save
@@ -29,11 +29,22 @@ from periphondemand.bin.utils.wrapperxml import WrapperXml
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.core.pin import Pin
 
+SLICE_KEYS = ("instance_dest", "interface_dest", "port_dest",
+              "msb", "lsb", "msb_dest", "lsb_dest")
+
 
 class Port(WrapperXml):
     """ Manage port
         attributes:
             pinlist -- list of pin
+            _pinsdict -- pins indexed by number
+            _slices -- slice connections as a list of dictionary
+                       (see SLICE_KEYS), a slice connects port[msb:lsb]
+                       on port_dest[msb_dest:lsb_dest] with one XML node
+            _slicepins -- {num: Pin} pins expanded from slices, not
+                          written in XML
+            _readpins -- {num: Pin} pins created by get_pin(), not
+                         written in XML until modified
     """
 
     def __init__(self, parent, **keys):
@@ -53,9 +64,20 @@ class Port(WrapperXml):
             raise PodError("Keys not known in Port ", 0)
 
         self.pinlist = []
+        self._pinsdict = {}
         for element in self.get_nodes("pin"):
             pin = Pin(self, node=element)
             self.pinlist.append(pin)
+            self._pinsdict.setdefault(pin.num, pin)
+        self._slices = []
+        self._slicepins = {}
+        self._readpins = {}
+        self._expanded = True
+        for element in self.get_nodes("slice"):
+            self._slices.append(dict(
+                [(key, str(element.get_attr_value(key)))
+                 for key in SLICE_KEYS]))
+            self._expanded = False
 
     @property
     def extended_name(self):
@@ -68,20 +90,181 @@ class Port(WrapperXml):
     @property
     def pins(self):
         """ return the pins port list """
+        self._expand_slices()
         return self.pinlist
 
+    def _register_pin(self, pin):
+        """ index pin in project connection graph """
+        try:
+            self.parent.parent.parent.connection_graph.add_pin(pin)
+        except AttributeError:
+            pass
+
+    def _register_port(self):
+        """ index pins and slices of port in project connection graph """
+        try:
+            self.parent.parent.parent.connection_graph.add_port(self)
+        except AttributeError:
+            pass
+
+    def _expand_slices(self):
+        """ create pins covered by slices the first time a pin is asked,
+            these pins stay out of XML while slices are not exploded
+        """
+        if self._expanded:
+            return
+        self._expanded = True
+        for num in self.slice_pin_nums():
+            if str(num) in self._pinsdict:
+                continue
+            pin = Pin(self, node=WrapperXml(nodestring='<pin num="' +
+                                            str(num) + '" />'))
+            self.pinlist.append(pin)
+            self._pinsdict[str(num)] = pin
+            self._slicepins[str(num)] = pin
+            self._register_pin(pin)
+
+    @property
+    def slices(self):
+        """ return the list of slice connections """
+        return self._slices
+
+    def slice_pin_nums(self):
+        """ return the list of pins numbers covered by slices """
+        nums = []
+        for aslice in self._slices:
+            for num in range(int(aslice["lsb"]), int(aslice["msb"]) + 1):
+                if num not in nums:
+                    nums.append(num)
+        return nums
+
+    def slice_connections(self, num):
+        """ return connections of pin num given by slices, in the same
+            format as Pin.connections
+        """
+        connectionslist = []
+        for aslice in self._slices:
+            if int(aslice["lsb"]) <= int(num) <= int(aslice["msb"]):
+                connectionslist.append(
+                    {"instance_dest": aslice["instance_dest"],
+                     "interface_dest": aslice["interface_dest"],
+                     "port_dest": aslice["port_dest"],
+                     "pin_dest": str(int(num) - int(aslice["lsb"]) +
+                                     int(aslice["lsb_dest"]))})
+        return connectionslist
+
+    def add_slice(self, port_dest, msb, lsb, msb_dest, lsb_dest):
+        """ connect self[msb:lsb] on port_dest[msb_dest:lsb_dest] with one
+            slice record on each port
+        """
+        if int(msb) - int(lsb) != int(msb_dest) - int(lsb_dest):
+            raise PodError("Slices " + self.name + " and " +
+                           port_dest.name + " have differents size")
+        for port_src, port_dst, bounds in (
+                (self, port_dest, (msb, lsb, msb_dest, lsb_dest)),
+                (port_dest, self, (msb_dest, lsb_dest, msb, lsb))):
+            aslice = {"instance_dest":
+                      str(port_dst.parent.parent.instancename),
+                      "interface_dest": str(port_dst.parent.name),
+                      "port_dest": str(port_dst.name),
+                      "msb": str(bounds[0]), "lsb": str(bounds[1]),
+                      "msb_dest": str(bounds[2]), "lsb_dest": str(bounds[3])}
+            port_src.add_node(nodename="slice", attributedict=aslice)
+            port_src._slices.append(aslice)
+            port_src._expanded = False
+            port_src._register_port()
+
+    def _slice_port(self, aslice):
+        """ return the destination port of slice """
+        return self.parent.parent.parent.get_instance(
+            aslice["instance_dest"]).get_interface(
+                aslice["interface_dest"]).get_port(aslice["port_dest"])
+
+    def _del_slice(self, aslice):
+        """ delete slice record and write its pins in XML """
+        self._expand_slices()
+        self.del_node("slice", aslice)
+        self._slices.remove(aslice)
+        for num in range(int(aslice["lsb"]), int(aslice["msb"]) + 1):
+            pin = self._slicepins.pop(str(num), None)
+            if pin is not None:
+                self.add_node(node=pin)
+
+    def _slice_mirror(self, aslice):
+        """ return the slice record stored by destination port of slice """
+        return {"instance_dest": str(self.parent.parent.instancename),
+                "interface_dest": str(self.parent.name),
+                "port_dest": str(self.name),
+                "msb": aslice["msb_dest"], "lsb": aslice["lsb_dest"],
+                "msb_dest": aslice["msb"], "lsb_dest": aslice["lsb"]}
+
+    def del_slices(self):
+        """ delete all slices of this port and their mirror on
+            destination ports
+        """
+        for aslice in list(self._slices):
+            port_dest = self._slice_port(aslice)
+            mirror = self._slice_mirror(aslice)
+            self._del_slice(aslice)
+            if mirror in port_dest.slices:
+                port_dest._del_slice(mirror)
+            port_dest._register_port()
+        self._register_port()
+
+    def explode_slices(self):
+        """ replace slices of this port, and their mirror on destination
+            ports, by one connection per pin as done before slices
+        """
+        for aslice in list(self._slices):
+            port_dest = self._slice_port(aslice)
+            mirror = self._slice_mirror(aslice)
+            self._del_slice(aslice)
+            if mirror in port_dest.slices:
+                port_dest._del_slice(mirror)
+            for offset in range(int(aslice["msb"]) - int(aslice["lsb"]) + 1):
+                pin = self.get_pin(int(aslice["lsb"]) + offset)
+                pin_dest = port_dest.get_pin(int(aslice["lsb_dest"]) + offset)
+                pin.add_node(nodename="connect",
+                             attributedict={
+                                 "instance_dest": aslice["instance_dest"],
+                                 "interface_dest": aslice["interface_dest"],
+                                 "port_dest": aslice["port_dest"],
+                                 "pin_dest": str(pin_dest.num)})
+                pin_dest.add_node(nodename="connect",
+                                  attributedict={
+                                      "instance_dest":
+                                      mirror["instance_dest"],
+                                      "interface_dest":
+                                      mirror["interface_dest"],
+                                      "port_dest": mirror["port_dest"],
+                                      "pin_dest": str(pin.num)})
+                self._register_pin(pin)
+                port_dest._register_pin(pin_dest)
+
     def get_pin(self, num):
         """ return pin node """
         if int(num) >= self.size:
             raise PodError("Pin number " + str(num) + " not in port size")
-        for pin in self.pins:
-            if pin.num == str(num):
-                return pin
-        pin = Pin(self, num=str(num))
+        self._expand_slices()
+        pin = self._pinsdict.get(str(num))
+        if pin is not None:
+            return pin
+        # a pin asked is not a modification, it's written in XML only
+        # when it's modified
+        pin = Pin(self, node=WrapperXml(nodestring='<pin num="' +
+                                        str(num) + '" />'))
         self.pinlist.append(pin)
-        self.add_node(node=pin)
+        self._pinsdict[str(num)] = pin
+        self._readpins[str(num)] = pin
+        self._register_pin(pin)
         return pin
 
+    def attach_pin(self, pin):
+        """ write in XML a pin created by get_pin() when it's modified """
+        if self._readpins.get(pin.num) is pin:
+            del self._readpins[pin.num]
+            self.add_node(node=pin)
+
     @property
     def porttype(self):
         """ get type of port """
@@ -328,9 +511,28 @@ class Port(WrapperXml):
 
         self.connect_all_pins(port_dest)
 
+    def is_unconnected(self):
+        """ Return True if no pin of port has a connection, without
+            expanding slices
+        """
+        if self._slices != []:
+            return False
+        for pin in self.pinlist:
+            if pin.connections != []:
+                return False
+        return True
+
     def connect_all_pins(self, port_dest):
-        """ Connect all port pin to a destination instance
+        """ Connect all port pin to a destination instance, with one slice
+            record if both ports are not connected yet
         """
+        size = int(self.size)
+        if self.is_unconnected() and port_dest.is_unconnected() and \
+                not self.force_defined() and \
+                not port_dest.force_defined() and \
+                size <= int(port_dest.size):
+            self.add_slice(port_dest, size - 1, 0, size - 1, 0)
+            return
         for pin_num in range(int(self.size)):
             pin_source = self.get_pin(pin_num)
             pin_dest = port_dest.get_pin(pin_num)
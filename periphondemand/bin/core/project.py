@@ -15,8 +15,10 @@
 
 __author__ = "Fabien Marteau <fabien.marteau@armadeus.com>"
 
+import multiprocessing
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from periphondemand.bin.define import XMLEXT
 from periphondemand.bin.define import BINARYPROJECTPATH
 from periphondemand.bin.define import COMPONENTSPATH
@@ -27,6 +29,8 @@ from periphondemand.bin.define import DRIVERSPATH
 from periphondemand.bin.define import TOOLCHAINPATH
 from periphondemand.bin.define import PLATFORMPATH
 from periphondemand.bin.define import ONETAB
+from periphondemand.bin.define import PROJECTSTORES
+from periphondemand.bin.define import INSTANCEFILESMODES
 
 from periphondemand.bin.utils.wrapperxml import WrapperXml
 from periphondemand.bin.utils.settings import Settings
@@ -36,8 +40,12 @@ from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils import wrappersystem as sy
 
 from periphondemand.bin.core.component import Component
+from periphondemand.bin.core.componentproxy import ComponentProxy
 from periphondemand.bin.core.platform import Platform
 from periphondemand.bin.core.library import Library
+from periphondemand.bin.core.connectiongraph import ConnectionGraph
+from periphondemand.bin.core.snapshot import Snapshot
+from periphondemand.bin.core.sqlitestore import SqliteStore
 
 from periphondemand.bin.toolchain.simulation import Simulation
 from periphondemand.bin.toolchain.synthesis import synthesis_factory
@@ -46,6 +54,21 @@ from periphondemand.bin.toolchain.driver import Driver
 SETTINGS = Settings()
 DISPLAY = Display()
 
+# intercons of generate_intercons() worker processes, inherited by fork so
+# that the project they belong to is never pickled
+_INTERCONS = None
+
+
+def _init_intercon_worker(intercons):
+    """ set intercons to generate in a worker process """
+    global _INTERCONS
+    _INTERCONS = intercons
+
+
+def _intercon_code(index):
+    """ return HDL code of intercon index, called in a worker process """
+    return _INTERCONS[index].code()
+
 
 class Project(WrapperXml):
     """This class manage the project
@@ -58,12 +81,21 @@ class Project(WrapperXml):
     """
 
     def __init__(self, projectpathname, void=0,
-                 description="insert a description here"):
-        """ create project if doesn't exist
+                 description="insert a description here", lazy=False,
+                 snapshot=False, store="xml"):
+        """ create project if doesn't exist, with lazy set, instances
+            are loaded the first time they are used, with snapshot set,
+            instances are loaded from a binary snapshot when it's fresh.
+            store selects how instances of a new project are saved
+            (see PROJECTSTORES)
         """
         self.void = void
+        self._lazy = lazy
+        self._snapshot = snapshot and not lazy
+        self._store = None
         WrapperXml.__init__(self, nodename="void")
         self._instanceslist = []
+        self._instancesdict = {}
         self._vhdl_version = "vhdl87"
 
         self.simulation = None
@@ -71,6 +103,9 @@ class Project(WrapperXml):
         self.driver = None
 
         self._library = Library(self)
+        self._connection_graph = ConnectionGraph(self)
+        self._transaction = 0
+        self._save_pending = False
 
         self.bspdir = None
         self.bspos = None
@@ -90,12 +125,12 @@ class Project(WrapperXml):
             if sy.file_exist(projectpathname):
                 self.load_project(projectpathname)
             else:
-                self.create_project(name)
+                self.create_project(name, store)
             self.description = description
 
             SETTINGS.active_project = self
 
-    def create_project(self, name):
+    def create_project(self, name, store="xml"):
         """ Create a project """
         if sy.dir_exist(self.projectpath):
             raise PodError("Can't create project, directory " +
@@ -115,17 +150,42 @@ class Project(WrapperXml):
         self.name = name
         self.version = "1.0"
         self.void = 0
+        if store != "xml":
+            self.store_type = store
         self.save()
 
     def load_project(self, pathname):
         """ Load the  project
         """
         self.open_xml(pathname)
+        if self.store_type == "sqlite":
+            self._store = SqliteStore(self)
+            # snapshot is keyed on instances XML files
+            self._snapshot = False
         components = self.get_node("components")
         # load components
         if(components):
+            snapshot = None
+            snapshotinstances = None
+            if self._snapshot:
+                snapshot = Snapshot(self)
+                snapshotinstances = snapshot.load(
+                    [node.get_attr_value("name") for node in
+                     components.get_nodes("component")
+                     if node.get_attr_value("platform") is None])
             for node in components.get_nodes("component"):
                 if node.get_attr_value("platform") is None:
+                    if self._lazy:
+                        comp = ComponentProxy(self,
+                                              node.get_attr_value("name"))
+                        self._instanceslist.append(comp)
+                        self._instancesdict[comp.instancename] = comp
+                        continue
+                    if snapshotinstances is not None:
+                        comp = snapshotinstances[node.get_attr_value("name")]
+                        self._instanceslist.append(comp)
+                        self._instancesdict[comp.instancename] = comp
+                        continue
                     comp = Component(self)
                 else:
                     comp = Platform(self, node=self.get_node("platform"))
@@ -140,6 +200,12 @@ class Project(WrapperXml):
                                    " directory", 0)
                 else:
                     self._instanceslist.append(comp)
+                    self._instancesdict[comp.instancename] = comp
+            # snapshot is written before masters link instances together
+            if snapshot is not None and snapshotinstances is None:
+                snapshot.save([comp for comp in self._instanceslist
+                               if not comp.is_platform()])
+        self._connection_graph.build()
 
         # load toolchains
         toolchains = self.get_node("toolchain")
@@ -151,12 +217,10 @@ class Project(WrapperXml):
             if node is not None:
                 self.synthesis = synthesis_factory(self, node.name)
 
-        # Set bus master-slave
-        for masterinterface in self.interfaces_master:
-            for slave in masterinterface.slaves:
-                slaveinterface = slave.get_interface()
-                masterinterface.alloc_mem.add_slave_interface(slaveinterface)
-                slaveinterface.master = masterinterface
+        # Set bus master-slave, done by load_instance() for lazy instances
+        for instance in self.instances:
+            if not isinstance(instance, ComponentProxy):
+                self._set_masters(instance)
 
         # set bsp directory
         if self.get_node(nodename="bsp") is not None:
@@ -164,11 +228,97 @@ class Project(WrapperXml):
                 nodename="bsp").get_attr_value("directory")
         self.void = 0
 
+    def _set_masters(self, instance):
+        """ Set bus master-slave for all master interfaces of instance """
+        for masterinterface in instance.interfaces:
+            if masterinterface.interface_class != "master":
+                continue
+            for slave in masterinterface.slaves:
+                slaveinterface = slave.get_interface()
+                masterinterface.alloc_mem.add_slave_interface(slaveinterface)
+                slaveinterface.master = masterinterface
+
+    def load_instance(self, instancename):
+        """ Load instance given left as a proxy by a lazy project load,
+            return the component loaded
+        """
+        proxy = self._instancesdict.get(instancename)
+        if not isinstance(proxy, ComponentProxy):
+            return self.get_instance(instancename)
+        if proxy.is_loaded:
+            return proxy.component
+        comp = Component(self)
+        try:
+            comp.load(instancename)
+        except IOError:
+            raise PodError("Can't open " + instancename + " directory", 0)
+        proxy.set_component(comp)
+        self._instanceslist[self._instanceslist.index(proxy)] = comp
+        self._instancesdict[instancename] = comp
+        self._connection_graph.add_instance(comp)
+        self._set_masters(comp)
+        return comp
+
+    def load_instances(self):
+        """ Load all instances left as proxies by a lazy project load """
+        for instance in list(self._instanceslist):
+            if isinstance(instance, ComponentProxy) and \
+                    not instance.is_loaded:
+                self.load_instance(instance.instancename)
+
     @property
     def library(self):
         """ Get library """
         return self._library
 
+    @property
+    def store(self):
+        """ Return instances store, None if instances are XML files """
+        return self._store
+
+    @property
+    def store_type(self):
+        """ Return the name of instances store (see PROJECTSTORES) """
+        node = self.get_node("store")
+        if node is None:
+            return "xml"
+        return node.get_attr_value("type")
+
+    @store_type.setter
+    def store_type(self, storetype):
+        """ Move project instances in store given, instances are
+            exported/imported as is
+        """
+        if storetype not in PROJECTSTORES:
+            raise PodError("Unknown store " + str(storetype) +
+                           ", must be one of " + str(PROJECTSTORES), 0)
+        if storetype == self.store_type:
+            return
+        # files are moved now, even in a transaction
+        self.load_instances()
+        self._write()
+        if storetype == "sqlite":
+            store = SqliteStore(self)
+            store.import_xml([instance.instancename
+                              for instance in self.instances
+                              if not instance.is_platform()])
+            self._store = store
+            self.add_node(nodename="store",
+                          attributename="type", value=storetype)
+        else:
+            self._store.export_xml()
+            self._store.close()
+            sy.rm_file(self._store.filename)
+            self._store = None
+            self.del_node("store")
+        self._snapshot = False
+        self._write()
+
+    @property
+    def connection_graph(self):
+        """ Get pins connections graph """
+        return self._connection_graph
+
     @property
     def projectpath(self):
         """ Get projectpath directory name """
@@ -294,6 +444,32 @@ class Project(WrapperXml):
         self._vhdl_version = version
         self.save()
 
+    @property
+    def instance_files(self):
+        """ get how library files are put in project (see
+            INSTANCEFILESMODES) : "copy" makes copies (reflinks when
+            filesystem supports it), "link" makes hard links on library
+            files, "store" shares files in HDL store.
+        """
+        node = self.get_node("instancefiles")
+        if node is None:
+            return "copy"
+        return node.get_attr_value("mode")
+
+    @instance_files.setter
+    def instance_files(self, mode):
+        """ select how library files are put in project """
+        if mode not in INSTANCEFILESMODES:
+            raise PodError(str(mode) + " is not acceptable mode, must " +
+                           "be one of " + str(INSTANCEFILESMODES), 0)
+        node = self.get_node("instancefiles")
+        if node is None:
+            self.add_node(nodename="instancefiles",
+                          attributename="mode", value=mode)
+        else:
+            node.set_attr("mode", mode)
+        self.save()
+
     def add_component_lib(self, path):
         """ Adding a component library under the project """
         if sy.dir_exist(path):
@@ -375,6 +551,8 @@ class Project(WrapperXml):
 
         # Add component to project
         self._instanceslist.append(comp)
+        self._instancesdict[instancename] = comp
+        self._connection_graph.add_instance(comp)
         if comp.is_platform() is False:
             self.add_subnode(nodename="components",
                              subnodename="component",
@@ -413,10 +591,17 @@ class Project(WrapperXml):
     def get_instance(self, instancename=None):
         """ Return the instance by name
         """
-        for instance in self.instances:
-            if instance.instancename == instancename:
-                return instance
-        raise PodError("Instance " + instancename + " doesn't exists")
+        instance = self._instancesdict.get(instancename)
+        if instance is None:
+            raise PodError("Instance " + str(instancename) +
+                           " doesn't exists")
+        return instance
+
+    def reindex_instance(self, oldname, instance):
+        """ index instance renamed under its new name """
+        if self._instancesdict.get(oldname) is instance:
+            del self._instancesdict[oldname]
+            self._instancesdict[instance.instancename] = instance
 
     @property
     def instances(self):
@@ -558,6 +743,7 @@ class Project(WrapperXml):
         # remove pins connections from project instances to this instancename
         for interface in instance.interfaces:
             for port in interface.ports:
+                port.del_slices()
                 for pin in port.pins:
                     pin.del_connections()
         # remove busses connections from project instances to this instancename
@@ -566,6 +752,8 @@ class Project(WrapperXml):
                 comp.del_bus(instanceslavename=instancename)
         # Remove components from project
         self._instanceslist.remove(instance)
+        self._instancesdict.pop(instance.instancename, None)
+        self._connection_graph.del_instance(instance.instancename)
         self.reorder_instances(instance.name)
         self.del_subnode("components",
                          "component",
@@ -575,13 +763,47 @@ class Project(WrapperXml):
         DISPLAY.msg("Component " + instancename + " deleted")
         self.save()
 
+    @property
+    def in_transaction(self):
+        """ Return True if a transaction is started """
+        return self._transaction > 0
+
+    def begin(self):
+        """ Start a transaction, project is kept in memory and
+            saved only once when the last transaction is committed
+        """
+        self._transaction = self._transaction + 1
+
+    def commit(self):
+        """ End a transaction, save project if it's the outermost one and
+            its pins connections are consistent
+        """
+        if self._transaction == 0:
+            raise PodError("No transaction started", 0)
+        self._transaction = self._transaction - 1
+        if self._transaction == 0 and self._save_pending:
+            self._connection_graph.check()
+            self.save()
+
     def save(self):
-        """ Save the project """
+        """ Save the project, only modified files are rewritten.
+            In a transaction, save is delayed until commit.
+        """
+        if self._transaction > 0:
+            self._save_pending = True
+            return
+        self._save_pending = False
+        self._write()
+
+    def _write(self):
+        """ write modified instances and project file """
         for comp in self._instanceslist:
             comp.save()
         if self.simulation is not None:
             self.simulation.save()
-        self.save_xml(self.projectpath + "/" + self.name + XMLEXT)
+        filename = self.projectpath + "/" + self.name + XMLEXT
+        if self.is_dirty or not sy.file_exist(filename):
+            self.save_xml(filename)
 
     def connect_pin_cmd(self, pin_source, pin_dest):
         """ connect pin between two instances
@@ -646,28 +868,74 @@ class Project(WrapperXml):
 
     def generate_intercon(self, interfacedict):
         """ generate intercon for interface interface_name """
-        # test if intercon already exists
+        self.generate_intercons([interfacedict])
+
+    def generate_intercons(self, interfacedictlist=None, jobs=1):
+        """ generate intercons for interfaces given, or for all master
+            interfaces if None. Intercons XML are done one by one, then
+            HDL code is generated by a pool of jobs processes. Intercons
+            are added to project sorted by master instance and interface.
+        """
         from periphondemand.bin.code.intercon import Intercon
-        try:
-            intercon = self.get_instance(interfacedict["instance"] + "_" +
-                                         interfacedict["interface"] +
-                                         "_intercon")
-        except PodError:
-            pass
-        else:
-            self.del_instance(intercon.instancename)
-        instance = self.get_instance(interfacedict["instance"])
-        interface = instance.get_interface(interfacedict["interface"])
-
-        if len(interface.slaves) == 0:
-            DISPLAY.msg(interfacedict["instance"] + "." +
-                        interfacedict["interface"] +
-                        " not generated because no slaves")
-            return
-        intercon = Intercon(self, interface)
-        self.add_instance(component=intercon)
+        if interfacedictlist is None:
+            interfacedictlist = [{"instance": interface.parent.instancename,
+                                  "interface": interface.name}
+                                 for interface in self.interfaces_master]
+        intercons = []
+        for interfacedict in sorted(interfacedictlist,
+                                    key=lambda interfacedict:
+                                    (interfacedict["instance"],
+                                     interfacedict["interface"])):
+            # test if intercon already exists
+            try:
+                intercon = self.get_instance(interfacedict["instance"] +
+                                             "_" +
+                                             interfacedict["interface"] +
+                                             "_intercon")
+            except PodError:
+                pass
+            else:
+                self.del_instance(intercon.instancename)
+            instance = self.get_instance(interfacedict["instance"])
+            interface = instance.get_interface(interfacedict["interface"])
+
+            if len(interface.slaves) == 0:
+                DISPLAY.msg(interfacedict["instance"] + "." +
+                            interfacedict["interface"] +
+                            " not generated because no slaves")
+                continue
+            intercons.append(Intercon(self, interface, generate_code=False))
+
+        for intercon, code in zip(intercons,
+                                  self._intercons_code(intercons, jobs)):
+            if code is None:
+                intercon.masterinterface.bus.generate_intercon(intercon)
+                DISPLAY.msg("Intercon with name : " +
+                            intercon.instancename + " Done")
+            else:
+                intercon.write_code(code)
+            self.add_instance(component=intercon)
         self.save()
 
+    @classmethod
+    def _intercons_code(cls, intercons, jobs):
+        """ return HDL code of intercons generated by a pool of jobs
+            processes, in intercons order. Processes are forked to get the
+            project as it is, without fork or when bus plugins can't give
+            code, a list of None is returned and intercons are generated
+            one after another.
+        """
+        if jobs < 2 or len(intercons) < 2 or \
+                "fork" not in multiprocessing.get_all_start_methods() or \
+                not all([intercon.has_code() for intercon in intercons]):
+            return [None] * len(intercons)
+        with ProcessPoolExecutor(
+                max_workers=min(jobs, len(intercons)),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_intercon_worker,
+                initargs=(intercons,)) as pool:
+            return list(pool.map(_intercon_code, range(len(intercons))))
+
     def connect_port(self, sourcedict, destdict):
         """ Connect all pins of a port source on all pins of
             port dest
@@ -875,18 +1143,7 @@ class Project(WrapperXml):
     def get_components_versions(self, libraryname, componentname):
         """ list component version name in archive
         """
-        filelist = sy.list_files(self.library.library_path(libraryname) +
-                                 "/" + componentname)
-        outlist = []
-        for name in filelist:
-            # take only xml file
-            ext = XMLEXT[1:]  # suppress dot
-            pattern = ".*%s" % ext + "$"
-            if re.match(pattern, name):
-                # Suppress extension
-                name = name.split(".")[0]
-                outlist.append(name)
-        return outlist
+        return self.library.list_versions(libraryname, componentname)
 
     def generate_report(self, filename=None):
         """ generate a project report """
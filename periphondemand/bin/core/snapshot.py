@@ -0,0 +1,186 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     snapshot.py
+# Purpose:  Binary cache of project instances
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" Binary snapshot of project instances """
+
+import hashlib
+import os
+import pickle
+
+from periphondemand.bin.define import COMPONENTSPATH
+from periphondemand.bin.define import POD_CACHE
+from periphondemand.bin.define import SNAPSHOTEXT
+from periphondemand.bin.define import SNAPSHOTPATH
+from periphondemand.bin.define import XMLEXT
+
+from periphondemand.bin.utils.display import Display
+from periphondemand.bin.utils import wrappersystem as sy
+
+DISPLAY = Display()
+
+# to be changed each time objects pickled change
+SNAPSHOT_VERSION = 1
+
+# classes outside of periphondemand found in snapshots
+SAFE_CLASSES = [("xml.etree.ElementTree", "Element"),
+                ("builtins", "set"),
+                ("builtins", "frozenset"),
+                ("collections", "OrderedDict")]
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """ Pickler saving the project as a reference """
+
+    def __init__(self, afile, project):
+        pickle.Pickler.__init__(self, afile, pickle.HIGHEST_PROTOCOL)
+        self.project = project
+
+    def persistent_id(self, obj):
+        if obj is self.project:
+            return "project"
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """ Unpickler giving back the project loading the snapshot """
+
+    def __init__(self, afile, project):
+        pickle.Unpickler.__init__(self, afile)
+        self.project = project
+
+    def persistent_load(self, pid):
+        if pid == "project":
+            return self.project
+        raise pickle.UnpicklingError("unknown reference " + str(pid))
+
+    def find_class(self, module, name):
+        """ only classes of periphondemand and a few safe ones are loaded,
+            functions are never called back
+        """
+        if module.startswith("periphondemand.") or \
+                (module, name) in SAFE_CLASSES:
+            found = pickle.Unpickler.find_class(self, module, name)
+            if isinstance(found, type):
+                return found
+        raise pickle.UnpicklingError("forbidden global " + module + "." +
+                                     name)
+
+
+class Snapshot(object):
+    """ Binary image of project instances as built from their XML files,
+        written in user cache directory, never in project directory where
+        it could come from somebody else, and keyed by mtime, size and hash
+        of each instance XML file.
+        attributes:
+            project   -- project owning the snapshot
+            filename  -- snapshot file path
+    """
+
+    def __init__(self, project, root=None):
+        self.project = project
+        if root is None:
+            root = POD_CACHE + SNAPSHOTPATH
+        projectkey = hashlib.sha1(os.path.realpath(
+            project.projectpath).encode("utf-8")).hexdigest()
+        self.filename = os.path.join(os.path.expanduser(root),
+                                     projectkey + "-" + project.name +
+                                     SNAPSHOTEXT)
+
+    def _source(self, instancename):
+        """ return XML file path of instance """
+        return self.project.projectpath + COMPONENTSPATH + "/" + \
+            instancename + "/" + instancename + XMLEXT
+
+    @classmethod
+    def _hash(cls, filename):
+        """ return content hash of filename """
+        with open(filename, "rb") as afile:
+            return hashlib.sha1(afile.read()).hexdigest()
+
+    def _key(self, instancenames):
+        """ return the snapshot key of instances given """
+        key = []
+        for instancename in instancenames:
+            filename = self._source(instancename)
+            stat = os.stat(filename)
+            key.append((instancename, stat.st_mtime_ns, stat.st_size,
+                        self._hash(filename)))
+        return key
+
+    def _is_fresh(self, key, instancenames):
+        """ return True if key matches XML files of instances, mtime is
+            compared first, hash only when mtime differs
+        """
+        if [source[0] for source in key] != list(instancenames):
+            return False
+        for instancename, mtime, size, digest in key:
+            filename = self._source(instancename)
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                return False
+            if stat.st_mtime_ns == mtime and stat.st_size == size:
+                continue
+            if stat.st_size != size or self._hash(filename) != digest:
+                return False
+        return True
+
+    def load(self, instancenames):
+        """ return the dictionary {instancename: Component} if snapshot is
+            fresh for instances given, else return None
+        """
+        if not sy.file_exist(self.filename):
+            return None
+        try:
+            with open(self.filename, "rb") as afile:
+                unpickler = _SnapshotUnpickler(afile, self.project)
+                version, key = unpickler.load()
+                if version != SNAPSHOT_VERSION or \
+                        not self._is_fresh(key, instancenames):
+                    return None
+                return unpickler.load()
+        except (pickle.UnpicklingError, EOFError, AttributeError,
+                ImportError, OSError) as error:
+            # a broken snapshot is only a cache miss
+            DISPLAY.msg("Snapshot ignored : " + str(error), 1)
+            return None
+
+    def save(self, instances):
+        """ write snapshot of instances (a list of Component) """
+        tmpfilename = self.filename + "." + str(os.getpid()) + ".tmp"
+        try:
+            key = self._key([comp.instancename for comp in instances])
+            if not os.path.isdir(os.path.dirname(self.filename)):
+                os.makedirs(os.path.dirname(self.filename))
+            with open(tmpfilename, "wb") as afile:
+                pickler = _SnapshotPickler(afile, self.project)
+                pickler.dump((SNAPSHOT_VERSION, key))
+                pickler.dump(dict([(comp.instancename, comp)
+                                   for comp in instances]))
+            os.replace(tmpfilename, self.filename)
+        except (OSError, pickle.PicklingError, TypeError,
+                AttributeError) as error:
+            sy.rm_file(tmpfilename)
+            DISPLAY.msg("Can't write snapshot : " + str(error), 1)
@@ -0,0 +1,162 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     sqlitestore.py
+# Purpose:  Store project instances in a sqlite database
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" Sqlite storage of project instances """
+
+import sqlite3
+from xml.etree import ElementTree as ET
+
+from periphondemand.bin.define import COMPONENTSPATH
+from periphondemand.bin.define import SQLITEEXT
+from periphondemand.bin.define import XMLEXT
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils import wrappersystem as sy
+from periphondemand.bin.utils.wrapperxml import XMLHEADER
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS instances (
+    name TEXT PRIMARY KEY,
+    component TEXT,
+    xml TEXT NOT NULL);
+"""
+
+# to be changed each time the schema changes
+SCHEMA_VERSION = 1
+
+
+class SqliteStore(object):
+    """ Keep instances of a project in a sqlite database instead of one XML
+        file per instance. The XML of each instance is kept as is, then
+        import/export to the XML layout is exact, and each save rewrites
+        only the row of the instance saved.
+        attributes:
+            project   -- project owning the store
+            filename  -- database file path
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self.filename = project.projectpath + "/" + project.name + SQLITEEXT
+        self._db = None
+
+    @property
+    def db(self):
+        """ return the database connection, opened on first use """
+        if self._db is None:
+            try:
+                self._db = sqlite3.connect(self.filename)
+                self._db.executescript(SCHEMA)
+                self._db.execute("PRAGMA user_version = " +
+                                 str(SCHEMA_VERSION))
+            except (ValueError, TypeError, sqlite3.Error) as error:
+                self._db = None
+                raise PodError("Can't open " + self.filename + " : " +
+                               str(error), 0)
+        return self._db
+
+    def close(self):
+        """ close database """
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _xml_filename(self, instancename):
+        """ return XML file path of instance in XML layout """
+        return self.project.projectpath + COMPONENTSPATH + "/" + \
+            instancename + "/" + instancename + XMLEXT
+
+    def has_instance(self, instancename):
+        """ return True if instance is in store """
+        return self.db.execute("SELECT 1 FROM instances WHERE name = ?",
+                               (instancename,)).fetchone() is not None
+
+    def read_instance(self, instancename):
+        """ return XML string of instance, None if not in store """
+        row = self.db.execute("SELECT xml FROM instances WHERE name = ?",
+                              (instancename,)).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def instance_names(self):
+        """ return names of instances in store """
+        return [row[0] for row in
+                self.db.execute("SELECT name FROM instances ORDER BY name")]
+
+    def _write(self, instancename, xml, tree):
+        """ replace instance row, caller commits """
+        self.db.execute("INSERT OR REPLACE INTO instances VALUES (?, ?, ?)",
+                        (instancename, tree.get("name"), xml))
+
+    def write_instance(self, component):
+        """ write component in one transaction, only its rows are
+            rewritten
+        """
+        try:
+            with self.db:
+                self._write(component.instancename, str(component),
+                            component.tree)
+        except (ValueError, TypeError, sqlite3.Error) as error:
+            raise PodError("Can't save " + component.instancename +
+                           " : " + str(error), 0)
+
+    def del_instance(self, instancename):
+        """ delete instance from store """
+        try:
+            with self.db:
+                self.db.execute("DELETE FROM instances WHERE name = ?",
+                                (instancename,))
+        except sqlite3.Error as error:
+            raise PodError("Can't delete " + instancename +
+                           " : " + str(error), 0)
+
+    def import_xml(self, instancenames):
+        """ import instances from XML layout, XML files are removed once
+            the transaction is committed
+        """
+        try:
+            with self.db:
+                for instancename in instancenames:
+                    filename = self._xml_filename(instancename)
+                    with open(filename, "r") as afile:
+                        xml = afile.read()
+                    self._write(instancename, xml,
+                                ET.fromstring(xml.replace(XMLHEADER, "")))
+        except (IOError, SyntaxError, ValueError, TypeError,
+                sqlite3.Error) as error:
+            raise PodError("Can't import XML : " + str(error), 0)
+        for instancename in instancenames:
+            sy.rm_file(self._xml_filename(instancename))
+
+    def export_xml(self):
+        """ write back each instance in its XML file """
+        for instancename in self.instance_names():
+            dirname = self.project.projectpath + COMPONENTSPATH + "/" + \
+                instancename
+            if not sy.dir_exist(dirname):
+                sy.mkdir(dirname)
+            sy.write_fragments(self._xml_filename(instancename),
+                               [self.read_instance(instancename)])
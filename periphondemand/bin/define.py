@@ -5,6 +5,13 @@ import periphondemand
 
 # global
 POD_CONFIG = "~/.podrc"
+POD_CACHE = "~/.cache/periphondemand"
+CATALOGFILE = "/catalog.json"
+HDLSTOREPATH = "/hdl"
+BUILDCACHEPATH = "/builds"
+BUILDCACHESIZE = 4 * 1024 * 1024 * 1024
+TOOLPROBEFILE = "/toolchains.json"
+SNAPSHOTPATH = "/snapshots"
 POD_PATH = periphondemand.__path__[0]
 PLATFORMPATH = "/platforms"
 BUSPATH = "/busses/"
@@ -27,6 +34,12 @@ VHDLEXT = ".vhd"
 UCFEXT = ".ucf"
 BITSTREAMEXT = ".bit"
 PODSCRIPTEXT = ".pod"
+SNAPSHOTEXT = ".snapshot"
+SQLITEEXT = ".db"
+PROJECTSTORES = ["xml", "sqlite"]
+INSTANCEFILESMODES = ["copy", "link", "store"]
+HDLMANIFESTEXT = ".hdlstore"
+LOGEXT = ".log"
 HDLEXT = ["vhdl", "vhd", "v"]
 
 # for components
@@ -38,6 +51,8 @@ DRIVERS_TEMPLATES_PATH = "/drivers_templates"
 # for project
 BINARYPROJECTPATH = "/binaries"
 OBJSPATH = "/objs"
+LOGSPATH = "/logs"
+BATCHSUMMARYFILE = "summary.json"
 BINARY_PREFIX = "top_"
 ALTERA_BINARY_SUFFIX = ".rbf"
 XILINX_BINARY_SUFFIX = ".bin"
@@ -31,6 +31,8 @@
 """ Starting point of POD """
 
 from periphondemand.bin.commandline.projectcli import ProjectCli
+from periphondemand.bin.utils.batch import Batch
+from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils import wrappersystem as sy
 from periphondemand.bin.version import VERSION
@@ -47,18 +49,90 @@ def usage():
     """ print POD arg usage """
     print("""\
 Usage: pod [OPTION...]
+       pod batch [BATCH OPTION...] [script...]
 
     -h, --help             give this help list
     -s, --source=filename  load a script
     -l, --load=projectname load a project
     -v, --version          print program version
 
+Batch options, scripts given and parameter matrix jobs run in parallel,
+each one in its own directory:
+    -m, --matrix=filename  add jobs of a JSON parameter matrix
+    -o, --output=dirname   batch directory (default batch)
+    -j, --jobs=N           CPU slots (default number of CPU)
+        --memory=MB        memory slots (default physical memory)
+        --job-cpus=N       CPU slots used by each job (default 1)
+        --job-memory=MB    memory used by each job (default 0)
+        --timeout=s        jobs timeout
+        --artifacts=glob   files kept, relative to job directory
+                           (default */binaries/*), may be repeated
+
 Report bugs to http://periphondemand.sourceforge.net/
 """)
 
 
+def batch(argv):
+    """ run scripts and parameter matrix as parallel jobs, return exit
+        code
+    """
+    try:
+        opts, scripts = getopt.getopt(argv, "hm:o:j:",
+                                      ["help", "matrix=", "output=",
+                                       "jobs=", "memory=", "job-cpus=",
+                                       "job-memory=", "timeout=",
+                                       "artifacts="])
+    except getopt.GetoptError as error:
+        print(error)
+        usage()
+        return 2
+    matrices = []
+    outdir = "batch"
+    artifacts = []
+    values = {"--jobs": None, "--memory": None, "--job-cpus": 1,
+              "--job-memory": 0, "--timeout": None}
+    try:
+        for opt, arg in opts:
+            if opt in ["-h", "--help"]:
+                usage()
+                return 0
+            elif opt in ["-m", "--matrix"]:
+                matrices.append(arg)
+            elif opt in ["-o", "--output"]:
+                outdir = arg
+            elif opt == "--artifacts":
+                artifacts.append(arg)
+            elif opt == "-j":
+                values["--jobs"] = int(arg)
+            else:
+                values[opt] = int(arg)
+    except ValueError:
+        print("[ERROR] " + opt + " must be an integer")
+        return 2
+    if not scripts and not matrices:
+        print("[ERROR] no script nor matrix given")
+        usage()
+        return 2
+    jobs = Batch(outdir, values["--jobs"], values["--memory"],
+                 values["--timeout"], artifacts or None)
+    try:
+        for script in scripts:
+            jobs.add_script(script, values["--job-cpus"],
+                            values["--job-memory"])
+        for matrix in matrices:
+            jobs.add_matrix(matrix, values["--job-cpus"],
+                            values["--job-memory"])
+        if jobs.run():
+            return 0
+    except PodError as error:
+        print(error)
+    return 1
+
+
 def main(argv):
     """ Main command line prog for pod """
+    if len(argv) > 1 and argv[1] == "batch":
+        sys.exit(batch(argv[2:]))
     try:
         opts, _ = getopt.getopt(argv[1:], "hvs:l:", ["help",
                                                      "version",
@@ -0,0 +1,134 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     buildcache.py
+# Purpose:  Cache of bitstreams keyed by synthesis inputs
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" Cache of bitstreams keyed by synthesis inputs """
+
+import hashlib
+import os
+import shutil
+
+from periphondemand.bin.define import BUILDCACHEPATH
+from periphondemand.bin.define import BUILDCACHESIZE
+from periphondemand.bin.define import POD_CACHE
+
+from periphondemand.bin.utils import wrappersystem as sy
+
+
+class BuildCache(object):
+    """ Bitstreams stored by hash of the files used to build them (top,
+        intercons and components HDL, constraints, TCL script) and of the
+        toolchain version, in <root>/<key>/. An entry is used as a whole,
+        the least recently used entries are evicted when cache size is
+        greater than maxsize.
+        attributes:
+            root     -- cache directory
+            maxsize  -- maximum cache size in bytes
+    """
+
+    def __init__(self, root=None, maxsize=BUILDCACHESIZE):
+        if root is None:
+            root = POD_CACHE + BUILDCACHEPATH
+        self.root = os.path.expanduser(root)
+        self.maxsize = maxsize
+
+    @classmethod
+    def key(cls, inputs, toolchain):
+        """ return build key of inputs, a list of (name, filepath) where
+            name is the file name relative to the project, and of
+            toolchain identification string
+        """
+        sha = hashlib.sha256()
+        sha.update(toolchain.encode("utf-8") + b"\0")
+        for name, filepath in sorted(inputs):
+            filesha = hashlib.sha256()
+            with open(filepath, "rb") as afile:
+                for block in iter(lambda: afile.read(1 << 16), b""):
+                    filesha.update(block)
+            sha.update(name.encode("utf-8") + b"\0" +
+                       filesha.hexdigest().encode("ascii") + b"\n")
+        return sha.hexdigest()
+
+    def _entry(self, key):
+        """ return entry directory of key """
+        return os.path.join(self.root, key)
+
+    def restore(self, key, dirpath):
+        """ copy files of entry key in dirpath, return the list of files
+            restored or None if key is not in cache
+        """
+        entry = self._entry(key)
+        if not os.path.isdir(entry):
+            return None
+        restored = []
+        try:
+            for afile in sorted(os.listdir(entry)):
+                sy.clone_file(os.path.join(entry, afile),
+                              os.path.join(dirpath, afile))
+                restored.append(afile)
+            # mark as recently used
+            os.utime(entry, None)
+        except (IOError, OSError):
+            return None
+        return restored
+
+    def store(self, key, filepaths):
+        """ store files as entry key, then evict old entries """
+        entry = self._entry(key)
+        tmpentry = entry + "." + str(os.getpid()) + ".tmp"
+        try:
+            if os.path.isdir(tmpentry):
+                shutil.rmtree(tmpentry)
+            os.makedirs(tmpentry)
+            for filepath in filepaths:
+                sy.clone_file(filepath, os.path.join(
+                    tmpentry, os.path.basename(filepath)))
+            if os.path.isdir(entry):
+                shutil.rmtree(entry)
+            os.rename(tmpentry, entry)
+        except (IOError, OSError):
+            shutil.rmtree(tmpentry, ignore_errors=True)
+            return False
+        self.evict()
+        return True
+
+    def evict(self):
+        """ remove least recently used entries until cache size is lower
+            than maxsize
+        """
+        entries = []
+        total = 0
+        for name in os.listdir(self.root):
+            entry = os.path.join(self.root, name)
+            if name.endswith(".tmp") or not os.path.isdir(entry):
+                continue
+            size = sum([os.path.getsize(os.path.join(entry, afile))
+                        for afile in os.listdir(entry)])
+            entries.append((os.stat(entry).st_mtime, size, entry))
+            total += size
+        for _, size, entry in sorted(entries):
+            if total <= self.maxsize:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
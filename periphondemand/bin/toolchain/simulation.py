@@ -96,7 +96,14 @@ class Simulation(WrapperXml):
                         SIMULATIONPATH + "/" + self.name)
         return plugin.generate_makefile()
 
+    @property
+    def dirty_parent(self):
+        """ simulation is saved in its own file """
+        return None
+
     def save(self):
         """ save project """
-        self.save_xml(self.parent.projectpath +
-                      "/simulation/simulation" + XMLEXT)
+        filename = self.parent.projectpath + "/simulation/simulation" + XMLEXT
+        if not self.is_dirty and sy.file_exist(filename):
+            return
+        self.save_xml(filename)
@@ -25,18 +25,32 @@
 # ----------------------------------------------------------------------------
 """ Synthesis toolchain """
 
+from periphondemand.bin.define import BINARYPROJECTPATH
+from periphondemand.bin.define import BINARY_PREFIX
 from periphondemand.bin.define import SYNTHESISPATH
 from periphondemand.bin.define import TCLEXT
 from periphondemand.bin.define import OBJSPATH
 from periphondemand.bin.define import VHDLEXT
 from periphondemand.bin.define import COMPONENTSPATH
+from periphondemand.bin.define import HDLMANIFESTEXT
+from periphondemand.bin.define import LOGSPATH
 
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils import wrappersystem as sy
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.utils.display import Display
+from periphondemand.bin.utils.processrunner import ProcessRunner
 
+from periphondemand.bin.core.hdlstore import HdlStore
+
+from periphondemand.bin.toolchain.buildcache import BuildCache
+from periphondemand.bin.toolchain.toolprobe import ToolProbe
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 import importlib
+import os
+import time
 
 SETTINGS = Settings()
 DISPLAY = Display()
@@ -49,6 +63,7 @@ class Synthesis(object):
         self._parent = parent
         self.project = parent
         self.tcl_scriptname = None
+        self._runner = None
 
     @property
     def parent(self):
@@ -123,6 +138,201 @@ class Synthesis(object):
         """ generate the bitstream """
         raise NotImplementedError("method must be implemented", 0)
 
+    @property
+    def runner(self):
+        """ return the process runner of toolchain steps, steps logs are
+            written in synthesis logs directory, steps are stopped after
+            the "timeout" (in s) given for the tool in .podrc
+        """
+        if self._runner is None:
+            timeout = self.get_synthesis_value("timeout")
+            if timeout is not None:
+                try:
+                    timeout = float(timeout)
+                except ValueError:
+                    raise PodError("Wrong timeout " + timeout + " for " +
+                                   self.name + " in .podrc", 0)
+            self._runner = ProcessRunner(
+                self.parent.projectpath + SYNTHESISPATH + LOGSPATH,
+                timeout)
+        return self._runner
+
+    def run_step(self, name, args, stdin=None):
+        """ launch a toolchain command as step name in synthesis
+            directory, raise PodError if it fails
+        """
+        return self.runner.run(name, args, stdin=stdin,
+                               cwd=self.parent.projectpath + SYNTHESISPATH)
+
+    @property
+    def workers(self):
+        """ return the number of steps run at the same time, given by
+            "jobs" for the tool in .podrc, number of CPU by default
+        """
+        jobs = self.get_synthesis_value("jobs")
+        if jobs is None:
+            return os.cpu_count() or 1
+        try:
+            workers = int(jobs)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            raise PodError("Wrong jobs " + jobs + " for " + self.name +
+                           " in .podrc", 0)
+        return workers
+
+    def run_steps(self, steps):
+        """ launch independent steps, a list of (name, args), at the same
+            time with at most workers steps running. On failure, steps
+            still running are cancelled and PodError is raised once all
+            are done.
+        """
+        if len(steps) <= 1 or self.workers == 1:
+            return [self.run_step(name, args) for name, args in steps]
+        cwd = self.parent.projectpath + SYNTHESISPATH
+        # a runner of its own, cancelled on first failure
+        runner = ProcessRunner(self.runner.logdir, self.runner.timeout)
+        errors = []
+        results = []
+        with ThreadPoolExecutor(min(self.workers, len(steps))) as executor:
+            futures = [executor.submit(runner.run, name, args,
+                                       cwd=cwd, check=False, tagged=True)
+                       for name, args in steps]
+
+            def stop():
+                """ cancel steps waiting and running """
+                for future in futures:
+                    future.cancel()
+                runner.cancel()
+
+            try:
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    try:
+                        result = future.result()
+                    except PodError as error:
+                        errors.append(error.message)
+                        stop()
+                        continue
+                    results.append(result)
+                    if not result.succeeded and \
+                            (not result.cancelled or not errors):
+                        errors.append(str(result))
+                        stop()
+            except KeyboardInterrupt:
+                # steps are in their own session, they don't get Ctrl-C
+                stop()
+                errors.append("Steps cancelled")
+        if errors:
+            raise PodError("\n".join(errors), 0)
+        return results
+
+    @property
+    def toolchain_id(self):
+        """ return a string identifying toolchain used, for build cache :
+            name, command path with its size and mtime, and version when
+            known
+        """
+        command = self.synthesis_toolcommandname
+        commandpath = ToolProbe.resolve(command)
+        toolid = [self.name, command]
+        if commandpath is not None:
+            stat = os.stat(commandpath)
+            toolid.extend([os.path.realpath(commandpath),
+                           str(stat.st_size), str(stat.st_mtime_ns)])
+        try:
+            version = getattr(self, "version", "")
+        except PodError:
+            # command not found, build fails later with a clear message
+            version = ""
+        toolid.append(str(version))
+        return " ".join(toolid)
+
+    def component_dirs(self):
+        """ return names of components directories in synthesis directory,
+            all directories but steps logs one
+        """
+        synthesispath = self.parent.projectpath + SYNTHESISPATH
+        if not sy.dir_exist(synthesispath):
+            return []
+        return [directory for directory in sy.list_dir(synthesispath)
+                if "/" + directory != LOGSPATH]
+
+    def source_files(self):
+        """ return components files of synthesis directory added to the
+            toolchain project, as a list of (name, filepath), name being
+            relative to synthesis directory. Steps logs are not sources.
+        """
+        synthesispath = self.parent.projectpath + SYNTHESISPATH
+        sources = []
+        for directory in self.component_dirs():
+            for afile in sy.list_files(synthesispath + "/" + directory):
+                filepath = synthesispath + "/" + directory + "/" + afile
+                if os.path.isfile(filepath):
+                    sources.append((directory + "/" + afile, filepath))
+        return sources
+
+    def build_scripts(self):
+        """ return names of scripts generated in synthesis directory and
+            read by the toolchain, besides the main TCL script
+        """
+        return []
+
+    def build_inputs(self):
+        """ return files used to build the bitstream, as a list of
+            (name, filepath), name being relative to synthesis directory :
+            top, TCL script and files it references, constraints and
+            toolchain scripts. Files written by toolchains while building
+            are not inputs.
+        """
+        synthesispath = self.parent.projectpath + SYNTHESISPATH
+        tcl_scriptname = self.tcl_scriptname
+        if tcl_scriptname is None:
+            tcl_scriptname = self.parent.name + TCLEXT
+        # files in HDL store are hashed through the manifest
+        names = ["top_" + self.parent.name + VHDLEXT, tcl_scriptname,
+                 self.parent.name + "." + self.constraints_file_extension(),
+                 self.parent.name + HDLMANIFESTEXT] + self.build_scripts()
+        inputs = [(name, synthesispath + "/" + name) for name in names
+                  if sy.file_exist(synthesispath + "/" + name)]
+        return inputs + self.source_files()
+
+    def bitstream_files(self, since=0):
+        """ return bitstream files found in binaries directory, modified
+            after since (a timestamp)
+        """
+        binpath = self.parent.projectpath + BINARYPROJECTPATH
+        return [os.path.join(binpath, afile)
+                for afile in sy.list_files(binpath)
+                if afile.startswith(BINARY_PREFIX + self.parent.name + ".")
+                and os.path.getmtime(os.path.join(binpath, afile)) >= since]
+
+    def build_bitstream(self, usecache=True):
+        """ generate the bitstream, or restore it from build cache when
+            synthesis inputs and toolchain are unchanged
+        """
+        if not usecache:
+            return self.generate_bitstream()
+        cache = BuildCache()
+        try:
+            key = cache.key(self.build_inputs(), self.toolchain_id)
+        except (IOError, OSError) as error:
+            raise PodError("Can't compute build key : " + str(error), 0)
+        restored = cache.restore(key, self.parent.projectpath +
+                                 BINARYPROJECTPATH)
+        if restored:
+            DISPLAY.msg("Bitstream restored from build cache : " +
+                        ", ".join(restored))
+            return None
+        start = time.time()
+        result = self.generate_bitstream()
+        # bitstreams left by a previous build are not cached
+        bitstreams = self.bitstream_files(since=int(start))
+        if bitstreams and cache.store(key, bitstreams):
+            DISPLAY.msg("Bitstream stored in build cache")
+        return result
+
     def generatelibraryconstraints(self):
         """ Adds constraints specified by a component,
             such as placement for a PLL,
@@ -264,11 +474,11 @@ class Synthesis(object):
         tclfile.write(self.add_file_to_tcl(".." + SYNTHESISPATH + "/top_" +
                       self.project.name + VHDLEXT))
 
-        for directory in sy.list_dir(self.project.projectpath + SYNTHESISPATH):
-            for afile in sy.list_files(self.project.projectpath +
-                                       SYNTHESISPATH + "/" + directory):
-                tclfile.write(self.add_file_to_tcl(".." + SYNTHESISPATH + "/" +
-                              directory + "/" + afile))
+        for name, _ in self.source_files():
+            tclfile.write(self.add_file_to_tcl(".." + SYNTHESISPATH + "/" +
+                                               name))
+        for filepath in self.stored_hdl_files():
+            tclfile.write(self.add_file_to_tcl(filepath))
 
         # Constraints files
         tclfile.write("# add constraint file\n")
@@ -299,32 +509,121 @@ class Synthesis(object):
         """
         return SETTINGS.get_synthesis_value(self.name, value)
 
+    @property
+    def hdl_manifest(self):
+        """ Return path of the list of HDL files referenced in store """
+        return self.parent.projectpath + SYNTHESISPATH + "/" + \
+            self.parent.name + HDLMANIFESTEXT
+
+    def stored_hdl_files(self):
+        """ Return paths in HDL store of files referenced by project,
+            empty list if HDL files are copied in synthesis directory
+        """
+        if not sy.file_exist(self.hdl_manifest):
+            return []
+        hdlstore = HdlStore()
+        filelist = []
+        with open(self.hdl_manifest, "r") as manifest:
+            for line in manifest:
+                _, digest, filename = line.split()
+                filepath = hdlstore.path(digest, filename)
+                if not sy.file_exist(filepath):
+                    raise PodError(filename + " not found in HDL store, " +
+                                   "synthesis project must be generated " +
+                                   "again", 0)
+                filelist.append(filepath)
+        return filelist
+
+    @classmethod
+    def _remove(cls, path, report):
+        """ delete a stale file or directory of synthesis directory """
+        if sy.dir_exist(path):
+            sy.rm_dir(path)
+        else:
+            sy.rm_file(path)
+        report["removed"].append(path)
+        DISPLAY.msg("Remove " + path)
+
     def generate_project(self):
-        """ copy all hdl file in synthesis project directory
+        """ copy all hdl file in synthesis project directory, or only
+            reference them in HDL store by hash if project instance files
+            mode is "store".
+            Synthesis directory is synchronized : only modified files are
+            copied, files and components directories no more used are
+            deleted (steps logs are kept) and unchanged files are
+            left untouched (mtime included) for toolchains incremental
+            compilation. Return {"copied": [], "removed": [],
+            "unchanged": []} lists of files paths.
         """
+        hardlink = self.parent.instance_files == "link"
+        hdlstore = None
+        if self.parent.instance_files == "store":
+            hdlstore = HdlStore()
+        manifest = []
+        report = {"copied": [], "removed": [], "unchanged": []}
         for component in self.parent.instances:
             if component.num == "0":
                 # Make directory
                 compdir = self.parent.projectpath +\
                     SYNTHESISPATH + "/" +\
                     component.name
-                if sy.dir_exist(compdir):
-                    DISPLAY.msg("Directory " + compdir +
-                                " exist, will be deleted")
-                    sy.rm_dir(compdir)
-                sy.mkdir(compdir)
-                DISPLAY.msg("Make directory for " + component.name)
-                # copy hdl files
+                if hdlstore is not None:
+                    if sy.dir_exist(compdir):
+                        DISPLAY.msg("Directory " + compdir +
+                                    " exist, will be deleted")
+                        sy.rm_dir(compdir)
+                    for hdlfile in component.hdl_files:
+                        manifest.append(
+                            component.name + " " +
+                            hdlstore.add(self.parent.projectpath +
+                                         COMPONENTSPATH + "/" +
+                                         component.instancename +
+                                         "/hdl/" + hdlfile.filename) +
+                            " " + hdlfile.filename + "\n")
+                    continue
+                if not sy.dir_exist(compdir):
+                    sy.mkdir(compdir)
+                    DISPLAY.msg("Make directory for " + component.name)
+                # copy modified hdl files
+                filenames = []
                 for hdlfile in component.hdl_files:
+                    filenames.append(hdlfile.filename)
+                    target = compdir + "/" + hdlfile.filename
                     try:
-                        sy.cp_file(self.parent.projectpath +
-                                   COMPONENTSPATH + "/" +
-                                   component.instancename +
-                                   "/hdl/" + hdlfile.filename,
-                                   compdir + "/")
-                    except IOError as error:
+                        copied = sy.sync_file(self.parent.projectpath +
+                                              COMPONENTSPATH + "/" +
+                                              component.instancename +
+                                              "/hdl/" + hdlfile.filename,
+                                              target, hardlink)
+                    except (IOError, OSError) as error:
                         print(DISPLAY)
                         raise PodError(str(error), 0)
+                    if copied:
+                        report["copied"].append(target)
+                        DISPLAY.msg("Copy " + target)
+                    else:
+                        report["unchanged"].append(target)
+                # delete stale files
+                for afile in sy.list_files(compdir):
+                    if afile not in filenames:
+                        self._remove(compdir + "/" + afile, report)
+        # delete directories of components no more instanciated
+        names = [component.name for component in self.parent.instances]
+        for directory in self.component_dirs():
+            if directory not in names:
+                self._remove(self.parent.projectpath + SYNTHESISPATH +
+                             "/" + directory, report)
+        if hdlstore is None:
+            DISPLAY.msg("Synthesis project synchronized : " +
+                        str(len(report["copied"])) + " copied, " +
+                        str(len(report["removed"])) + " removed, " +
+                        str(len(report["unchanged"])) + " unchanged")
+        if hdlstore is not None:
+            sy.write_fragments(self.hdl_manifest, manifest)
+            DISPLAY.msg("HDL files referenced in " + self.hdl_manifest)
+        else:
+            sy.rm_file(self.hdl_manifest)
+        return report
 
 #    def generate_pinout(self, filename):
 #        """ Generate pinout constraints file """
@@ -0,0 +1,115 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     toolprobe.py
+# Purpose:  Persistent cache of toolchains versions
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" Persistent cache of toolchains versions """
+
+import json
+import os
+import shutil
+
+from periphondemand.bin.define import POD_CACHE
+from periphondemand.bin.define import TOOLPROBEFILE
+
+from periphondemand.bin.utils.poderror import PodError
+
+# to be changed each time probe file format changes
+TOOLPROBE_VERSION = 1
+
+
+class ToolProbe(object):
+    """ Versions of toolchains commands, kept in the user cache directory
+        and keyed by resolved executable path : a command is launched to
+        get its version only when its executable changed (mtime or size).
+        attributes:
+            filename  -- probe file path
+            _tools    -- {realpath: {"mtime": mtime, "size": size,
+                                     "version": version,
+                                     "base_version": base version}}
+    """
+
+    def __init__(self, filename=None):
+        if filename is None:
+            filename = POD_CACHE + TOOLPROBEFILE
+        self.filename = os.path.expanduser(filename)
+        self._tools = None
+
+    def _load(self):
+        """ read probe file the first time it's needed """
+        if self._tools is not None:
+            return
+        self._tools = {}
+        try:
+            with open(self.filename, "r") as afile:
+                probe = json.load(afile)
+            if probe.get("version") == TOOLPROBE_VERSION:
+                self._tools = probe["tools"]
+        except (IOError, ValueError, KeyError, AttributeError):
+            # no probe file or a broken one, tools will be probed again
+            pass
+
+    def _save(self):
+        """ write probe file, an unwritable cache is ignored """
+        tmpfilename = self.filename + "." + str(os.getpid()) + ".tmp"
+        try:
+            if not os.path.isdir(os.path.dirname(self.filename)):
+                os.makedirs(os.path.dirname(self.filename))
+            with open(tmpfilename, "w") as afile:
+                json.dump({"version": TOOLPROBE_VERSION,
+                           "tools": self._tools}, afile)
+            os.replace(tmpfilename, self.filename)
+        except (IOError, OSError):
+            try:
+                os.remove(tmpfilename)
+            except OSError:
+                pass
+
+    @classmethod
+    def resolve(cls, command):
+        """ return command path found in PATH, None if not found """
+        return shutil.which(os.path.expanduser(command))
+
+    def probe(self, command, prober):
+        """ return {"version", "base_version"} of command,
+            prober is called with resolved command path to get
+            (version, base version) only if executable changed since
+            last probe
+        """
+        commandpath = self.resolve(command)
+        if commandpath is None:
+            raise PodError("Command " + command + " doesn't exist in your " +
+                           "PATH", 0)
+        realpath = os.path.realpath(commandpath)
+        stat = os.stat(realpath)
+        self._load()
+        entry = self._tools.get(realpath)
+        if entry is not None and entry["mtime"] == stat.st_mtime_ns and \
+                entry["size"] == stat.st_size:
+            return entry
+        version, base_version = prober(commandpath)
+        entry = {"mtime": stat.st_mtime_ns, "size": stat.st_size,
+                 "version": version, "base_version": base_version}
+        self._tools[realpath] = entry
+        self._save()
+        return entry
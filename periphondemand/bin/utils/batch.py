@@ -0,0 +1,309 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     batch.py
+# Purpose:  Run many pod scripts on a local pool of workers
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" Run many pod scripts on a local pool of workers """
+
+import glob
+import itertools
+import json
+import os
+import string
+import sys
+import threading
+
+from periphondemand.bin.define import BATCHSUMMARYFILE
+from periphondemand.bin.define import BINARYPROJECTPATH
+from periphondemand.bin.define import LOGEXT
+from periphondemand.bin.define import PODSCRIPTEXT
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.processrunner import ProcessRunner
+from periphondemand.bin.utils import wrappersystem as sy
+
+# command launching pod in a job, without relying on pod being installed
+POD_COMMAND = [sys.executable, "-c",
+               "import sys\n" +
+               "from periphondemand.bin import pod\n" +
+               "pod.main(sys.argv)"]
+
+# project binaries are kept by default
+DEFAULT_ARTIFACTS = ["*" + BINARYPROJECTPATH + "/*"]
+
+
+def total_memory():
+    """ return physical memory in MB, 0 if unknown """
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * \
+            os.sysconf("SC_PHYS_PAGES") // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return 0
+
+
+class BatchJob(object):
+    """ A pod script run in its own directory
+        attributes:
+            name       -- job name, its directory name
+            script     -- script path
+            cpus       -- CPU slots used
+            memory     -- memory used in MB
+            result     -- StepResult once run
+            status     -- "pending", "running", "ok", "errors",
+                          "failed", "timeout" or "cancelled"
+            errors     -- number of errors reported by pod
+            artifacts  -- files kept, relative to job directory
+    """
+
+    def __init__(self, name, script, cpus=1, memory=0):
+        self.name = name
+        self.script = script
+        self.cpus = cpus
+        self.memory = memory
+        self.result = None
+        self.status = "pending"
+        self.errors = 0
+        self.artifacts = []
+
+    def summary(self):
+        """ return job summary as a dictionary """
+        summary = {"name": self.name, "script": self.script,
+                   "status": self.status, "errors": self.errors,
+                   "artifacts": self.artifacts}
+        if self.result is not None:
+            summary.update({"returncode": self.result.returncode,
+                            "duration": round(self.result.duration, 3),
+                            "log": self.result.logfile})
+        return summary
+
+
+class Batch(object):
+    """ Run pod scripts as independent jobs on the local machine, each one
+        in its own directory under outdir (outdir/<job>/, log in
+        outdir/<job>.log). A job is started when enough CPU and memory
+        slots are free, a summary of jobs status, duration and artifacts
+        is written in outdir/summary.json.
+        attributes:
+            outdir     -- batch directory
+            cpus       -- CPU slots, number of CPU by default
+            memory     -- memory slots in MB, physical memory by default
+            timeout    -- jobs timeout in s, None for no timeout
+            artifacts  -- glob patterns of files kept, relative to job
+                          directory
+            jobs       -- list of BatchJob
+    """
+
+    def __init__(self, outdir, cpus=None, memory=None, timeout=None,
+                 artifacts=None):
+        self.outdir = os.path.abspath(outdir)
+        self.cpus = cpus or os.cpu_count() or 1
+        self.memory = memory or total_memory()
+        self.timeout = timeout
+        if artifacts is None:
+            artifacts = DEFAULT_ARTIFACTS
+        self.artifacts = artifacts
+        self.jobs = []
+        self._runner = None
+
+    def _job_name(self, name):
+        """ return a job name not used yet """
+        jobname = name
+        num = 2
+        while jobname in [job.name for job in self.jobs]:
+            jobname = name + "_" + str(num)
+            num = num + 1
+        return jobname
+
+    def add_script(self, script, cpus=1, memory=0):
+        """ add a job running script """
+        if not sy.file_exist(script):
+            raise PodError("Script " + script + " doesn't exist", 0)
+        name = os.path.basename(script)
+        if name.endswith(PODSCRIPTEXT):
+            name = name[:-len(PODSCRIPTEXT)]
+        job = BatchJob(self._job_name(name), os.path.abspath(script),
+                       cpus, memory)
+        self.jobs.append(job)
+        return job
+
+    def add_matrix(self, filename, cpus=1, memory=0):
+        """ add a job for each combination of parameters of a matrix file,
+            in JSON :
+                {"script": "template.pod",
+                 "parameters": {"board": ["apf27", "apf51"],
+                                "freq": ["100", "133"]},
+                 "cpus": 1, "memory": 2048}
+            $board and $freq are replaced in script (relative to matrix
+            file) by values of each combination, scripts are written in
+            batch directory. cpus and memory are optional.
+        """
+        try:
+            with open(filename, "r") as afile:
+                matrix = json.load(afile)
+            template = matrix["script"]
+            parameters = matrix.get("parameters", {})
+            names = sorted(parameters.keys())
+            values = [parameters[name] for name in names]
+            if not all([isinstance(value, list) for value in values]):
+                raise ValueError("parameters values must be lists")
+            cpus = int(matrix.get("cpus", cpus))
+            memory = int(matrix.get("memory", memory))
+        except (IOError, ValueError, KeyError, AttributeError,
+                TypeError) as error:
+            raise PodError("Wrong matrix file " + filename + " : " +
+                           str(error), 0)
+        template = os.path.join(os.path.dirname(os.path.abspath(filename)),
+                                template)
+        try:
+            with open(template, "r") as afile:
+                script = string.Template(afile.read())
+        except IOError as error:
+            raise PodError("Can't read " + template + " : " + str(error), 0)
+        basename = os.path.basename(template)
+        if basename.endswith(PODSCRIPTEXT):
+            basename = basename[:-len(PODSCRIPTEXT)]
+        jobs = []
+        for combination in itertools.product(*values):
+            params = dict(zip(names, [str(value) for value in combination]))
+            try:
+                content = script.substitute(params)
+            except (KeyError, ValueError) as error:
+                raise PodError("Wrong parameter " + str(error) + " in " +
+                               template, 0)
+            name = self._job_name("_".join([basename] + [
+                name + "-" + params[name] for name in names]))
+            if not sy.dir_exist(self.outdir):
+                sy.mkdir(self.outdir)
+            scriptpath = os.path.join(self.outdir, name + PODSCRIPTEXT)
+            sy.write_fragments(scriptpath, [content])
+            job = BatchJob(name, scriptpath, cpus, memory)
+            self.jobs.append(job)
+            jobs.append(job)
+        return jobs
+
+    def _run_job(self, job):
+        """ run job in its directory, then collect status and artifacts """
+        jobdir = os.path.join(self.outdir, job.name)
+        if sy.dir_exist(jobdir):
+            sy.rm_dir(jobdir)
+        sy.mkdir(jobdir)
+        job.result = self._runner.run(job.name,
+                                      POD_COMMAND + ["-s", job.script],
+                                      stdin=os.devnull, cwd=jobdir,
+                                      check=False)
+        if job.result.logfile is not None:
+            with open(job.result.logfile, "r", errors="replace") as log:
+                job.errors = len([line for line in log
+                                  if "[ERROR]" in line])
+        if job.result.timedout:
+            job.status = "timeout"
+        elif job.result.cancelled:
+            job.status = "cancelled"
+        elif job.result.returncode != 0:
+            job.status = "failed"
+        elif job.errors:
+            job.status = "errors"
+        else:
+            job.status = "ok"
+        for pattern in self.artifacts:
+            for path in sorted(glob.glob(os.path.join(jobdir, pattern))):
+                if os.path.isfile(path):
+                    job.artifacts.append(os.path.relpath(path, jobdir))
+
+    def _worker(self, job, condition, slots):
+        """ thread running a job, slots are given back at the end """
+        try:
+            self._run_job(job)
+        except (PodError, IOError, OSError) as error:
+            job.status = "failed"
+            print("[" + job.name + "] " + str(error))
+        finally:
+            with condition:
+                slots["cpus"] += job.cpus
+                slots["memory"] += job.memory
+                slots["running"] -= 1
+                condition.notify()
+        print("[" + job.name + "] " + job.status +
+              " (%.1f s)" % (job.result.duration if job.result else 0))
+
+    def run(self):
+        """ run all jobs, return True if all succeeded """
+        if not sy.dir_exist(self.outdir):
+            sy.mkdir(self.outdir)
+        self._runner = ProcessRunner(self.outdir, self.timeout, echo=False)
+        # a job bigger than the pool runs alone
+        for job in self.jobs:
+            job.cpus = max(1, min(job.cpus, self.cpus))
+            if self.memory:
+                job.memory = min(job.memory, self.memory)
+        slots = {"cpus": self.cpus, "memory": self.memory, "running": 0}
+        condition = threading.Condition()
+        pending = list(self.jobs)
+        threads = []
+        try:
+            with condition:
+                while pending or slots["running"]:
+                    # first jobs first, smaller ones fill free slots
+                    for job in list(pending):
+                        if job.cpus > slots["cpus"] or \
+                                (self.memory and
+                                 job.memory > slots["memory"]):
+                            continue
+                        pending.remove(job)
+                        slots["cpus"] -= job.cpus
+                        slots["memory"] -= job.memory
+                        slots["running"] += 1
+                        job.status = "running"
+                        print("[" + job.name + "] started")
+                        thread = threading.Thread(
+                            target=self._worker,
+                            args=(job, condition, slots))
+                        thread.start()
+                        threads.append(thread)
+                    condition.wait()
+        except KeyboardInterrupt:
+            self._runner.cancel()
+            for job in pending:
+                job.status = "cancelled"
+        for thread in threads:
+            thread.join()
+        self.write_summary()
+        return all([job.status == "ok" for job in self.jobs])
+
+    def write_summary(self):
+        """ write summary.json and print jobs summary """
+        summary = [job.summary() for job in self.jobs]
+        sy.write_fragments(os.path.join(self.outdir, BATCHSUMMARYFILE),
+                           [json.dumps(summary, indent=2) + "\n"])
+        print("")
+        width = max([len(job.name) for job in self.jobs] + [3])
+        print("job".ljust(width) + "  status     time (s)  artifacts")
+        for job in self.jobs:
+            duration = job.result.duration if job.result else 0
+            print(job.name.ljust(width) + "  " + job.status.ljust(9) +
+                  "  " + ("%.1f" % duration).rjust(8) + "  " +
+                  " ".join(job.artifacts))
+        print("")
+        print("Summary written in " +
+              os.path.join(self.outdir, BATCHSUMMARYFILE) + ", logs in " +
+              os.path.join(self.outdir, "<job>" + LOGEXT))
@@ -135,6 +135,7 @@ class ConfigFile(WrapperXml):
         except AttributeError as error:
             raise PodError("No synthesis command in .podrc. (" +
                            str(error) + ")")
+        result = None
         for anode in tools:
             if (anode.get_attr_value(key="name") == synthesis_name):
                 result = anode.get_attr_value(key=value)
@@ -0,0 +1,231 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Name:     processrunner.py
+# Purpose:  Launch toolchains steps with logs, timeouts and exit codes
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+#  Copyright (2026)  agent
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place - Suite 330, Boston, MA 02111-1307, USA.
+#
+# ----------------------------------------------------------------------------
+""" Launch toolchains steps """
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+from periphondemand.bin.define import COLOR_END
+from periphondemand.bin.define import COLOR_SHELL
+from periphondemand.bin.define import LOGEXT
+
+from periphondemand.bin.utils.settings import Settings
+from periphondemand.bin.utils.poderror import PodError
+
+SETTINGS = Settings()
+
+# delay (in s) given to a process to exit once terminated before killing it
+KILL_DELAY = 5
+
+
+class StepResult(object):
+    """ Result of a step
+        attributes:
+            name        -- step name
+            args        -- command launched
+            returncode  -- exit code, None if process can't be launched
+            duration    -- wall clock duration in s
+            logfile     -- log file path, None if not logged
+            timedout    -- True if step was stopped on timeout
+            cancelled   -- True if step was cancelled
+    """
+
+    def __init__(self, name, args, logfile):
+        self.name = name
+        self.args = args
+        self.logfile = logfile
+        self.returncode = None
+        self.duration = 0.0
+        self.timedout = False
+        self.cancelled = False
+
+    @property
+    def succeeded(self):
+        """ return True if step exited with code 0 """
+        return self.returncode == 0 and \
+            not self.timedout and not self.cancelled
+
+    def __str__(self):
+        if self.timedout:
+            status = "timed out"
+        elif self.cancelled:
+            status = "cancelled"
+        else:
+            status = "exit code " + str(self.returncode)
+        return "Step " + self.name + " " + status + " after " + \
+            "%.1f" % self.duration + " s"
+
+
+class ProcessRunner(object):
+    """ Launch toolchains commands, output is streamed line by line on
+        console and in a log file per step (<logdir>/<step>.log).
+        A step taking more than timeout seconds is terminated, steps can
+        be cancelled from another thread with cancel() or with Ctrl-C.
+        Several steps may run at the same time from different threads.
+        attributes:
+            logdir   -- directory of steps logs, None to not log
+            timeout  -- default steps timeout in s, None for no timeout
+            echo     -- False to write output only in logs
+    """
+
+    def __init__(self, logdir=None, timeout=None, echo=True):
+        self.logdir = logdir
+        self.timeout = timeout
+        self.echo = echo
+        self._processes = {}
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._displaylock = threading.Lock()
+
+    def _display(self, line, tag=None):
+        """ print a line of toolchain output, prefixed by tag if given """
+        line = line.rstrip("\n")
+        if tag is not None:
+            line = tag + "> " + line
+        if SETTINGS.color() == 1:
+            line = COLOR_SHELL + line + COLOR_END
+        else:
+            line = "SHELL>" + line
+        # lines of steps running at the same time must not be mixed
+        with self._displaylock:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+    def _stop(self, process, result, reason):
+        """ terminate process, kill it if still alive after KILL_DELAY """
+        with self._lock:
+            if process.poll() is not None:
+                return
+            setattr(result, reason, True)
+        # toolchains launch sub processes keeping output open, the whole
+        # process group is stopped
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(KILL_DELAY)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            # process group already gone
+            pass
+
+    def _logfile(self, name):
+        """ return log file path of step, log directory is created """
+        if self.logdir is None:
+            return None
+        if not os.path.isdir(self.logdir):
+            os.makedirs(self.logdir)
+        return os.path.join(self.logdir, name + LOGEXT)
+
+    def run(self, name, args, stdin=None, cwd=None, timeout=None,
+            check=True, tagged=False):
+        """ launch command args (a list) as step name, stdin is the path
+            of a file given as standard input. Output lines are prefixed
+            by step name if tagged is True. Return a StepResult, raise
+            PodError on failure if check is True.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        result = StepResult(name, args, self._logfile(name))
+        if self._cancelled:
+            result.cancelled = True
+            if check:
+                raise PodError(str(result), 0)
+            return result
+        logfile = None
+        infile = None
+        start = time.time()
+        try:
+            if result.logfile is not None:
+                logfile = open(result.logfile, "w")
+                logfile.write("$ " + " ".join(args) + "\n")
+            if stdin is not None:
+                infile = open(stdin, "r")
+            process = subprocess.Popen(args, stdin=infile,
+                                       stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, cwd=cwd,
+                                       universal_newlines=True,
+                                       start_new_session=True,
+                                       errors="replace")
+        except (IOError, OSError) as error:
+            for afile in (logfile, infile):
+                if afile is not None:
+                    afile.close()
+            raise PodError("Can't launch " + name + " : " + str(error), 0)
+        with self._lock:
+            self._processes[process.pid] = (process, result)
+            cancelled = self._cancelled
+        if cancelled:
+            self._stop(process, result, "cancelled")
+        timer = None
+        if timeout:
+            timer = threading.Timer(float(timeout), self._stop,
+                                    (process, result, "timedout"))
+            timer.daemon = True
+            timer.start()
+        try:
+            for line in process.stdout:
+                if self.echo:
+                    self._display(line, name if tagged else None)
+                if logfile is not None:
+                    logfile.write(line)
+                    logfile.flush()
+            result.returncode = process.wait()
+        except KeyboardInterrupt:
+            self._stop(process, result, "cancelled")
+            result.returncode = process.wait()
+        finally:
+            if timer is not None:
+                timer.cancel()
+            with self._lock:
+                self._processes.pop(process.pid, None)
+            process.stdout.close()
+            result.duration = time.time() - start
+            if logfile is not None:
+                logfile.write(str(result) + "\n")
+                logfile.close()
+            if infile is not None:
+                infile.close()
+        if check and not result.succeeded:
+            message = str(result)
+            if result.logfile is not None:
+                message += ", see " + result.logfile
+            raise PodError(message, 0)
+        return result
+
+    def cancel(self):
+        """ cancel all running steps, steps launched afterwards are
+            cancelled too
+        """
+        with self._lock:
+            self._cancelled = True
+            running = list(self._processes.values())
+        for process, result in running:
+            self._stop(process, result, "cancelled")
@@ -33,8 +33,15 @@ from os.path import join
 from os.path import split
 from os.path import exists
 import glob
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 from periphondemand.bin.utils.poderror import PodError
 
+# ioctl to share data blocks of a file (reflink), see ioctl_ficlone(2)
+FICLONE = 0x40049409
+
 
 def inttobin(num, size):
     """ convert a number num, in binary string with length size
@@ -81,13 +88,6 @@ def check_name(name):
         raise PodError(" '_' at the end forbiden", 0)
 
 
-def launch_as_shell(shell_name, commands_file_name):
-    """ launch a shell named shell_name, with a
-    command script named commands_file_name
-    """
-    return os.popen("" + shell_name + " " + commands_file_name)
-
-
 def dir_exist(dirname):
     """ Return True if directory exists"""
     dirname = os.path.expanduser(dirname)
@@ -102,9 +102,7 @@ def file_exist(filename):
 
 def cmd_exist(commandname):
     """ test if a command exist in system """
-    ret = os.popen("which " + commandname).read()
-    ret.split()
-    if ret == "":
+    if shutil.which(os.path.expanduser(commandname)) is None:
         return 0
     else:
         return 1
@@ -120,6 +118,26 @@ def rename_file(oldfilepath, newfilepath):
                        str(oldfilepath) + " in " + str(newfilepath))
 
 
+def write_fragments(filepath, fragments):
+    """ write in filepath each string given by fragments as soon as it
+    is produced. Code is written in a temporary file renamed at end
+    then filepath is never left truncated.
+    """
+    filepath = os.path.expanduser(filepath)
+    tmpfilepath = filepath + ".tmp"
+    try:
+        with open(tmpfilepath, "w") as afile:
+            for fragment in fragments:
+                afile.write(fragment)
+    except BaseException:
+        rm_file(tmpfilepath)
+        raise
+    try:
+        os.replace(tmpfilepath, filepath)
+    except OSError as error:
+        raise PodError(str(error) + "\nwriting " + str(filepath))
+
+
 def rename_dir(olddir, newdir):
     """ Rename directory """
     olddir = os.path.expanduser(olddir)
@@ -138,8 +156,67 @@ def mkdir(name):
         raise PodError("can't make directory " + name + " :\n" + str(error))
 
 
-def cp_dir(source, target):
-    """ Copy directory
+def clone_file(source, target, hardlink=False):
+    """ Copy file source in target sharing data when possible :
+    with hardlink set, target is a hard link on source, else it's a
+    reflink (copy on write) if filesystem supports it, or a plain copy.
+    target is removed first, then an existing link is never written
+    through.
+    """
+    rm_file(target)
+    if hardlink:
+        try:
+            return os.link(source, target)
+        except OSError:
+            pass
+    if fcntl is not None:
+        try:
+            with open(source, "rb") as fsrc, open(target, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return None
+        except (IOError, OSError):
+            rm_file(target)
+    shutil.copyfile(source, target)
+
+
+def same_file_content(source, target):
+    """ return True if target exists with the same content as source,
+    size and mtime are compared first, content only when mtime differs
+    """
+    try:
+        srcstat = os.stat(source)
+        tgtstat = os.stat(target)
+    except OSError:
+        return False
+    if srcstat.st_size != tgtstat.st_size:
+        return False
+    if (srcstat.st_ino, srcstat.st_dev) == (tgtstat.st_ino, tgtstat.st_dev) \
+            or srcstat.st_mtime_ns == tgtstat.st_mtime_ns:
+        return True
+    with open(source, "rb") as fsrc, open(target, "rb") as ftgt:
+        while True:
+            srcblock = fsrc.read(1 << 16)
+            if srcblock != ftgt.read(1 << 16):
+                return False
+            if not srcblock:
+                return True
+
+
+def sync_file(source, target, hardlink=False):
+    """ clone source in target (see clone_file()) only if content
+    differs, target mtime is set to source mtime then an unchanged file
+    keeps its mtime. Return True if target has been written.
+    """
+    if same_file_content(source, target):
+        return False
+    clone_file(source, target, hardlink)
+    if not os.path.samefile(source, target):
+        shutil.copystat(source, target)
+    return True
+
+
+def cp_dir(source, target, hardlink=False):
+    """ Copy directory, files are cloned (see clone_file())
     """
     source = os.path.expanduser(source)
     target = os.path.expanduser(target)
@@ -157,7 +234,7 @@ def cp_dir(source, target):
             to_directory = split(to_)[0]
             if not exists(to_directory):
                 os.makedirs(to_directory)
-            shutil.copyfile(from_, to_)
+            clone_file(from_, to_, hardlink)
 
 
 def copy_all_files(source, target):
@@ -169,12 +246,17 @@ def copy_all_files(source, target):
         cp_file(name, target)
 
 
-def cp_file(filepath, dirpath):
-    """ Copy file from filepath to dirpath
+def cp_file(filepath, dirpath, hardlink=False):
+    """ Copy file from filepath to dirpath, file is cloned (see
+    clone_file())
     """
     filepath = os.path.expanduser(filepath)
     dirpath = os.path.expanduser(dirpath)
-    return shutil.copy(filepath, dirpath + "/")
+    target = os.path.join(dirpath, os.path.basename(filepath))
+    clone_file(filepath, target, hardlink)
+    if not hardlink or not os.path.samefile(filepath, target):
+        shutil.copymode(filepath, target)
+    return target
 
 
 def rm_dir(dirpath):
@@ -16,17 +16,27 @@
 # ----------------------------------------------------------------------------
 """ main xml object """
 
+import os
 import xml.etree.cElementTree as ET
 
 from periphondemand.bin.utils.poderror import PodError
 
+XMLHEADER = '<?xml version="1.0" encoding="utf-8"?>'
+
 
 class WrapperXml(object):
     """Simple class manage XML
         attributes:
-            tree -- root tree xml component
+            tree   -- root tree xml component
+            _dirty -- True if tree has been modified since last load/save
+            _owner -- WrapperXml that returned this node with get_nodes()
+            _wrappers -- {element: WrapperXml} wrappers returned by
+                         get_nodes(), the same element always gives the
+                         same wrapper. None until first get_nodes()
     """
 
+    __slots__ = ("parent", "tree", "void", "_owner", "_dirty", "_wrappers")
+
     def __init__(self, **args):
         """ init function,
             __init__(self,node)   # parameter is wrapperXml node
@@ -42,17 +52,24 @@ class WrapperXml(object):
             self.tree = None
         if not hasattr(self, 'void'):
             self.void = True
+        self._owner = None
+        self._wrappers = None
 
         if "node" in args:
             self.__initnode(args["node"])
+            self._dirty = False
         elif "etnode" in args:
             self.__initetnode(args["etnode"])
+            self._dirty = False
         elif "nodename" in args:
             self.__initnodename(args["nodename"])
+            self._dirty = True
         elif "nodestring" in args:
             self.__initnodestring(args["nodestring"])
+            self._dirty = True
         elif "file" in args:
             self.__initfile(args["file"])
+            self._dirty = False
         else:
             raise PodError("Keys unknown in WrapperXml", 0)
 
@@ -83,7 +100,7 @@ class WrapperXml(object):
             raise PodError("XML malformed :\n" + str(error), 0)
 
     def __str__(self):
-        return ('<?xml version="1.0" encoding="utf-8"?>\n' +
+        return (XMLHEADER + "\n" +
                 ET.tostring(self.tree, "utf-8").decode("utf-8"))
 
     @property
@@ -101,6 +118,36 @@ class WrapperXml(object):
         """ set node's text content
         """
         self.tree.text = text
+        self.set_dirty()
+
+    @property
+    def is_dirty(self):
+        """ Return True if node has been modified since last load/save """
+        return self._dirty
+
+    @property
+    def dirty_parent(self):
+        """ Return the node to be marked dirty when this one is modified,
+            None if this node is saved in its own file
+        """
+        if self._owner is not None:
+            return self._owner
+        if isinstance(self.parent, WrapperXml):
+            return self.parent
+        return None
+
+    def set_dirty(self):
+        """ Mark this node and all its parents up to the saved file
+            as modified
+        """
+        node = self
+        while node is not None:
+            node._dirty = True
+            node = node.dirty_parent
+
+    def set_clean(self):
+        """ Mark node as saved """
+        self._dirty = False
 
     def get_subnodes(self, nodename, subnodename):
         """ Return a list of subnodes
@@ -113,20 +160,27 @@ class WrapperXml(object):
         except AttributeError:
             return []
 
+    def _wrap(self, element):
+        """ Return the wrapper of element, created on first call """
+        if self._wrappers is None:
+            self._wrappers = {}
+        wrapper = self._wrappers.get(element)
+        if wrapper is None:
+            wrapper = WrapperXml(etnode=element)
+            wrapper._owner = self
+            self._wrappers[element] = wrapper
+        return wrapper
+
     def get_nodes(self, nodename):
         """ Return a list of nodes """
-        nodelist = []
-        for node in self.tree.findall(nodename):
-            tmp = WrapperXml(etnode=node)
-            nodelist.append(tmp)
-        return nodelist
+        return [self._wrap(node) for node in self.tree.findall(nodename)]
 
     def get_node(self, nodename):
         """ return the first node found """
-        try:
-            return self.get_nodes(nodename)[0]
-        except IndexError:
+        node = self.tree.find(nodename)
+        if node is None:
             return None
+        return self._wrap(node)
 
     def add_subnode(self, **keys):
         """ Add a subnode in the object tree
@@ -180,6 +234,7 @@ class WrapperXml(object):
             self.tree.append(node.tree)
         except AttributeError:  # if tree doesn't exits
             self.tree = node.tree
+        self.set_dirty()
         return node
 
     def del_node(self, node, attribute=None, value=None):
@@ -193,10 +248,10 @@ class WrapperXml(object):
             for element in self.get_nodes(nodename):
                 if(element.tree.tag == nodename):
                     if attribute is None:
-                        self.tree.remove(element.tree)
+                        self._del_element(element.tree)
                     elif (type(attribute) == str) and\
                             (element.get_attr_value(attribute) == value):
-                        self.tree.remove(element.tree)
+                        self._del_element(element.tree)
                     elif type(attribute) == dict:
                         match = 1
                         for key in attribute:
@@ -204,9 +259,16 @@ class WrapperXml(object):
                                     attribute[key]:
                                 match = 0
                         if match == 1:
-                            self.tree.remove(element.tree)
+                            self._del_element(element.tree)
         else:
-            self.tree.remove(node.tree)
+            self._del_element(node.tree)
+        self.set_dirty()
+
+    def _del_element(self, element):
+        """ remove element from tree and forget its wrapper """
+        self.tree.remove(element)
+        if self._wrappers is not None:
+            self._wrappers.pop(element, None)
 
     def del_subnode(self, nodename, subnodename, attribute=None, value=None):
         """ Delete a subnode """
@@ -239,12 +301,16 @@ class WrapperXml(object):
     def set_attr(self, key, value, subname=None):
         """ set an attribute value """
         if subname is None:
-            self.tree.attrib[key] = value
+            if self.tree.get(key) != value:
+                self.tree.attrib[key] = value
+                self.set_dirty()
             return value
         else:
             if self.tree.find(subname) is None:
                 ET.SubElement(self.tree, subname)
-            self.tree.find(subname).attrib[key] = value
+            if self.tree.find(subname).get(key) != value:
+                self.tree.find(subname).attrib[key] = value
+                self.set_dirty()
             return value
 
     @property
@@ -259,10 +325,13 @@ class WrapperXml(object):
     def description(self, description):
         """ set description """
         if self.tree.find("description") is not None:
+            if self.tree.find("description").text == description:
+                return description
             self.tree.find("description").text = description
         else:
             desc = ET.SubElement(self.tree, "description")
             desc.text = description
+        self.set_dirty()
         return description
 
     @property
@@ -309,29 +378,38 @@ class WrapperXml(object):
             except SyntaxError as error:
                 raise PodError("Xml malformed in " +
                                filename + " : \n" + str(error))
+            self._wrappers = None
         else:
             try:
                 xmlfile = open(filename, 'r')
             except IOError as error:
                 raise PodError(str(error), 0)
             content =\
-                xmlfile.read().replace(
-                    r'<?xml version="1.0" encoding="utf-8"?>', '')
+                xmlfile.read().replace(XMLHEADER, '')
             try:
                 self.tree = ET.fromstring(content)
             except SyntaxError as error:
                 raise PodError("Xml malformed in " +
                                filename + " :\n" + str(error))
+            self._wrappers = None
+            self.set_clean()
 
     def create_xml(self, tag):
         """ create xml with tag as top"""
         self.tree = ET.Element(tag)
+        self._wrappers = None
+        self.set_dirty()
 
     def save_xml(self, pathname):
-        """ save xml in file """
-        fxml = open(pathname, "w")
+        """ save xml in file, file is written in a temporary file
+            then renamed to never leave a truncated file
+        """
+        tmppathname = pathname + ".tmp"
+        fxml = open(tmppathname, "w")
         fxml.write(str(self))
         fxml.close()
+        os.replace(tmppathname, pathname)
+        self.set_clean()
 
     @property
     def num(self):
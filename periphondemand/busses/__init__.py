@@ -0,0 +1,3 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+""" Busses definitions and intercon generators """
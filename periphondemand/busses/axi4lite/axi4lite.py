@@ -524,17 +524,18 @@ def architecture_foot(intercon):
     return out
 
 
-def generate_intercon(masterinterface, intercon):
-    """Generate intercon VHDL code for axi4lite bus
+def intercon_code(masterinterface, intercon):
+    """ Generate intercon VHDL code for axi4lite bus, code is
+    yielded section by section
     """
     masterinstance = masterinterface.parent
 
     # comment and header
-    vhdl_code = header(SETTINGS.author, intercon)
+    yield header(SETTINGS.author, intercon)
     # entity
-    vhdl_code += entity(intercon)
-    vhdl_code += architecture_head(masterinterface, intercon)
-    vhdl_code += gen_case_byte_enable(masterinterface)
+    yield entity(intercon)
+    yield architecture_head(masterinterface, intercon)
+    yield gen_case_byte_enable(masterinterface)
 
     listslave = masterinterface.slaves
     listinterfacesyscon = []
@@ -542,31 +543,29 @@ def generate_intercon(masterinterface, intercon):
         listinterfacesyscon.append(slaveinstance.get_one_syscon())
     listinterfacesyscon.append(masterinstance.get_one_syscon())
     # Clock and Reset connection
-    vhdl_code += connect_clock_and_reset(masterinterface)
+    yield connect_clock_and_reset(masterinterface)
     # address decoding
-    vhdl_code += addressdecoding(masterinterface, masterinstance)
+    yield addressdecoding(masterinterface, masterinstance)
     # controls slaves
-    vhdl_code += controlslave(masterinterface)
+    yield controlslave(masterinterface)
     # controls master
-    vhdl_code += controlmaster(masterinterface)
+    yield controlmaster(masterinterface)
     # Foot
-    vhdl_code += architecture_foot(intercon)
+    yield architecture_foot(intercon)
+
+
+def generate_intercon(masterinterface, intercon):
+    """Generate intercon VHDL code for axi4lite bus
+    """
+    hdlpath = SETTINGS.projectpath + COMPONENTSPATH + "/" + \
+        intercon.instancename + "/" + HDLDIR
     # saving
-    if not sy.dir_exist(SETTINGS.projectpath +
-                        COMPONENTSPATH + "/" +
-                        intercon.instancename + "/" + HDLDIR):
-        sy.mkdir(SETTINGS.projectpath +
-                 COMPONENTSPATH + "/" +
-                 intercon.instancename + "/" + HDLDIR)
-    afile = open(SETTINGS.projectpath + COMPONENTSPATH + "/" +
-                 intercon.instancename +
-                 "/" + HDLDIR + "/" + intercon.instancename + VHDLEXT,
-                 "w")
-    afile.write(vhdl_code)
-    afile.close()
+    if not sy.dir_exist(hdlpath):
+        sy.mkdir(hdlpath)
+    sy.write_fragments(hdlpath + "/" + intercon.instancename + VHDLEXT,
+                       intercon_code(masterinterface, intercon))
     # hdl file path
     hdl = HdlFile(intercon,
                   filename=intercon.instancename + VHDLEXT,
                   istop=1, scope="both")
     intercon.add_hdl_file(hdl)
-    return vhdl_code
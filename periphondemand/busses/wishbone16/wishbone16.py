@@ -377,18 +377,17 @@ def architectureFoot(intercon):
         return out
 
 
-def generate_intercon(masterinterface, intercon):
-    """Generate intercon VHDL code for wishbone16 bus
+def intercon_code(masterinterface, intercon):
+    """ Generate intercon VHDL code for wishbone16 bus, code is
+    yielded section by section
     """
     masterinstance = masterinterface.parent
-    project = masterinstance.parent
 
     # comment and header
-    VHDLcode = header(SETTINGS.author, intercon)
+    yield header(SETTINGS.author, intercon)
     # entity
-    VHDLcode = VHDLcode + entity(intercon)
-    VHDLcode = VHDLcode + architectureHead(masterinterface, intercon)
-
+    yield entity(intercon)
+    yield architectureHead(masterinterface, intercon)
     listslave = masterinterface.slaves
     listinterfacesyscon = []
     for slaveinstance in [slave.get_instance() for slave in listslave]:
@@ -396,36 +395,29 @@ def generate_intercon(masterinterface, intercon):
     listinterfacesyscon.append(masterinstance.get_one_syscon())
 
     # Clock and Reset connection
-    VHDLcode = VHDLcode + connectClockandReset(masterinterface,
-                                               intercon)
-
+    yield connectClockandReset(masterinterface, intercon)
     # address decoding
-    VHDLcode = VHDLcode + addressdecoding(masterinterface,
-                                          masterinstance, intercon)
+    yield addressdecoding(masterinterface, masterinstance, intercon)
     # controls slaves
-    VHDLcode = VHDLcode + controlslave(masterinterface, intercon)
+    yield controlslave(masterinterface, intercon)
     # controls master
-    VHDLcode = VHDLcode + controlmaster(masterinterface, intercon)
-
+    yield controlmaster(masterinterface, intercon)
     # Foot
-    VHDLcode = VHDLcode + architectureFoot(intercon)
+    yield architectureFoot(intercon)
 
+
+def generate_intercon(masterinterface, intercon):
+    """Generate intercon VHDL code for wishbone16 bus
+    """
+    hdlpath = SETTINGS.projectpath + COMPONENTSPATH + "/" + \
+        intercon.instancename + "/" + HDLDIR
     # saving
-    if not sy.dir_exist(SETTINGS.projectpath +
-                        COMPONENTSPATH + "/" +
-                        intercon.instancename + "/" + HDLDIR):
-        sy.mkdir(SETTINGS.projectpath +
-                 COMPONENTSPATH + "/" +
-                 intercon.instancename + "/" + HDLDIR)
-    afile = open(SETTINGS.projectpath + COMPONENTSPATH + "/" +
-                 intercon.instancename +
-                 "/" + HDLDIR + "/" + intercon.instancename + VHDLEXT,
-                 "w")
-    afile.write(VHDLcode)
-    afile.close()
+    if not sy.dir_exist(hdlpath):
+        sy.mkdir(hdlpath)
+    sy.write_fragments(hdlpath + "/" + intercon.instancename + VHDLEXT,
+                       intercon_code(masterinterface, intercon))
     # hdl file path
     hdl = HdlFile(intercon,
                   filename=intercon.instancename + VHDLEXT,
                   istop=1, scope="both")
     intercon.add_hdl_file(hdl)
-    return VHDLcode
@@ -36,8 +36,6 @@ from periphondemand.bin.define import BINARYPROJECTPATH
 from periphondemand.bin.define import UCFEXT
 from periphondemand.bin.define import XILINX_BITSTREAM_SUFFIX
 from periphondemand.bin.define import XILINX_BINARY_SUFFIX
-from periphondemand.bin.define import COLOR_SHELL
-from periphondemand.bin.define import COLOR_END
 
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils import wrappersystem as sy
@@ -208,16 +206,9 @@ class Ise(Synthesis):
         commandname = self.synthesis_toolcommandname
         scriptpath = os.path.join(self.parent.projectpath + SYNTHESISPATH,
                                   self.tcl_scriptname)
-        pwd = sy.pwd()
         sy.del_all(self.project.projectpath + OBJSPATH)
-        sy.chdir(self.project.projectpath + SYNTHESISPATH)
-        commandname = commandname + " < "
 
-        for line in sy.launch_as_shell(commandname, scriptpath):
-            if SETTINGS.color() == 1:
-                print(COLOR_SHELL + line + COLOR_END),
-            else:
-                print("SHELL>" + line),
+        self.run_step("xtclsh", [commandname], stdin=scriptpath)
         for ext_file in self.ext_files:
             try:
                 sy.cp_file(self.project.projectpath + OBJSPATH + "/" +
@@ -226,4 +217,3 @@ class Ise(Synthesis):
                            self.project.projectpath + BINARYPROJECTPATH + "/")
             except IOError:
                 raise PodError("Can't copy bitstream")
-        sy.chdir(pwd)
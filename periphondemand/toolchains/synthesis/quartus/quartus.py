@@ -30,8 +30,6 @@ import os
 from periphondemand.bin.define import SYNTHESISPATH
 from periphondemand.bin.define import TCLEXT
 from periphondemand.bin.define import OBJSPATH
-from periphondemand.bin.define import COLOR_SHELL
-from periphondemand.bin.define import COLOR_END
 from periphondemand.bin.define import BINARY_PREFIX
 from periphondemand.bin.define import ALTERA_BITSTREAM_SUFFIX
 from periphondemand.bin.define import ALTERA_BINARY_SUFFIX
@@ -76,6 +74,13 @@ class Quartus(Synthesis):
                 list_qsys_comp.append(component)
         return list_qsys_comp
 
+    def build_scripts(self):
+        """ return qsys scripts, .qsys files are generated from them
+            while building
+        """
+        return [component.name + "_qsys" + TCLEXT
+                for component in self.needqsys()]
+
     def generate_qsys_script(self, component):
         """ Generate block design script """
         project_name = component.name + "_qsys"
@@ -392,16 +397,6 @@ class Quartus(Synthesis):
         out += "project_close\n"
         return out
 
-    @classmethod
-    def launch_as_shell(cls, commandname, option):
-        """ Display messages from toolchain
-        """
-        for line in sy.launch_as_shell(commandname, option):
-            if SETTINGS.color() == 1:
-                print(COLOR_SHELL + line + COLOR_END),
-            else:
-                print("SHELL>" + line),
-
     def generate_bitstream(self):
         """ generate the bitstream """
         commandname = self.synthesis_toolcommandname
@@ -422,10 +417,7 @@ class Quartus(Synthesis):
             self.project.projectpath + BINARYPROJECTPATH,
             BINARY_PREFIX + self.project.name + ALTERA_BINARY_SUFFIX)
 
-        pwd = sy.pwd()
         sy.del_all(self.project.projectpath + OBJSPATH)
-        sy.chdir(self.project.projectpath + SYNTHESISPATH)
-        commandname = commandname + " -t "
 
         list_qsys_comp = self.needqsys()
         if len(list_qsys_comp):
@@ -437,27 +429,24 @@ class Quartus(Synthesis):
             else:
                 qsys_commandname = self.QSYS_SCRIPT
 
-            for component in list_qsys_comp:
-                self.launch_as_shell(
-                    qsys_commandname,
-                    " --script=" +
-                    os.path.join(self.project.projectpath +
-                                 "/" + SYNTHESISPATH,
-                                 component.name + "_qsys.tcl"))
-
-        self.launch_as_shell(commandname, scriptpath)
-
-        try:
-            output_format = self.project.platform.output_format
-            commandarg = "-c " + result_file + " " + cnv_result_file
-            if output_format == "cvp":
-                self.launch_as_shell(rbf_commandname, "--cvp " + commandarg)
-            elif output_format == "rbf":
-                self.launch_as_shell(rbf_commandname, commandarg)
-            elif output_format == "rbfComp":
-                self.launch_as_shell(rbf_commandname,
-                                     "--option=bitstream_compression=on " +
-                                     commandarg)
-        except IOError:
-            raise PodError("Can't copy bitstream")
-        sy.chdir(pwd)
+            # each qsys system is generated on its own
+            self.run_steps([(component.name + "_qsys",
+                             [qsys_commandname,
+                              "--script=" +
+                              os.path.join(self.project.projectpath +
+                                           "/" + SYNTHESISPATH,
+                                           component.name + "_qsys.tcl")])
+                            for component in list_qsys_comp])
+
+        self.run_step("quartus", [commandname, "-t", scriptpath])
+
+        output_format = self.project.platform.output_format
+        commandarg = ["-c", result_file, cnv_result_file]
+        if output_format == "cvp":
+            self.run_step("rbf", [rbf_commandname, "--cvp"] + commandarg)
+        elif output_format == "rbf":
+            self.run_step("rbf", [rbf_commandname] + commandarg)
+        elif output_format == "rbfComp":
+            self.run_step("rbf", [rbf_commandname,
+                                  "--option=bitstream_compression=on"] +
+                          commandarg)
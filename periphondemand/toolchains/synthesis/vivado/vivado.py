@@ -31,6 +31,7 @@
 """ Manage Vivado toolchain """
 
 import os
+import subprocess
 
 from periphondemand.bin.define import BINARYPROJECTPATH
 from periphondemand.bin.define import BINARY_PREFIX
@@ -40,8 +41,6 @@ from periphondemand.bin.define import VHDLEXT
 from periphondemand.bin.define import TCLEXT
 from periphondemand.bin.define import XILINX_BITSTREAM_SUFFIX
 from periphondemand.bin.define import XILINX_BINARY_SUFFIX
-from periphondemand.bin.define import COLOR_END
-from periphondemand.bin.define import COLOR_SHELL
 
 from periphondemand.bin.utils.settings import Settings
 from periphondemand.bin.utils.poderror import PodError
@@ -49,9 +48,11 @@ from periphondemand.bin.utils.display import Display
 from periphondemand.bin.utils import wrappersystem as sy
 
 from periphondemand.bin.toolchain.synthesis import Synthesis
+from periphondemand.bin.toolchain.toolprobe import ToolProbe
 
 
 SETTINGS = Settings()
+TOOLPROBE = ToolProbe()
 DISPLAY = Display()
 
 
@@ -63,18 +64,31 @@ class Vivado(Synthesis):
     SYNTH_CMD = "vivado"
     name = "vivado"
 
-    def __init__(self, parent):
-        """ constructor
-        """
-        Synthesis.__init__(self, parent)
+    @classmethod
+    def probe_version(cls, commandpath):
+        """ return (version, base version) given by vivado -version """
+        try:
+            out = subprocess.check_output([commandpath, "-version"],
+                                          universal_newlines=True)
+            version = out.split("\n")[0].split(" ")[1][1:]
+        except (OSError, subprocess.CalledProcessError, IndexError) as error:
+            raise PodError("Can't get version of " + commandpath + " : " +
+                           str(error), 0)
+        return (version, version.split(".")[0])
 
-        tool = self.synthesis_toolcommandname
-        command = "-version"
+    @property
+    def version(self):
+        """ return vivado version, vivado is launched only when its
+            executable changed since the last time
+        """
+        return TOOLPROBE.probe(self.synthesis_toolcommandname,
+                               self.probe_version)["version"]
 
-        cont = []
-        cont = list(os.popen(tool + " " + command))
-        self.version = cont[0].split(" ")[1][1:]
-        self.base_version = self.version.split(".")[0]
+    @property
+    def base_version(self):
+        """ return vivado major version """
+        return TOOLPROBE.probe(self.synthesis_toolcommandname,
+                               self.probe_version)["base_version"]
 
     @classmethod
     def constraints_file_extension(cls):
@@ -91,6 +105,11 @@ class Vivado(Synthesis):
                 list_bd_comp.append(component)
         return list_bd_comp
 
+    def build_scripts(self):
+        """ return block designs scripts """
+        return [component.name + "_bd" + TCLEXT
+                for component in self.need_block_design()]
+
     def generate_block_design(self, component):
         """ Generate the block design file for xilinx fpga """
 
@@ -573,20 +592,33 @@ class Vivado(Synthesis):
 
         if len(list_bd_comp):
             for component in list_bd_comp:
-                out += "generate_target all [get_files " + \
-                    "./" + proj_name + ".srcs/sources_1/bd/" + \
-                    component.name + "_bd/" + component.name + "_bd.bd]\n"
+                bd_file = "[get_files ./" + proj_name + \
+                    ".srcs/sources_1/bd/" + component.name + "_bd/" + \
+                    component.name + "_bd.bd]"
+                out += "generate_target all " + bd_file + "\n"
+                if self.ooc_block_design:
+                    # block designs IP are synthesized out of context, in
+                    # parallel with synth_1 -jobs
+                    out += "create_ip_run " + bd_file + "\n"
         return out
 
-    @classmethod
-    def insert_tools_gen_cmds(cls):
+    @property
+    def ooc_block_design(self):
+        """ return True if block designs are synthesized out of context,
+            enabled with ooc_block_design="true" for the tool in .podrc.
+            Block designs are synthesized with the design by default.
+        """
+        return self.get_synthesis_value("ooc_block_design") == "true"
+
+    def insert_tools_gen_cmds(self):
         """ return lines for bitstream generation
         """
-        out = "launch_runs synth_1\n"
+        jobs = " -jobs " + str(self.workers)
+        out = "launch_runs synth_1" + jobs + "\n"
         out += "wait_on_run synth_1\n"
 
         out += "## do implementation\n"
-        out += "launch_runs impl_1\n"
+        out += "launch_runs impl_1" + jobs + "\n"
         out += "wait_on_run impl_1\n"
 
         out += "## make bit file\n"
@@ -608,20 +640,14 @@ class Vivado(Synthesis):
         scriptpath = os.path.join(self.parent.projectpath + SYNTHESISPATH,
                                   self.tcl_scriptname)
 
-        pwd = sy.pwd()
         sy.del_all(self.project.projectpath + OBJSPATH)
-        sy.chdir(self.project.projectpath + SYNTHESISPATH)
 
-        commandname += " -mode tcl"
-        scriptname = "-source " + scriptpath + " -tclargs build"
         binpath = self.project.projectpath + OBJSPATH + "/" + \
             self.project.name + ".runs/impl_1/"
 
-        for line in sy.launch_as_shell(commandname, scriptname):
-            if SETTINGS.color() == 1:
-                print(COLOR_SHELL + line + COLOR_END),
-            else:
-                print("SHELL>" + line),
+        self.run_step("vivado", [commandname, "-mode", "tcl",
+                                 "-source", scriptpath,
+                                 "-tclargs", "build"])
         for ext_file in self.ext_files:
             try:
                 sy.cp_file(binpath + BINARY_PREFIX + self.project.name +
@@ -629,4 +655,3 @@ class Vivado(Synthesis):
                            self.project.projectpath + BINARYPROJECTPATH + "/")
             except IOError:
                 raise PodError("Can't copy bitstream")
-        sy.chdir(pwd)
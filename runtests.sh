@@ -4,6 +4,24 @@ rm -rf .coverage
 rm -rf coverage.xml
 python3-coverage run -a --source periphondemand --branch units_tests/test_project.py
 python3-coverage run -a --source periphondemand --branch units_tests/test_port.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_component.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_interface.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_bus.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_topgen.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_wrappersystem.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_connectiongraph.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_componentproxy.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_wrapperxml.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_snapshot.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_catalog.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_library.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_synthesis.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_buildcache.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_processrunner.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_sqlitestore.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_hdlstore.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_batch.py
+python3-coverage run -a --source periphondemand --branch units_tests/test_toolprobe.py
 python3-coverage run -a --source periphondemand --branch functionals_tests/test_launcher.py
 python3 -m coverage xml
 python3 -m coverage html
@@ -0,0 +1,97 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" Small projects written on disk for units tests, without library
+"""
+
+import os
+
+from periphondemand.bin.core.project import Project
+
+INSTANCE = """<?xml version="1.0" encoding="utf-8"?>
+<component name="{component}" version="{component}" num="0" \
+instance_name="{instance}">
+  <interfaces>
+    <interface name="io" class="gls">
+      <ports>
+{ports}
+      </ports>
+    </interface>
+  </interfaces>
+</component>"""
+
+PORT = """        <port name="{name}" dir="{direction}" size="{size}" />"""
+
+PLATFORM = """<platform name="{name}" instance_name="{name}">
+  <interfaces>
+    <interface name="fpga" class="gls">
+      <ports>
+{ports}
+      </ports>
+    </interface>
+  </interfaces>
+</platform>"""
+
+PROJECT = """<?xml version="1.0" encoding="utf-8"?>
+<project name="{name}" version="1.0"><description>insert a description \
+here</description><components>{components}\
+</components>{platform}</project>"""
+
+
+def ports_xml(ports):
+    """ return XML of ports given as [(port, direction, size)] """
+    return "\n".join([PORT.format(name=port, direction=direction, size=size)
+                      for port, direction, size in ports])
+
+
+def write_project(projectpath, instances, name="test", platform=None):
+    """ write project with instances given as {instancename: [(port,
+        direction, size)]}, ports are in interface "io". If platform
+        ports are given, the project has platform "board" with these
+        ports in interface "fpga". Return project XML file path.
+    """
+    for instancename, ports in sorted(instances.items()):
+        write_instance(projectpath, instancename, INSTANCE.format(
+            component=instancename + "_comp", instance=instancename,
+            ports=ports_xml(ports)))
+    components = ['<component name="' + instancename + '" />'
+                  for instancename in sorted(instances)]
+    platformxml = ""
+    if platform is not None:
+        components.insert(0, '<component name="board" platform="true" />')
+        platformxml = PLATFORM.format(name="board",
+                                      ports=ports_xml(platform))
+    filename = os.path.join(projectpath, name + ".xml")
+    with open(filename, "w") as afile:
+        afile.write(PROJECT.format(name=name,
+                                   components="".join(components),
+                                   platform=platformxml))
+    return filename
+
+
+def write_instance(projectpath, instancename, xml):
+    """ write XML file of instance, replacing the one written by
+        write_project()
+    """
+    dirname = os.path.join(projectpath, "components", instancename)
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    with open(os.path.join(dirname, instancename + ".xml"), "w") as afile:
+        afile.write(xml)
+
+
+def get_port(project, instancename, portname):
+    """ return port of interface "io" of instance """
+    return project.get_instance(instancename).get_interface(
+        "io").get_port(portname)
+
+
+def load_project(filename, **keys):
+    """ load project written by write_project() """
+    return Project(filename, **keys)
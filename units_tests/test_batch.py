@@ -0,0 +1,96 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_batch
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import json
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.batch import Batch
+
+
+class test_batch(unittest.TestCase):
+    """ unit tests bin.utils.batch.py
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.template = os.path.join(self.tmpdir, "tpl.pod")
+        with open(self.template, "w") as afile:
+            afile.write("# $board $freq\n")
+        self.batch = Batch(os.path.join(self.tmpdir, "batch"), cpus=2,
+                           memory=1024)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write_matrix(self, matrix):
+        """ write matrix file, return its path """
+        filename = os.path.join(self.tmpdir, "matrix.json")
+        with open(filename, "w") as afile:
+            json.dump(matrix, afile)
+        return filename
+
+    def test_add_matrix(self):
+        """ a job is added for each combination """
+        jobs = self.batch.add_matrix(self.write_matrix(
+            {"script": "tpl.pod",
+             "parameters": {"board": ["apf27", "apf51"],
+                            "freq": [100, 133]},
+             "cpus": 2}))
+        self.assertEqual([job.name for job in jobs],
+                         ["tpl_board-apf27_freq-100",
+                          "tpl_board-apf27_freq-133",
+                          "tpl_board-apf51_freq-100",
+                          "tpl_board-apf51_freq-133"])
+        self.assertEqual(jobs[0].cpus, 2)
+        with open(jobs[-1].script, "r") as afile:
+            self.assertEqual(afile.read(), "# apf51 133\n")
+
+    def test_wrong_matrix(self):
+        """ wrong matrix files raise PodError """
+        for matrix in ({"parameters": {}},
+                       {"script": "tpl.pod", "parameters": ["board"]},
+                       {"script": "tpl.pod", "parameters": {"board": 1}},
+                       {"script": "tpl.pod", "cpus": "many"},
+                       ["tpl.pod"]):
+            with self.assertRaises(PodError):
+                self.batch.add_matrix(self.write_matrix(matrix))
+        with self.assertRaises(PodError):
+            self.batch.add_matrix(os.path.join(self.tmpdir, "missing"))
+        self.assertEqual(self.batch.jobs, [])
+
+    def test_missing_parameter(self):
+        """ a parameter of template missing in matrix raises PodError """
+        with self.assertRaises(PodError):
+            self.batch.add_matrix(self.write_matrix(
+                {"script": "tpl.pod", "parameters": {"board": ["apf27"]}}))
+
+    def test_add_script(self):
+        """ jobs names are unique """
+        self.assertEqual(self.batch.add_script(self.template).name, "tpl")
+        self.assertEqual(self.batch.add_script(self.template).name,
+                         "tpl_2")
+        with self.assertRaises(PodError):
+            self.batch.add_script(os.path.join(self.tmpdir, "missing.pod"))
+
+
+if __name__ == "__main__":
+    print("test_batch class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
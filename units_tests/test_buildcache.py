@@ -0,0 +1,89 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_buildcache
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.toolchain.buildcache import BuildCache
+
+
+class test_buildcache(unittest.TestCase):
+    """ unit tests bin.toolchain.buildcache.py
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = BuildCache(os.path.join(self.tmpdir, "cache"))
+        self.inputs = [("top.vhd", self.write("top.vhd", "entity top\n")),
+                       ("test.tcl", self.write("test.tcl", "xst\n"))]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, content):
+        """ write a file in temporary directory, return its path """
+        filepath = os.path.join(self.tmpdir, name)
+        with open(filepath, "w") as afile:
+            afile.write(content)
+        return filepath
+
+    def test_key(self):
+        """ key depends on inputs names and content, and on toolchain """
+        key = BuildCache.key(self.inputs, "ise 14.7")
+        self.assertEqual(BuildCache.key(list(reversed(self.inputs)),
+                                        "ise 14.7"), key)
+        self.assertNotEqual(BuildCache.key(self.inputs, "ise 14.6"), key)
+        self.assertNotEqual(BuildCache.key(self.inputs[:1], "ise 14.7"), key)
+        self.write("top.vhd", "entity top2\n")
+        self.assertNotEqual(BuildCache.key(self.inputs, "ise 14.7"), key)
+
+    def test_store_restore(self):
+        """ stored files are restored as a whole """
+        key = BuildCache.key(self.inputs, "ise")
+        outdir = os.path.join(self.tmpdir, "objs")
+        os.mkdir(outdir)
+        self.assertEqual(self.cache.restore(key, outdir), None)
+        self.assertTrue(self.cache.store(key, [
+            self.write("top.bit", "bit"), self.write("top.bin", "bin")]))
+        self.assertEqual(self.cache.restore(key, outdir),
+                         ["top.bin", "top.bit"])
+        with open(os.path.join(outdir, "top.bit"), "r") as afile:
+            self.assertEqual(afile.read(), "bit")
+
+    def test_store_missing(self):
+        """ storing a missing file fails without leaving an entry """
+        self.assertFalse(self.cache.store("key", [
+            os.path.join(self.tmpdir, "missing.bit")]))
+        self.assertEqual(os.listdir(self.cache.root), [])
+
+    def test_evict(self):
+        """ least recently used entries are evicted first """
+        self.cache.maxsize = 10
+        self.cache.store("old", [self.write("old.bit", "12345")])
+        os.utime(os.path.join(self.cache.root, "old"), (0, 0))
+        self.cache.store("new", [self.write("new.bit", "12345")])
+        self.cache.store("newer", [self.write("newer.bit", "12345")])
+        self.assertEqual(sorted(os.listdir(self.cache.root)),
+                         ["new", "newer"])
+
+
+if __name__ == "__main__":
+    print("test_buildcache class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,82 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_bus
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+from mock import patch
+from types import SimpleNamespace
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.core.bus import Bus, BusRegistry
+
+
+class test_bus(unittest.TestCase):
+    """ unit tests bin.core.bus.py
+    """
+
+    def test_get_bus(self):
+        """ bus XML file is parsed once, with its signal names table """
+        registry = BusRegistry()
+        tree, signames = registry.get_bus("wishbone16")
+        self.assertTrue(registry.get_bus("wishbone16")[0] is tree)
+        self.assertEqual(signames[("master", "address")], "ADR")
+        self.assertEqual(signames[("slave", "dataout")], "DAT_O")
+
+    def test_missing_bus(self):
+        """ an unknown bus raises PodError """
+        with self.assertRaises(PodError):
+            BusRegistry().get_bus("missing")
+
+    def test_bus(self):
+        """ bus objects share the same tree """
+        bus = Bus(None, "wishbone16")
+        self.assertTrue(Bus(None, "wishbone16").tree is bus.tree)
+        self.assertEqual(bus.data_size, "16")
+        self.assertEqual(bus.sig_name("slave", "write"), "WE")
+        self.assertEqual(bus.sig_name("slave", "missing"), None)
+
+    def test_get_plugin(self):
+        """ default plugin is imported once from busses package, without
+            changing sys.path
+        """
+        registry = BusRegistry()
+        syspath = list(sys.path)
+        plugin = registry.get_plugin("wishbone16")
+        self.assertEqual(plugin.__name__,
+                         "periphondemand.busses.wishbone16.wishbone16")
+        self.assertTrue(registry.get_plugin("wishbone16") is plugin)
+        self.assertEqual(sys.path, syspath)
+
+    def test_missing_plugin(self):
+        """ a bus without plugin raises PodError """
+        with self.assertRaises(PodError):
+            BusRegistry().get_plugin("missing")
+
+    def test_register_plugin(self):
+        """ a registered plugin generates intercons of its bus """
+        calls = []
+        registry = BusRegistry()
+        registry.register_plugin("wishbone16", SimpleNamespace(
+            generate_intercon=lambda master, intercon:
+            calls.append((master, intercon))))
+        with patch("periphondemand.bin.core.bus.BUSREGISTRY", registry):
+            Bus("master", "wishbone16").generate_intercon("intercon")
+        self.assertEqual(calls, [("master", "intercon")])
+
+
+if __name__ == "__main__":
+    print("test_bus class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
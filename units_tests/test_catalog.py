@@ -0,0 +1,124 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_catalog
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.core.catalog import Catalog
+
+GPIO = """<?xml version="1.0" encoding="utf-8"?>
+<component name="gpio" version="gpio">
+<interfaces>
+<interface name="swb16" class="slave" bus="wishbone16" />
+<interface name="gpio" class="gls" />
+</interfaces>
+</component>"""
+
+
+class test_catalog(unittest.TestCase):
+    """ unit tests bin.core.catalog.py
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.library = os.path.join(self.tmpdir, "lib")
+        componentpath = os.path.join(self.library, "gpio")
+        os.makedirs(componentpath)
+        with open(os.path.join(componentpath, "gpio.xml"), "w") as afile:
+            afile.write(GPIO)
+        # recently modified entries aren't kept in catalog
+        for path in (os.path.join(componentpath, "gpio.xml"),
+                     componentpath, self.library):
+            os.utime(path, (0, 0))
+        self.filename = os.path.join(self.tmpdir, "cache", "catalog.json")
+        self.catalog = Catalog(self.filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_list(self):
+        """ library content is listed """
+        self.assertEqual(self.catalog.list_dir(self.library), ["gpio"])
+        componentpath = os.path.join(self.library, "gpio")
+        self.assertEqual(self.catalog.list_versions(componentpath),
+                         ["gpio"])
+
+    def test_save(self):
+        """ catalog is written without leaving temporary file, then
+            read by another catalog
+        """
+        self.catalog.list_dir(self.library)
+        self.assertEqual(os.listdir(os.path.dirname(self.filename)),
+                         ["catalog.json"])
+        catalog = Catalog(self.filename)
+        shutil.rmtree(os.path.join(self.library, "gpio"))
+        # library mtime is unchanged, its listing comes from catalog
+        os.utime(self.library, (0, 0))
+        self.assertEqual(catalog.list_dir(self.library), ["gpio"])
+
+    def test_invalidate(self):
+        """ a directory is listed again when its mtime changed """
+        catalog = Catalog(self.filename)
+        catalog.list_versions(os.path.join(self.library, "gpio"))
+        catalog.list_dir(self.library)
+        componentpath = os.path.join(self.library, "uart")
+        os.makedirs(componentpath)
+        # same mtime, listing comes from catalog
+        os.utime(self.library, (0, 0))
+        self.assertEqual(Catalog(self.filename).list_dir(self.library),
+                         ["gpio"])
+        os.utime(self.library, (10, 10))
+        catalog = Catalog(self.filename)
+        self.assertEqual(catalog.list_dir(self.library), ["gpio", "uart"])
+        gpiopath = os.path.join(self.library, "gpio")
+        with open(os.path.join(gpiopath, "gpio2.xml"), "w") as afile:
+            afile.write(GPIO.replace('version="gpio"', 'version="gpio2"'))
+        os.utime(gpiopath, (10, 10))
+        self.assertEqual(catalog.list_versions(gpiopath), ["gpio", "gpio2"])
+
+    def test_racy(self):
+        """ a directory just modified is listed but not kept """
+        componentpath = os.path.join(self.library, "uart")
+        os.makedirs(componentpath)
+        self.assertEqual(self.catalog.list_dir(self.library),
+                         ["gpio", "uart"])
+        os.rmdir(componentpath)
+        self.assertEqual(Catalog(self.filename).list_dir(self.library),
+                         ["gpio"])
+
+    def test_broken_catalog(self):
+        """ a broken catalog file is rebuilt """
+        os.makedirs(os.path.dirname(self.filename))
+        with open(self.filename, "w") as afile:
+            afile.write("{broken")
+        self.assertEqual(self.catalog.list_dir(self.library), ["gpio"])
+
+    def test_missing_dir(self):
+        """ a missing directory is empty """
+        self.assertEqual(
+            self.catalog.list_dir(os.path.join(self.tmpdir, "missing")), [])
+        self.assertEqual(
+            self.catalog.list_versions(os.path.join(self.library,
+                                                    "missing")), [])
+
+
+if __name__ == "__main__":
+    print("test_catalog class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
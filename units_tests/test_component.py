@@ -0,0 +1,98 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_component
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from projectfixture import write_project, write_instance, load_project
+
+GPIO = """<?xml version="1.0" encoding="utf-8"?>
+<component name="gpio" version="gpio" num="0" instance_name="gpio00">
+  <generics>
+    <generic name="id" public="true" value="1" type="natural"
+     destination="both" />
+    <generic name="width" public="true" value="8" type="natural"
+     destination="fpga" />
+  </generics>
+  <interfaces>
+    <interface name="candr" class="gls">
+      <ports>
+        <port name="clk" dir="in" size="1" />
+      </ports>
+    </interface>
+    <interface name="io" class="gls">
+      <ports>
+        <port name="gpio" dir="inout" size="8" />
+      </ports>
+    </interface>
+  </interfaces>
+</component>"""
+
+
+class test_component(unittest.TestCase):
+    """ unit tests bin.core.component.py
+    """
+
+    def setUp(self):
+        self.projectpath = tempfile.mkdtemp()
+        filename = write_project(self.projectpath, {"gpio00": []})
+        write_instance(self.projectpath, "gpio00", GPIO)
+        self.project = load_project(filename)
+        self.component = self.project.get_instance("gpio00")
+
+    def tearDown(self):
+        shutil.rmtree(self.projectpath)
+
+    def test_get_interface(self):
+        """ interfaces are found by name """
+        for interface in self.component.interfaces:
+            self.assertTrue(
+                self.component.get_interface(interface.name) is interface)
+        with self.assertRaises(PodError):
+            self.component.get_interface("missing")
+
+    def test_get_generic(self):
+        """ generics are found by name """
+        self.assertEqual(self.component.get_generic("width").value, "8")
+        with self.assertRaises(PodError):
+            self.component.get_generic("missing")
+
+    def test_rename_generic(self):
+        """ a renamed generic is found with its new name only """
+        generic = self.component.get_generic("width")
+        self.component.set_generic("width", "name", "size")
+        self.assertTrue(self.component.get_generic("size") is generic)
+        with self.assertRaises(PodError):
+            self.component.get_generic("width")
+        with self.assertRaises(PodError):
+            self.component.set_generic("size", "name", "id")
+        self.assertTrue(self.component.get_generic("size") is generic)
+
+    def test_rename_instance(self):
+        """ a renamed instance is found with its new name only """
+        self.component.instancename = "gpio01"
+        self.assertTrue(self.project.get_instance("gpio01") is
+                        self.component)
+        with self.assertRaises(PodError):
+            self.project.get_instance("gpio00")
+
+
+if __name__ == "__main__":
+    print("test_component class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
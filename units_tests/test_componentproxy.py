@@ -0,0 +1,89 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_componentproxy
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.core.component import Component
+from periphondemand.bin.core.componentproxy import ComponentProxy
+from projectfixture import write_project, load_project, get_port
+
+INSTANCES = {"src": [("data", "out", 4)],
+             "dst": [("data", "in", 4)]}
+
+
+class test_componentproxy(unittest.TestCase):
+    """ unit tests bin.core.componentproxy.py
+    """
+
+    def setUp(self):
+        self.projectpath = tempfile.mkdtemp()
+        self.filename = write_project(self.projectpath, INSTANCES)
+
+    def tearDown(self):
+        shutil.rmtree(self.projectpath)
+
+    def test_not_loaded(self):
+        """ listing instances doesn't load them """
+        project = load_project(self.filename, lazy=True)
+        self.assertEqual(sorted([instance.instancename
+                                 for instance in project.instances]),
+                         ["dst", "src"])
+        for instance in project.instances:
+            self.assertTrue(isinstance(instance, ComponentProxy))
+            self.assertFalse(instance.is_loaded)
+
+    def test_load_on_use(self):
+        """ first attribute used loads instance, then it replaces proxy """
+        project = load_project(self.filename, lazy=True)
+        proxy = project.get_instance("src")
+        self.assertEqual(proxy.name, "src_comp")
+        self.assertTrue(proxy.is_loaded)
+        instance = project.get_instance("src")
+        self.assertTrue(isinstance(instance, Component))
+        self.assertTrue(proxy.component is instance)
+        self.assertTrue(isinstance(project.get_instance("dst"),
+                                   ComponentProxy))
+
+    def test_load_connected(self):
+        """ following a connection loads the instance connected """
+        project = load_project(self.filename)
+        project.connect_pin_cmd(get_port(project, "src", "data").get_pin(0),
+                                get_port(project, "dst", "data").get_pin(2))
+        project = load_project(self.filename, lazy=True)
+        pin = get_port(project, "src", "data").get_pin(0)
+        self.assertTrue(isinstance(project.get_instance("dst"),
+                                   ComponentProxy))
+        pins = project.connection_graph.neighbours(pin)
+        self.assertEqual(len(pins), 1)
+        self.assertTrue(pins[0] is
+                        get_port(project, "dst", "data").get_pin(2))
+        self.assertTrue(isinstance(project.get_instance("dst"), Component))
+
+    def test_missing(self):
+        """ an instance without XML file can't be loaded """
+        shutil.rmtree(self.projectpath + "/components/dst")
+        project = load_project(self.filename, lazy=True)
+        with self.assertRaises(PodError):
+            project.load_instance("dst")
+
+
+if __name__ == "__main__":
+    print("test_componentproxy class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
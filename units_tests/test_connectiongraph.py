@@ -0,0 +1,122 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_connectiongraph
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from projectfixture import write_project, load_project, get_port
+
+INSTANCES = {"src": [("data", "out", 4)],
+             "dst": [("data", "in", 4)],
+             "bidir": [("data", "inout", 4)]}
+
+
+class test_connectiongraph(unittest.TestCase):
+    """ unit tests bin.core.connectiongraph.py
+    """
+
+    def setUp(self):
+        self.projectpath = tempfile.mkdtemp()
+        self.filename = write_project(self.projectpath, INSTANCES)
+        self.project = load_project(self.filename)
+        self.graph = self.project.connection_graph
+
+    def tearDown(self):
+        shutil.rmtree(self.projectpath)
+
+    def connect(self, source, num_source, dest, num_dest):
+        """ connect pins of port data of instances given """
+        self.project.connect_pin_cmd(
+            get_port(self.project, source, "data").get_pin(num_source),
+            get_port(self.project, dest, "data").get_pin(num_dest))
+
+    def test_connect(self):
+        """ connections are followed in both directions """
+        self.connect("src", 0, "dst", 1)
+        pin_src = get_port(self.project, "src", "data").get_pin(0)
+        pin_dst = get_port(self.project, "dst", "data").get_pin(1)
+        self.assertEqual(self.graph.connection_keys(pin_src),
+                         [("dst", "io", "data", "1")])
+        self.assertEqual(self.graph.connection_keys(pin_dst),
+                         [("src", "io", "data", "0")])
+        self.assertEqual(self.graph.neighbours(pin_src), [pin_dst])
+        self.assertEqual(self.graph.connections(pin_src),
+                         pin_src.connections)
+
+    def test_delete(self):
+        """ deleted connections are removed from graph """
+        self.connect("src", 0, "dst", 1)
+        self.project.delete_pin_connection_cmd(
+            {"instance": "src", "interface": "io", "port": "data",
+             "num": "0"},
+            {"instance": "dst", "interface": "io", "port": "data",
+             "num": "1"})
+        pin_src = get_port(self.project, "src", "data").get_pin(0)
+        pin_dst = get_port(self.project, "dst", "data").get_pin(1)
+        self.assertEqual(self.graph.connection_keys(pin_src), [])
+        self.assertEqual(self.graph.connection_keys(pin_dst), [])
+
+    def test_fan(self):
+        """ fan out and fan in follow pins directions """
+        self.connect("src", 0, "dst", 0)
+        self.connect("src", 0, "bidir", 0)
+        pin_src = get_port(self.project, "src", "data").get_pin(0)
+        pin_dst = get_port(self.project, "dst", "data").get_pin(0)
+        pin_bidir = get_port(self.project, "bidir", "data").get_pin(0)
+        self.assertEqual(sorted([str(pin.parent.parent.parent.instancename)
+                                 for pin in self.graph.fan_out(pin_src)]),
+                         ["bidir", "dst"])
+        self.assertEqual(self.graph.fan_in(pin_src), [])
+        self.assertEqual(self.graph.fan_in(pin_dst), [pin_src])
+        self.assertEqual(self.graph.fan_out(pin_dst), [])
+        self.assertEqual(self.graph.fan_in(pin_bidir), [pin_src])
+
+    def test_reload(self):
+        """ graph is built again from XML when project is loaded """
+        self.connect("src", 2, "dst", 3)
+        project = load_project(self.filename)
+        pin_dst = get_port(project, "dst", "data").get_pin(3)
+        self.assertEqual(project.connection_graph.connection_keys(pin_dst),
+                         [("src", "io", "data", "2")])
+
+    def test_summary(self):
+        """ port summary gives connected pins and ports """
+        self.connect("src", 0, "dst", 0)
+        self.connect("src", 1, "dst", 1)
+        summary = self.graph.summarize(get_port(self.project, "src", "data"))
+        self.assertFalse(summary.fully_connected)
+        self.assertEqual(summary.connected_msb, 1)
+        self.assertTrue(summary.dest_port is
+                        get_port(self.project, "dst", "data"))
+        port = get_port(self.project, "src", "data")
+        self.assertEqual(summary.fully_connected, port.is_fully_connected())
+        self.assertEqual(summary.connected_msb, port.connected_msb)
+
+    def test_unknown_pin(self):
+        """ an unknown pin isn't found """
+        self.assertEqual(self.graph.get_pin(("missing", "io", "data", "0")),
+                         None)
+        with self.assertRaises(PodError):
+            self.project.get_instance("missing")
+
+
+if __name__ == "__main__":
+    print("test_connectiongraph class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
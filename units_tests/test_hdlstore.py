@@ -0,0 +1,84 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_hdlstore
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import stat
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.core.hdlstore import HdlStore
+
+
+class test_hdlstore(unittest.TestCase):
+    """ unit tests bin.core.hdlstore.py
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.store = HdlStore(os.path.join(self.tmpdir, "store"))
+        os.mkdir(os.path.join(self.tmpdir, "hdl"))
+        self.filepath = os.path.join(self.tmpdir, "hdl", "gpio.vhd")
+        with open(self.filepath, "w") as afile:
+            afile.write("entity gpio is\n")
+
+    def tearDown(self):
+        for root, dirs, _ in os.walk(self.tmpdir):
+            for adir in dirs:
+                os.chmod(os.path.join(root, adir), 0o755)
+        shutil.rmtree(self.tmpdir)
+
+    def test_add(self):
+        """ file is stored once, read only, under its digest """
+        digest = self.store.add(self.filepath)
+        self.assertEqual(digest, HdlStore.digest(self.filepath))
+        storedpath = self.store.path(digest, self.filepath)
+        self.assertEqual(os.path.basename(storedpath), "gpio.vhd")
+        self.assertFalse(os.stat(storedpath).st_mode & stat.S_IWUSR)
+        self.assertEqual(self.store.add(self.filepath), digest)
+
+    def test_import_file(self):
+        """ project file stays writable and modifying it doesn't change
+            stored file
+        """
+        digest = self.store.import_file(self.filepath)
+        storedpath = self.store.path(digest, self.filepath)
+        self.assertNotEqual(os.stat(self.filepath).st_ino,
+                            os.stat(storedpath).st_ino)
+        self.assertTrue(os.stat(self.filepath).st_mode & stat.S_IWUSR)
+        with open(self.filepath, "w") as afile:
+            afile.write("entity modified is\n")
+        with open(storedpath, "r") as afile:
+            self.assertEqual(afile.read(), "entity gpio is\n")
+
+    def test_import_dir(self):
+        """ all files of a directory are stored """
+        self.store.import_dir(os.path.dirname(self.filepath))
+        digest = HdlStore.digest(self.filepath)
+        self.assertTrue(os.path.exists(self.store.path(digest,
+                                                       self.filepath)))
+
+    def test_add_missing(self):
+        """ storing a missing file raises PodError """
+        with self.assertRaises(PodError):
+            self.store.add(os.path.join(self.tmpdir, "missing.vhd"))
+
+
+if __name__ == "__main__":
+    print("test_hdlstore class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,90 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_interface
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.core.port import Port
+from projectfixture import write_project, write_instance, load_project
+
+UART = """<?xml version="1.0" encoding="utf-8"?>
+<component name="uart" version="uart" num="0" instance_name="uart00">
+  <interfaces>
+    <interface name="serial" class="gls">
+      <registers>
+        <register name="status" offset="0x00" size="16" rows="1" />
+        <register name="data" offset="0x01" size="16" rows="1" />
+      </registers>
+      <ports>
+        <port name="tx" type="TXD" dir="out" size="1" />
+        <port name="rx" type="RXD" dir="in" size="1" />
+        <port name="rx2" type="RXD" dir="in" size="1" />
+      </ports>
+    </interface>
+  </interfaces>
+</component>"""
+
+
+class test_interface(unittest.TestCase):
+    """ unit tests bin.core.interface.py
+    """
+
+    def setUp(self):
+        self.projectpath = tempfile.mkdtemp()
+        filename = write_project(self.projectpath, {"uart00": []})
+        write_instance(self.projectpath, "uart00", UART)
+        self.project = load_project(filename)
+        self.interface = self.project.get_instance("uart00").get_interface(
+            "serial")
+
+    def tearDown(self):
+        shutil.rmtree(self.projectpath)
+
+    def test_get_port(self):
+        """ ports are found by name """
+        for port in self.interface.ports:
+            self.assertTrue(self.interface.get_port(port.name) is port)
+        with self.assertRaises(PodError):
+            self.interface.get_port("missing")
+
+    def test_get_port_by_type(self):
+        """ first port of a type is returned """
+        self.assertEqual(self.interface.get_port_by_type("RXD").name, "rx")
+        self.assertEqual(self.interface.get_port_by_type("TXD").name, "tx")
+        with self.assertRaises(PodError):
+            self.interface.get_port_by_type("CTS")
+
+    def test_get_register(self):
+        """ registers are found by name """
+        self.assertEqual(self.interface.get_register("data").offset, "0x01")
+        with self.assertRaises(PodError):
+            self.interface.get_register("missing")
+
+    def test_add_port(self):
+        """ an added port is found by name and by type """
+        port = Port(self.interface, name="cts")
+        port.porttype = "CTS"
+        self.interface.add_port(port)
+        self.assertTrue(self.interface.get_port("cts") is port)
+        self.assertTrue(self.interface.get_port_by_type("CTS") is port)
+
+
+if __name__ == "__main__":
+    print("test_interface class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
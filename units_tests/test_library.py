@@ -0,0 +1,88 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_library
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+from mock import patch, PropertyMock
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.core.library import Library
+
+LIBRARIES = {"official": ["gpio", "uart"],
+             "perso": ["gpio", "spi"]}
+
+
+class test_library(unittest.TestCase):
+    """ unit tests bin.core.library.py
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.library = Library(None)
+        patcher = patch.object(Library, "libraries",
+                               new_callable=PropertyMock,
+                               return_value=sorted(LIBRARIES))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(Library, "list_components",
+                               side_effect=LIBRARIES.get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def new_library(self, name, components):
+        """ return path of a new library with components given """
+        path = os.path.join(self.tmpdir, name)
+        for component in components:
+            os.makedirs(os.path.join(path, component))
+        return path
+
+    def test_components_index(self):
+        """ first library holding a component wins """
+        self.assertEqual(self.library.components_index(),
+                         {"gpio": "official", "uart": "official",
+                          "spi": "perso"})
+
+    def test_check_lib(self):
+        """ a library without known components is accepted """
+        self.library.check_lib(self.new_library("new", ["i2c", "pwm"]))
+
+    def test_check_lib_conflicts(self):
+        """ every component already known is reported with its
+            library
+        """
+        path = self.new_library("new", ["gpio", "i2c", "spi"])
+        with self.assertRaises(PodError) as context:
+            self.library.check_lib(path)
+        message = str(context.exception)
+        self.assertTrue("gpio ('official')" in message)
+        self.assertTrue("spi ('perso')" in message)
+        self.assertFalse("i2c" in message)
+
+    def test_check_lib_name(self):
+        """ a library can't be added twice """
+        with self.assertRaises(PodError):
+            self.library.check_lib(self.new_library("perso", ["i2c"]))
+
+
+if __name__ == "__main__":
+    print("test_library class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
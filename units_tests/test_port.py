@@ -20,8 +20,16 @@ from mock import MagicMock
 from mock import Mock
 from datetime import datetime
 
+import shutil
+import tempfile
+
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.core.port import Port
+from projectfixture import write_project, load_project, get_port
+
+INSTANCES = {"src": [("data", "out", 4)],
+             "dst": [("data", "in", 4)],
+             "other": [("data", "in", 4)]}
 
 class test_port(unittest.TestCase):
     """ unit tests bin.core.project.py
@@ -41,6 +49,85 @@ class test_port(unittest.TestCase):
         with self.assertRaises(PodError):
             aport.force = "pouet"
 
+    def test_get_pin(self):
+        """ a pin is created once, then found by its number """
+        projectpath = tempfile.mkdtemp()
+        aproject = load_project(write_project(projectpath, INSTANCES))
+        aport = get_port(aproject, "src", "data")
+        pin = aport.get_pin(2)
+        self.assertTrue(aport.get_pin("2") is pin)
+        self.assertEqual([apin.num for apin in aport.pins], ["2"])
+        with self.assertRaises(PodError):
+            aport.get_pin(4)
+        shutil.rmtree(projectpath)
+
+    def connect_ports(self):
+        """ return a project with src.io.data connected on dst.io.data """
+        self.projectpath = tempfile.mkdtemp()
+        self.filename = write_project(self.projectpath, INSTANCES)
+        aproject = load_project(self.filename)
+        aproject.connect_port(
+            {"instance": "src", "interface": "io", "port": "data"},
+            {"instance": "dst", "interface": "io", "port": "data"})
+        return aproject
+
+    def instance_xml(self, instancename):
+        """ return XML file content of instance """
+        with open(os.path.join(self.projectpath, "components", instancename,
+                               instancename + ".xml"), "r") as afile:
+            return afile.read()
+
+    def test_slice(self):
+        """ a whole port connection is one slice record """
+        aproject = self.connect_ports()
+        xml = self.instance_xml("src")
+        self.assertEqual(xml.count("<slice "), 1)
+        self.assertFalse("<connect " in xml)
+        self.assertEqual(self.instance_xml("dst").count("<slice "), 1)
+        aport = get_port(aproject, "src", "data")
+        self.assertEqual(aport.slice_pin_nums(), [0, 1, 2, 3])
+        self.assertEqual(aport.get_pin(2).connections,
+                         [{"instance_dest": "dst", "interface_dest": "io",
+                           "port_dest": "data", "pin_dest": "2"}])
+        shutil.rmtree(self.projectpath)
+
+    def test_slice_reload(self):
+        """ slices are read back with their connections """
+        self.connect_ports()
+        aproject = load_project(self.filename)
+        pin = get_port(aproject, "dst", "data").get_pin(3)
+        self.assertEqual(aproject.connection_graph.connection_keys(pin),
+                         [("src", "io", "data", "3")])
+        shutil.rmtree(self.projectpath)
+
+    def test_slice_explode(self):
+        """ connecting a pin of a sliced port writes one connection per
+            pin
+        """
+        aproject = self.connect_ports()
+        aproject.connect_pin_cmd(
+            get_port(aproject, "src", "data").get_pin(0),
+            get_port(aproject, "other", "data").get_pin(0))
+        xml = self.instance_xml("src")
+        self.assertFalse("<slice " in xml)
+        self.assertEqual(xml.count("<connect "), 5)
+        self.assertFalse("<slice " in self.instance_xml("dst"))
+        self.assertEqual(
+            len(get_port(aproject, "src", "data").get_pin(0).connections), 2)
+        shutil.rmtree(self.projectpath)
+
+    def test_slice_errors(self):
+        """ a connected port can't be connected again as a whole """
+        aproject = self.connect_ports()
+        with self.assertRaises(PodError):
+            aproject.connect_port(
+                {"instance": "other", "interface": "io", "port": "data"},
+                {"instance": "dst", "interface": "io", "port": "data"})
+        with self.assertRaises(PodError):
+            get_port(aproject, "src", "data").add_slice(
+                get_port(aproject, "other", "data"), 3, 0, 1, 0)
+        shutil.rmtree(self.projectpath)
+
 if __name__ == "__main__":
     print("test_project class test\n")
     unittest.main(
@@ -0,0 +1,105 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_processrunner
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+import threading
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.processrunner import ProcessRunner
+
+
+def python(code):
+    """ return command running python code """
+    return [sys.executable, "-c", code]
+
+
+class test_processrunner(unittest.TestCase):
+    """ unit tests bin.utils.processrunner.py
+    """
+
+    def setUp(self):
+        self.logdir = tempfile.mkdtemp()
+        self.runner = ProcessRunner(self.logdir, echo=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.logdir)
+
+    def test_run(self):
+        """ output is logged and exit code kept """
+        result = self.runner.run("step", python("print('hello')"))
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.logfile, os.path.join(self.logdir,
+                                                      "step.log"))
+        with open(result.logfile, "r") as afile:
+            self.assertTrue("hello\n" in afile.read())
+
+    def test_failure(self):
+        """ a failing step raises PodError, unless not checked """
+        with self.assertRaises(PodError):
+            self.runner.run("step", python("import sys; sys.exit(3)"))
+        result = self.runner.run("step", python("import sys; sys.exit(3)"),
+                                 check=False)
+        self.assertFalse(result.succeeded)
+        self.assertEqual(result.returncode, 3)
+
+    def test_missing_command(self):
+        """ a command which can't be launched raises PodError """
+        with self.assertRaises(PodError):
+            self.runner.run("step", [os.path.join(self.logdir, "missing")])
+
+    def test_timeout(self):
+        """ a step taking too long is stopped """
+        result = self.runner.run("step", python("import time; "
+                                                "time.sleep(30)"),
+                                 timeout=0.5, check=False)
+        self.assertTrue(result.timedout)
+        self.assertFalse(result.succeeded)
+        self.assertTrue(result.duration < 10)
+
+    def test_cancel(self):
+        """ cancel stops running steps and steps launched afterwards """
+        timer = threading.Timer(0.5, self.runner.cancel)
+        timer.start()
+        result = self.runner.run("step", python("import time; "
+                                                "time.sleep(30)"),
+                                 check=False)
+        timer.join()
+        self.assertTrue(result.cancelled)
+        self.assertTrue(result.duration < 10)
+        result = self.runner.run("next", python("pass"), check=False)
+        self.assertTrue(result.cancelled)
+        with self.assertRaises(PodError):
+            self.runner.run("next", python("pass"))
+
+    def test_stdin(self):
+        """ a file is given as standard input """
+        filename = os.path.join(self.logdir, "input")
+        with open(filename, "w") as afile:
+            afile.write("from file\n")
+        result = self.runner.run("step", python("print(input())"),
+                                 stdin=filename)
+        with open(result.logfile, "r") as afile:
+            self.assertTrue("from file\n" in afile.read())
+
+
+if __name__ == "__main__":
+    print("test_processrunner class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
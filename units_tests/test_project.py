@@ -20,8 +20,31 @@ from mock import MagicMock
 from mock import Mock
 from datetime import datetime
 
+import shutil
+import tempfile
+
 from periphondemand.bin.utils.poderror import PodError
 from periphondemand.bin.core import project
+from projectfixture import write_project, load_project, get_port
+
+INSTANCES = {"src": [("data", "out", 4)],
+             "dst": [("data", "in", 4)],
+             "other": [("data", "in", 4)]}
+
+
+class FakeIntercon(object):
+    """ intercon attributes used to generate its code """
+
+    def __init__(self, name, has_code=True):
+        self.name = name
+        self._has_code = has_code
+
+    def has_code(self):
+        return self._has_code
+
+    def code(self):
+        return self.name + " " + str(os.getpid())
+
 
 class test_project(unittest.TestCase):
     """ unit tests bin.core.project.py
@@ -53,6 +76,164 @@ class test_project(unittest.TestCase):
         self.assertTrue("apf27" in aproject.availables_plat())
         os.system("rm -rf " + projectname)
 
+    def test_get_instance(self):
+        """ instances are found by name until they are deleted """
+        projectpath = tempfile.mkdtemp()
+        aproject = load_project(write_project(projectpath, INSTANCES))
+        for instance in aproject.instances:
+            self.assertTrue(
+                aproject.get_instance(instance.instancename) is instance)
+        with self.assertRaises(PodError):
+            aproject.get_instance("missing")
+        aproject.del_instance("other")
+        with self.assertRaises(PodError):
+            aproject.get_instance("other")
+        shutil.rmtree(projectpath)
+
+    def mtimes(self, projectpath):
+        """ return {filename: mtime} of project files """
+        mtimes = {}
+        for root, _, files in os.walk(projectpath):
+            for afile in files:
+                filename = os.path.join(root, afile)
+                mtimes[os.path.relpath(filename, projectpath)] = \
+                    os.stat(filename).st_mtime_ns
+        return mtimes
+
+    def age(self, projectpath):
+        """ set project files mtime in the past """
+        for root, _, files in os.walk(projectpath):
+            for afile in files:
+                os.utime(os.path.join(root, afile), (0, 0))
+
+    def test_save_modified_only(self):
+        """ only modified XML files are written, without temporary file """
+        projectpath = tempfile.mkdtemp()
+        aproject = load_project(write_project(projectpath, INSTANCES))
+        self.age(projectpath)
+        aproject.save()
+        self.assertEqual(set(self.mtimes(projectpath).values()), set([0]))
+        aproject.connect_pin_cmd(get_port(aproject, "src", "data").get_pin(0),
+                                 get_port(aproject, "dst", "data").get_pin(0))
+        written = sorted([filename for filename, mtime in
+                          self.mtimes(projectpath).items() if mtime != 0])
+        self.assertEqual(written, ["components/dst/dst.xml",
+                                   "components/src/src.xml"])
+        self.assertEqual([filename for filename in self.mtimes(projectpath)
+                          if filename.endswith(".tmp")], [])
+        shutil.rmtree(projectpath)
+
+    def test_transaction(self):
+        """ project is saved once, when outermost transaction is
+            committed
+        """
+        projectpath = tempfile.mkdtemp()
+        aproject = load_project(write_project(projectpath, INSTANCES))
+        self.age(projectpath)
+        aproject.begin()
+        aproject.begin()
+        aproject.connect_pin_cmd(get_port(aproject, "src", "data").get_pin(0),
+                                 get_port(aproject, "dst", "data").get_pin(0))
+        aproject.commit()
+        self.assertTrue(aproject.in_transaction)
+        self.assertEqual(set(self.mtimes(projectpath).values()), set([0]))
+        aproject.commit()
+        self.assertFalse(aproject.in_transaction)
+        self.assertEqual(len([mtime for mtime in
+                              self.mtimes(projectpath).values()
+                              if mtime != 0]), 2)
+        with self.assertRaises(PodError):
+            aproject.commit()
+        shutil.rmtree(projectpath)
+
+    def test_commit_check(self):
+        """ project with a connection to a missing pin isn't saved """
+        projectpath = tempfile.mkdtemp()
+        aproject = load_project(write_project(projectpath, INSTANCES))
+        self.age(projectpath)
+        for connection in (("dst", "io", "data", 4),
+                           ("dst", "io", "missing", 0),
+                           ("dst", "missing", "data", 0),
+                           ("missing", "io", "data", 0)):
+            aproject.begin()
+            pin = get_port(aproject, "src", "data").get_pin(0)
+            pin.add_connection_raw(*connection)
+            aproject.save()
+            with self.assertRaises(PodError):
+                aproject.commit()
+            self.assertFalse(aproject.in_transaction)
+            self.assertEqual(set(self.mtimes(projectpath).values()),
+                             set([0]))
+            pin.del_connections_forces()
+        aproject.begin()
+        aproject.connect_pin_cmd(get_port(aproject, "src", "data").get_pin(3),
+                                 get_port(aproject, "dst", "data").get_pin(3))
+        aproject.commit()
+        self.assertEqual(len([mtime for mtime in
+                              self.mtimes(projectpath).values()
+                              if mtime != 0]), 2)
+        shutil.rmtree(projectpath)
+
+    def test_read_pins(self):
+        """ pins only read aren't written in XML """
+        projectpath = tempfile.mkdtemp()
+        aproject = load_project(write_project(projectpath, INSTANCES))
+        aproject.begin()
+        get_port(aproject, "other", "data").get_pin(2)
+        aproject.connect_pin_cmd(
+            get_port(aproject, "src", "data").get_pin(0),
+            get_port(aproject, "other", "data").get_pin(1))
+        aproject.commit()
+        with open(os.path.join(projectpath, "components", "other",
+                               "other.xml"), "r") as afile:
+            xml = afile.read()
+        self.assertTrue('<pin num="1">' in xml)
+        self.assertFalse('num="2"' in xml)
+        shutil.rmtree(projectpath)
+
+    def test_pins_format(self):
+        """ a modified pin is written once in its port, with its
+            connection, and read back
+        """
+        projectpath = tempfile.mkdtemp()
+        filename = write_project(projectpath, INSTANCES)
+        aproject = load_project(filename)
+        pin = get_port(aproject, "other", "data").get_pin(3)
+        self.assertFalse(pin.is_dirty)
+        aproject.connect_pin_cmd(get_port(aproject, "src", "data").get_pin(1),
+                                 pin)
+        aproject.connect_pin_cmd(
+            get_port(aproject, "src", "data").get_pin(2),
+            get_port(aproject, "other", "data").get_pin(3))
+        with open(os.path.join(projectpath, "components", "other",
+                               "other.xml"), "r") as afile:
+            xml = afile.read()
+        self.assertEqual(xml.count("<pin "), 1)
+        self.assertEqual(xml.count("<connect "), 2)
+        self.assertTrue('<connect instance_dest="src" interface_dest="io" '
+                        'port_dest="data" pin_dest="1" />' in xml)
+        aproject = load_project(filename)
+        self.assertEqual(
+            aproject.connection_graph.connection_keys(
+                get_port(aproject, "other", "data").get_pin(3)),
+            [("src", "io", "data", "1"), ("src", "io", "data", "2")])
+        shutil.rmtree(projectpath)
+
+    def test_intercons_code(self):
+        """ intercons code is generated by worker processes, in intercons
+            order
+        """
+        intercons = [FakeIntercon(name) for name in ("b", "a", "c")]
+        codes = project.Project._intercons_code(intercons, 2)
+        self.assertEqual([code.split()[0] for code in codes],
+                         ["b", "a", "c"])
+        self.assertFalse(str(os.getpid()) in
+                         [code.split()[1] for code in codes])
+        self.assertEqual(project.Project._intercons_code(intercons, 1),
+                         [None, None, None])
+        intercons.append(FakeIntercon("d", has_code=False))
+        self.assertEqual(project.Project._intercons_code(intercons, 2),
+                         [None, None, None, None])
 
 
 if __name__ == "__main__":
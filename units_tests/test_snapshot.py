@@ -0,0 +1,162 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_snapshot
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import pickle
+import shutil
+import tempfile
+from mock import patch
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.core.component import Component
+from periphondemand.bin.core.snapshot import Snapshot, SAFE_CLASSES
+from projectfixture import write_project, load_project, get_port
+
+INSTANCES = {"src": [("data", "out", 2)],
+             "dst": [("data", "in", 2)]}
+
+
+class FakeProject(object):
+    """ project attributes used by snapshot """
+
+    def __init__(self, projectpath):
+        self.projectpath = projectpath
+        self.name = "test"
+
+
+class FakeComponent(object):
+    """ instance saved in snapshot """
+
+    def __init__(self, parent, instancename):
+        self.parent = parent
+        self.instancename = instancename
+
+
+class Remover(object):
+    """ unpickled as a call to os.remove """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def __reduce__(self):
+        return (os.remove, (self.filename,))
+
+
+class test_snapshot(unittest.TestCase):
+    """ unit tests bin.core.snapshot.py
+    """
+
+    def setUp(self):
+        self.projectpath = tempfile.mkdtemp()
+        self.cachepath = tempfile.mkdtemp()
+        self.patchers = [
+            patch("periphondemand.bin.core.snapshot.POD_CACHE",
+                  self.cachepath),
+            patch("periphondemand.bin.core.snapshot.SAFE_CLASSES",
+                  SAFE_CLASSES + [(FakeComponent.__module__,
+                                   "FakeComponent")])]
+        for patcher in self.patchers:
+            patcher.start()
+        self.project = FakeProject(self.projectpath)
+        for instancename in ("gpio00", "uart00"):
+            self.write_instance(instancename, "<component />")
+        self.instances = [FakeComponent(self.project, "gpio00"),
+                          FakeComponent(self.project, "uart00")]
+        self.snapshot = Snapshot(self.project)
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        shutil.rmtree(self.projectpath)
+        shutil.rmtree(self.cachepath)
+
+    def write_instance(self, instancename, xml):
+        """ write instance XML file """
+        dirname = os.path.join(self.projectpath, "components", instancename)
+        if not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        with open(os.path.join(dirname, instancename + ".xml"), "w") as afile:
+            afile.write(xml)
+
+    def test_load(self):
+        """ instances are loaded with project given back """
+        self.snapshot.save(self.instances)
+        instances = Snapshot(self.project).load(["gpio00", "uart00"])
+        self.assertEqual(sorted(instances.keys()), ["gpio00", "uart00"])
+        self.assertTrue(instances["gpio00"].parent is self.project)
+
+    def test_location(self):
+        """ snapshot is written in user cache, one per project path """
+        self.snapshot.save(self.instances)
+        self.assertEqual(os.path.dirname(self.snapshot.filename),
+                         os.path.join(self.cachepath, "snapshots"))
+        self.assertTrue(os.path.exists(self.snapshot.filename))
+        self.assertEqual(sorted(os.listdir(self.projectpath)),
+                         ["components"])
+        other = FakeProject(os.path.join(self.projectpath, "components"))
+        self.assertNotEqual(Snapshot(other).filename,
+                            self.snapshot.filename)
+
+    def test_stale(self):
+        """ snapshot of modified or other instances isn't loaded """
+        self.snapshot.save(self.instances)
+        self.assertEqual(self.snapshot.load(["gpio00"]), None)
+        self.write_instance("uart00", "<component name='uart' />")
+        self.assertEqual(self.snapshot.load(["gpio00", "uart00"]), None)
+
+    def test_broken(self):
+        """ a broken snapshot is ignored """
+        self.assertEqual(self.snapshot.load(["gpio00", "uart00"]), None)
+        self.snapshot.save(self.instances)
+        with open(self.snapshot.filename, "wb") as afile:
+            afile.write(b"broken")
+        self.assertEqual(self.snapshot.load(["gpio00", "uart00"]), None)
+
+    def test_forbidden(self):
+        """ a snapshot calling functions is ignored without calling them """
+        self.snapshot.save(self.instances)
+        marker = os.path.join(self.projectpath, "marker")
+        with open(marker, "w") as afile:
+            afile.write("marker\n")
+        with open(self.snapshot.filename, "wb") as afile:
+            pickle.dump(Remover(marker), afile)
+        self.assertEqual(self.snapshot.load(["gpio00", "uart00"]), None)
+        self.assertTrue(os.path.exists(marker))
+
+    def test_project(self):
+        """ slotted pins of a project are snapshotted and loaded back """
+        projectpath = os.path.join(self.projectpath, "project")
+        os.makedirs(projectpath)
+        filename = write_project(projectpath, INSTANCES)
+        project = load_project(filename)
+        project.connect_pin_cmd(get_port(project, "src", "data").get_pin(0),
+                                get_port(project, "dst", "data").get_pin(1))
+        load_project(filename, snapshot=True)
+        with patch.object(Component, "load",
+                          side_effect=AssertionError("XML loaded")):
+            project = load_project(filename, snapshot=True)
+        pin = get_port(project, "dst", "data").get_pin(1)
+        self.assertFalse(hasattr(pin, "__dict__"))
+        self.assertTrue(pin.parent.parent.parent.parent is project)
+        self.assertEqual(project.connection_graph.neighbours(pin),
+                         [get_port(project, "src", "data").get_pin(0)])
+
+
+if __name__ == "__main__":
+    print("test_snapshot class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
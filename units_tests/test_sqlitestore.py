@@ -0,0 +1,127 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_sqlitestore
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+from xml.etree import ElementTree as ET
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.core.sqlitestore import SqliteStore
+
+INSTANCE = """<component name="uart" instance_name="uart00">
+<interfaces>
+<interface name="uart" class="gls">
+<ports>
+<port name="tx" dir="out" size="1">
+<pin num="0">
+<connect instance_dest="apf27" interface_dest="fpga" port_dest="tx" />
+</pin>
+</port>
+<port name="rx" dir="in" size="1">
+<pin num="0">
+<connect instance_dest="apf27" interface_dest="fpga" port_dest="rx"
+ pin_dest="0" />
+</pin>
+</port>
+</ports>
+</interface>
+</interfaces>
+<generics>
+<generic name="freq" value="100" />
+</generics>
+</component>"""
+
+
+class FakeProject(object):
+    """ project attributes used by store """
+
+    def __init__(self, projectpath):
+        self.projectpath = projectpath
+        self.name = "test"
+
+
+class FakeComponent(object):
+    """ component attributes used by store """
+
+    def __init__(self, instancename, xml):
+        self.instancename = instancename
+        self.tree = ET.fromstring(xml)
+        self._xml = xml
+
+    def __str__(self):
+        return self._xml
+
+
+class test_sqlitestore(unittest.TestCase):
+    """ unit tests bin.core.sqlitestore.py
+    """
+
+    def setUp(self):
+        self.projectpath = tempfile.mkdtemp()
+        self.store = SqliteStore(FakeProject(self.projectpath))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.projectpath)
+
+    def test_write_read(self):
+        """ instance XML is kept as is """
+        self.store.write_instance(FakeComponent("uart00", INSTANCE))
+        self.assertTrue(self.store.has_instance("uart00"))
+        self.assertEqual(self.store.read_instance("uart00"), INSTANCE)
+        self.assertEqual(self.store.instance_names(), ["uart00"])
+        self.store.del_instance("uart00")
+        self.assertFalse(self.store.has_instance("uart00"))
+        self.assertEqual(self.store.read_instance("uart00"), None)
+
+    def test_import_xml(self):
+        """ imported XML files are removed, a broken one raises PodError
+            and is kept
+        """
+        dirname = os.path.join(self.projectpath, "components", "uart00")
+        os.makedirs(dirname)
+        filename = os.path.join(dirname, "uart00.xml")
+        with open(filename, "w") as afile:
+            afile.write(INSTANCE.replace("</component>", ""))
+        with self.assertRaises(PodError):
+            self.store.import_xml(["uart00"])
+        self.assertTrue(os.path.exists(filename))
+        self.assertFalse(self.store.has_instance("uart00"))
+        with open(filename, "w") as afile:
+            afile.write(INSTANCE)
+        self.store.import_xml(["uart00"])
+        self.assertFalse(os.path.exists(filename))
+        self.assertEqual(self.store.read_instance("uart00"), INSTANCE)
+
+    def test_import_missing_xml(self):
+        """ importing a missing XML file raises PodError """
+        with self.assertRaises(PodError):
+            self.store.import_xml(["uart00"])
+
+    def test_wrong_database(self):
+        """ a file which isn't a database raises PodError """
+        with open(self.store.filename, "w") as afile:
+            afile.write("not a database" * 100)
+        with self.assertRaises(PodError):
+            self.store.db
+
+
+if __name__ == "__main__":
+    print("test_sqlitestore class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,188 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_synthesis
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.toolchain.synthesis import Synthesis
+
+
+class FakeHdlFile(object):
+    """ HDL file attributes used by synthesis """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+
+class FakeComponent(object):
+    """ component attributes used by synthesis """
+
+    def __init__(self, name, filenames):
+        self.name = name
+        self.instancename = name + "00"
+        self.num = "0"
+        self.hdl_files = [FakeHdlFile(filename) for filename in filenames]
+
+
+class FakeProject(object):
+    """ project attributes used by synthesis """
+
+    def __init__(self, projectpath):
+        self.projectpath = projectpath
+        self.name = "test"
+        self.instance_files = "copy"
+        self.instances = []
+
+    def add_component(self, name, filenames):
+        """ add an instance with its HDL files """
+        hdldir = os.path.join(self.projectpath, "components", name + "00",
+                              "hdl")
+        os.makedirs(hdldir)
+        for filename in filenames:
+            with open(os.path.join(hdldir, filename), "w") as afile:
+                afile.write("-- " + filename + "\n")
+        self.instances.append(FakeComponent(name, filenames))
+
+
+class FakeToolchain(Synthesis):
+    """ toolchain with constraints file, its .podrc values are given """
+
+    name = "fake"
+
+    def __init__(self, parent, values=None):
+        Synthesis.__init__(self, parent)
+        self.values = values or {}
+
+    @classmethod
+    def constraints_file_extension(cls):
+        return "ucf"
+
+    def get_synthesis_value(self, value):
+        return self.values.get(value)
+
+
+def python(code):
+    """ return command running python code """
+    return [sys.executable, "-c", code]
+
+
+class test_synthesis(unittest.TestCase):
+    """ unit tests bin.toolchain.synthesis.py
+    """
+
+    def setUp(self):
+        self.projectpath = tempfile.mkdtemp()
+        self.synthesispath = os.path.join(self.projectpath, "synthesis")
+        os.mkdir(self.synthesispath)
+        self.project = FakeProject(self.projectpath)
+        self.project.add_component("gpio", ["gpio.vhd"])
+        self.project.add_component("uart", ["uart.vhd", "fifo.vhd"])
+        self.synthesis = Synthesis(self.project)
+
+    def tearDown(self):
+        shutil.rmtree(self.projectpath)
+
+    def test_generate_project(self):
+        """ files are copied, then left untouched """
+        report = self.synthesis.generate_project()
+        self.assertEqual(len(report["copied"]), 3)
+        self.assertEqual(sorted(self.synthesis.component_dirs()),
+                         ["gpio", "uart"])
+        report = self.synthesis.generate_project()
+        self.assertEqual(len(report["copied"]), 0)
+        self.assertEqual(len(report["unchanged"]), 3)
+
+    def test_sync_stale(self):
+        """ stale files and directories are removed, logs are kept """
+        self.synthesis.generate_project()
+        os.makedirs(os.path.join(self.synthesispath, "gpio", "sub"))
+        os.makedirs(os.path.join(self.synthesispath, "logs"))
+        with open(os.path.join(self.synthesispath, "logs",
+                               "step.log"), "w") as afile:
+            afile.write("log\n")
+        self.project.instances = [instance for instance in
+                                  self.project.instances
+                                  if instance.name != "uart"]
+        report = self.synthesis.generate_project()
+        self.assertEqual(sorted(report["removed"]),
+                         [os.path.join(self.synthesispath, "gpio", "sub"),
+                          os.path.join(self.synthesispath, "uart")])
+        self.assertEqual(self.synthesis.component_dirs(), ["gpio"])
+        self.assertTrue(os.path.exists(
+            os.path.join(self.synthesispath, "logs", "step.log")))
+        self.assertEqual(
+            [name for name, _ in self.synthesis.source_files()],
+            ["gpio/gpio.vhd"])
+
+    def test_build_inputs(self):
+        """ build inputs are files read by toolchain, not its outputs nor
+            steps logs
+        """
+        self.synthesis.generate_project()
+        os.makedirs(os.path.join(self.synthesispath, "logs"))
+        for name in ("top_test.vhd", "test.tcl", "test.ucf", "test.qsys",
+                     "logs/synthesis.log"):
+            with open(os.path.join(self.synthesispath, name), "w") as afile:
+                afile.write(name + "\n")
+        toolchain = FakeToolchain(self.project)
+        self.assertEqual(sorted([name for name, _ in
+                                 toolchain.build_inputs()]),
+                         ["gpio/gpio.vhd", "test.tcl", "test.ucf",
+                          "top_test.vhd", "uart/fifo.vhd", "uart/uart.vhd"])
+
+    def test_run_steps(self):
+        """ steps are run at the same time in synthesis directory """
+        toolchain = FakeToolchain(self.project, {"jobs": "2"})
+        results = toolchain.run_steps(
+            [("first", python("open('first', 'w')")),
+             ("second", python("open('second', 'w')"))])
+        self.assertEqual(sorted([result.name for result in results]),
+                         ["first", "second"])
+        self.assertTrue(os.path.exists(os.path.join(self.synthesispath,
+                                                    "second")))
+        self.assertTrue(os.path.exists(os.path.join(self.synthesispath,
+                                                    "logs", "first.log")))
+
+    def test_run_steps_failure(self):
+        """ a failing step cancels the others and raises PodError """
+        toolchain = FakeToolchain(self.project, {"jobs": "2"})
+        with self.assertRaises(PodError):
+            toolchain.run_steps(
+                [("long", python("import time; time.sleep(30)")),
+                 ("failing", python("import sys; sys.exit(1)"))])
+        with open(os.path.join(self.synthesispath, "logs",
+                               "long.log"), "r") as afile:
+            self.assertTrue("cancelled" in afile.read())
+
+    def test_wrong_values(self):
+        """ wrong jobs or timeout in .podrc raise PodError """
+        with self.assertRaises(PodError):
+            FakeToolchain(self.project, {"jobs": "0"}).workers
+        with self.assertRaises(PodError):
+            FakeToolchain(self.project, {"jobs": "many"}).workers
+        with self.assertRaises(PodError):
+            FakeToolchain(self.project, {"timeout": "never"}).runner
+        self.assertEqual(FakeToolchain(self.project, {"jobs": "3"}).workers,
+                         3)
+
+
+if __name__ == "__main__":
+    print("test_synthesis class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
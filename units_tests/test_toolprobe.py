@@ -0,0 +1,92 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_toolprobe
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.toolchain.toolprobe import ToolProbe
+
+
+class test_toolprobe(unittest.TestCase):
+    """ unit tests bin.toolchain.toolprobe.py
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.command = os.path.join(self.tmpdir, "tool")
+        self.write_command("#!/bin/sh\n")
+        self.filename = os.path.join(self.tmpdir, "cache", "tools.json")
+        self.probed = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write_command(self, content):
+        """ write an executable command """
+        with open(self.command, "w") as afile:
+            afile.write(content)
+        os.chmod(self.command, 0o755)
+
+    def prober(self, commandpath):
+        """ fake version prober counting calls """
+        self.probed.append(commandpath)
+        return ("2019.1", "2019")
+
+    def test_probe(self):
+        """ command is probed once, then again when it changes """
+        entry = ToolProbe(self.filename).probe(self.command, self.prober)
+        self.assertEqual((entry["version"], entry["base_version"]),
+                         ("2019.1", "2019"))
+        ToolProbe(self.filename).probe(self.command, self.prober)
+        self.assertEqual(len(self.probed), 1)
+        self.write_command("#!/bin/sh\n# new version\n")
+        ToolProbe(self.filename).probe(self.command, self.prober)
+        self.assertEqual(len(self.probed), 2)
+
+    def test_missing_command(self):
+        """ a missing command raises PodError """
+        with self.assertRaises(PodError):
+            ToolProbe(self.filename).probe(
+                os.path.join(self.tmpdir, "missing"), self.prober)
+        self.assertEqual(ToolProbe.resolve(
+            os.path.join(self.tmpdir, "missing")), None)
+
+    def test_prober_error(self):
+        """ prober errors are raised and nothing is cached """
+        def prober(commandpath):
+            raise PodError("Can't get version", 0)
+        with self.assertRaises(PodError):
+            ToolProbe(self.filename).probe(self.command, prober)
+        self.assertFalse(os.path.exists(self.filename))
+
+    def test_broken_file(self):
+        """ a broken probe file is ignored """
+        os.makedirs(os.path.dirname(self.filename))
+        with open(self.filename, "w") as afile:
+            afile.write("[]")
+        ToolProbe(self.filename).probe(self.command, self.prober)
+        self.assertEqual(len(self.probed), 1)
+        self.assertEqual(os.listdir(os.path.dirname(self.filename)),
+                         ["tools.json"])
+
+
+if __name__ == "__main__":
+    print("test_toolprobe class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
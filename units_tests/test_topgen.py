@@ -0,0 +1,218 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_topgen
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+from mock import patch
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.code.vhdl.topvhdl import TopVHDL
+from projectfixture import write_project, load_project, get_port
+
+INSTANCES = {"src": [("data", "out", 2), ("btn", "in", 1)],
+             "dst": [("data", "in", 2), ("led", "out", 1)],
+             "gpio": [("pins", "inout", 2)]}
+
+PLATFORM = [("BTN", "in", 1), ("LED", "out", 1), ("IO", "inout", 1)]
+
+# top generated for the project above before code was streamed
+ENTITY = """entity top_test is
+
+    port
+    (
+    -- src-io
+        src_btn: in std_logic;
+    -- dst-io
+        dst_led: out std_logic;
+    -- gpio-io
+        gpio_pins_pin0: inout std_logic
+    );
+end entity top_test;
+
+"""
+
+ARCHITECTURE = """architecture top_test_1 of top_test is
+    -------------------------
+    -- Signals declaration --
+    -------------------------
+
+
+    -- dst
+    -- io
+    signal dst_data: std_logic_vector(1 downto 0);
+
+    -- gpio
+    -- io
+
+    -- src
+    -- io
+    signal src_data: std_logic_vector(1 downto 0);
+
+    -- void pins
+
+    signal gpio_pins: std_logic_vector(1 downto 0);
+
+begin
+
+    ----------------
+    -- Set forces --
+    ----------------
+
+    -----------------------
+    -- declare instances --
+    -----------------------
+
+
+    dst : entity work.dst_comp
+    port map (
+            -- io
+            data => dst_data,
+            led => dst_led
+            );
+
+    gpio : entity work.gpio_comp
+    port map (
+            -- io
+            pins => gpio_pins
+            );
+
+    src : entity work.src_comp
+    port map (
+            -- io
+            data => src_data,
+            btn => src_btn
+            );
+
+    ---------------------------
+    -- instances connections --
+    ---------------------------
+
+    -- connect incomplete external port pins pins
+    gpio_pins_pin0 <= gpio_pins(0);
+
+    -- connect dst
+        -- io
+        dst_data <= src_data;
+
+    -- connect gpio
+        -- io
+
+    -- connect src
+        -- io
+
+end architecture top_test_1;
+"""
+
+
+class test_topgen(unittest.TestCase):
+    """ unit tests bin.code.topgen.py
+    """
+
+    def setUp(self):
+        self.projectpath = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.projectpath, "synthesis"))
+        self.project = load_project(write_project(
+            self.projectpath, INSTANCES, platform=PLATFORM))
+        self.project.vhdl_version = "vhdl93"
+        self.project.connect_port(
+            {"instance": "src", "interface": "io", "port": "data"},
+            {"instance": "dst", "interface": "io", "port": "data"})
+        self.connect_platform("src", "btn", "BTN")
+        self.connect_platform("dst", "led", "LED")
+        self.connect_platform("gpio", "pins", "IO")
+        self.topgen = TopVHDL(self.project)
+        self.filename = os.path.join(self.projectpath, "synthesis",
+                                     "top_test.vhd")
+
+    def tearDown(self):
+        shutil.rmtree(self.projectpath)
+
+    def connect_platform(self, instancename, portname, platformportname):
+        """ connect pin 0 of port on platform port """
+        self.project.connect_pin_cmd(
+            get_port(self.project, instancename, portname).get_pin(0),
+            self.project.get_instance("board").get_interface(
+                "fpga").get_port(platformportname).get_pin(0))
+
+    def architecture(self):
+        """ return architecture code, joined by architecture() """
+        return self.topgen.architecture(
+            "top_test", self.project.platform.connect_ports,
+            self.project.platform.incomplete_ext_ports)
+
+    def test_architecture(self):
+        """ architecture fragments give the same code as before """
+        self.assertEqual(self.architecture(), ARCHITECTURE)
+        self.assertEqual(self.topgen.entity(
+            "top_test", self.project.platform.connect_ports), ENTITY)
+
+    def test_generate(self):
+        """ top file written fragment by fragment is the same as before """
+        self.topgen.generate()
+        with open(self.filename, "r") as afile:
+            self.assertEqual(afile.read(),
+                             self.topgen.header() + ENTITY + ARCHITECTURE)
+
+    def test_generate_error(self):
+        """ a failing generation keeps the previous top file """
+        self.topgen.generate()
+        with patch.object(self.topgen, "connect_instance_code",
+                          side_effect=PodError("error", 0)):
+            with self.assertRaises(PodError):
+                self.topgen.generate()
+        with open(self.filename, "r") as afile:
+            self.assertTrue(afile.read().endswith(ARCHITECTURE))
+        self.assertEqual(os.listdir(os.path.dirname(self.filename)),
+                         ["top_test.vhd"])
+
+    def test_port_summary(self):
+        """ summary of a port is computed once, as port methods do """
+        for instancename, portname in (("dst", "data"), ("gpio", "pins")):
+            port = get_port(self.project, instancename, portname)
+            summary = self.topgen.port_summary(port)
+            self.assertTrue(self.topgen.port_summary(port) is summary)
+            self.assertEqual(summary.fully_connected,
+                             port.is_fully_connected())
+            self.assertEqual(summary.connected_msb, port.connected_msb)
+            self.assertTrue(summary.dest_port is port.dest_port)
+            self.assertEqual(summary.same_connection,
+                             port.ports_with_same_connection)
+        self.assertTrue(
+            self.topgen.port_summary(get_port(self.project, "dst",
+                                              "data")).dest_port is
+            get_port(self.project, "src", "data"))
+
+    def test_port_summary_generate(self):
+        """ summaries are computed again for each generation """
+        port = get_port(self.project, "gpio", "pins")
+        summary = self.topgen.port_summary(port)
+        self.assertFalse(summary.fully_connected)
+        self.project.connect_pin_cmd(
+            port.get_pin(1),
+            get_port(self.project, "src", "btn").get_pin(0))
+        self.assertTrue(self.topgen.port_summary(port) is summary)
+        self.topgen.generate()
+        summary = self.topgen.port_summary(port)
+        self.assertTrue(summary.fully_connected)
+        self.assertEqual(summary.connected_msb, 1)
+
+
+if __name__ == "__main__":
+    print("test_topgen class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
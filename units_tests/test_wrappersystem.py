@@ -0,0 +1,111 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_wrappersystem
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import os
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils import wrappersystem as sy
+
+FRAGMENTS = ["-- généré\n", "entity target is\n", "", "end entity;\n"]
+
+
+class test_wrappersystem(unittest.TestCase):
+    """ unit tests bin.utils.wrappersystem.py
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.source = os.path.join(self.tmpdir, "source.vhd")
+        self.target = os.path.join(self.tmpdir, "target.vhd")
+        with open(self.source, "w") as afile:
+            afile.write("entity source\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def read(self, filename):
+        """ return file content as bytes """
+        with open(filename, "rb") as afile:
+            return afile.read()
+
+    def test_write_fragments(self):
+        """ fragments give the same file as the joined string """
+        sy.write_fragments(self.target, iter(FRAGMENTS))
+        with open(self.source, "w") as afile:
+            afile.write("".join(FRAGMENTS))
+        self.assertEqual(self.read(self.target), self.read(self.source))
+        self.assertEqual(sorted(os.listdir(self.tmpdir)),
+                         ["source.vhd", "target.vhd"])
+
+    def test_write_fragments_error(self):
+        """ a failing generator leaves the previous file untouched """
+        def fragments():
+            """ fail after first fragment """
+            yield "entity broken is\n"
+            raise PodError("generation error", 0)
+        with self.assertRaises(PodError):
+            sy.write_fragments(self.source, fragments())
+        self.assertEqual(self.read(self.source), b"entity source\n")
+        self.assertEqual(os.listdir(self.tmpdir), ["source.vhd"])
+
+    def test_clone_file(self):
+        """ a clone is a distinct file, a hard link shares the source """
+        sy.clone_file(self.source, self.target)
+        self.assertNotEqual(os.stat(self.source).st_ino,
+                            os.stat(self.target).st_ino)
+        sy.clone_file(self.source, self.target, hardlink=True)
+        self.assertEqual(os.stat(self.source).st_ino,
+                         os.stat(self.target).st_ino)
+
+    def test_clone_over_link(self):
+        """ an existing link is replaced, never written through """
+        os.link(self.source, self.target)
+        other = os.path.join(self.tmpdir, "other.vhd")
+        with open(other, "w") as afile:
+            afile.write("entity other\n")
+        sy.clone_file(other, self.target)
+        with open(self.source, "r") as afile:
+            self.assertEqual(afile.read(), "entity source\n")
+
+    def test_sync_file(self):
+        """ target is written only when content differs, with source
+            mtime
+        """
+        self.assertTrue(sy.sync_file(self.source, self.target))
+        self.assertEqual(os.stat(self.source).st_mtime_ns,
+                         os.stat(self.target).st_mtime_ns)
+        self.assertFalse(sy.sync_file(self.source, self.target))
+        # same content with another mtime is left untouched
+        os.utime(self.source, (0, 0))
+        self.assertFalse(sy.sync_file(self.source, self.target))
+        with open(self.source, "w") as afile:
+            afile.write("entity modified\n")
+        self.assertTrue(sy.sync_file(self.source, self.target))
+        self.assertTrue(sy.same_file_content(self.source, self.target))
+
+    def test_rm_dir(self):
+        """ removing a missing directory raises PodError """
+        with self.assertRaises(PodError):
+            sy.rm_dir(os.path.join(self.tmpdir, "missing"))
+
+
+if __name__ == "__main__":
+    print("test_wrappersystem class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))
@@ -0,0 +1,90 @@
+#! /usr/bin/python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Author:   agent <agent@local>
+# Created:  18/10/2026
+# ----------------------------------------------------------------------------
+# Copyright (2026)  agent
+# Licence:  GPLv3 or newer
+# ----------------------------------------------------------------------------
+""" class test_wrapperxml
+"""
+
+import sys
+sys.path.append("./")
+import xmlrunner
+import unittest
+import pickle
+import shutil
+import tempfile
+
+from periphondemand.bin.utils.poderror import PodError
+from periphondemand.bin.utils.wrapperxml import WrapperXml
+from projectfixture import write_project, load_project, get_port
+
+INSTANCES = {"src": [("data", "out", 2)],
+             "dst": [("data", "in", 2)]}
+
+
+class test_wrapperxml(unittest.TestCase):
+    """ unit tests bin.utils.wrapperxml.py
+    """
+
+    def setUp(self):
+        self.projectpath = tempfile.mkdtemp()
+        self.project = load_project(write_project(self.projectpath,
+                                                  INSTANCES))
+
+    def tearDown(self):
+        shutil.rmtree(self.projectpath)
+
+    def test_slots(self):
+        """ WrapperXml and Pin have no instance dictionary """
+        pin = get_port(self.project, "src", "data").get_pin(0)
+        for node in (WrapperXml(nodename="node"), pin):
+            self.assertFalse(hasattr(node, "__dict__"))
+            with self.assertRaises(AttributeError):
+                node.unknown = 1
+
+    def test_pickle(self):
+        """ slotted pins are pickled with their tree and parents """
+        self.project.connect_pin_cmd(
+            get_port(self.project, "src", "data").get_pin(0),
+            get_port(self.project, "dst", "data").get_pin(1))
+        instance = pickle.loads(
+            pickle.dumps(self.project.get_instance("src")))
+        pin = instance.get_interface("io").get_port("data").get_pin(0)
+        self.assertEqual(pin.num, "0")
+        self.assertTrue(pin.parent.parent.parent is instance)
+        self.assertEqual(pin.connections,
+                         [{"instance_dest": "dst", "interface_dest": "io",
+                           "port_dest": "data", "pin_dest": "1"}])
+
+    def test_wrap(self):
+        """ the same element always gives the same wrapper """
+        node = WrapperXml(nodestring="<node><sub name='a' />"
+                                     "<sub name='b' /></node>")
+        subs = node.get_nodes("sub")
+        self.assertEqual([sub.name for sub in subs], ["a", "b"])
+        self.assertTrue(node.get_nodes("sub")[1] is subs[1])
+        self.assertTrue(node.get_node("sub") is subs[0])
+        self.assertTrue(subs[0]._owner is node)
+
+    def test_wrap_forget(self):
+        """ wrappers of deleted or replaced elements are dropped """
+        node = WrapperXml(nodestring="<node><sub name='a' />"
+                                     "<sub name='b' /></node>")
+        first, second = node.get_nodes("sub")
+        node.del_node("sub", "name", "a")
+        self.assertEqual(node.get_nodes("sub"), [second])
+        self.assertFalse(first.tree in node._wrappers)
+        node.create_xml("node")
+        self.assertEqual(node._wrappers, None)
+        self.assertEqual(node.get_nodes("sub"), [])
+
+
+if __name__ == "__main__":
+    print("test_wrapperxml class test\n")
+    unittest.main(
+            testRunner=xmlrunner.XMLTestRunner(
+                output='test-reports'))